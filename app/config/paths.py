@@ -23,6 +23,8 @@ DEPARTMENTS_DATA_DIR = DEPARTMENTS_DIR
 # DB 경로
 DATA_DIR = BASE_DIR / "data"
 DB_PATH = DATA_DIR / "viewo.db"
+SQL_DIR = BASE_DIR / "sql"
+SQL_SCHEMA_FILE = SQL_DIR / "schema.sql"
 
 # 시스템 설정 파일 경로
 SYSTEM_ACCOUNT_DIR = SYSTEM_DATA_DIR / "account"
@@ -40,6 +42,7 @@ SERVER_INFO_FILE = SYSTEM_INFO_DIR / "server.json"
 DASHBOARD_METADATA_FILE = DASHBOARD_MEDIA_DIR / "dashboard.json"
 PR_METADATA_FILE = PR_MEDIA_DIR / "pr.json"
 ICONS_METADATA_FILE = ICONS_DATA_DIR / "icon.json"
+BUILDINGS_MANIFEST_FILE = BUILDINGS_DATA_DIR / "manifest.json"
 
 # 정적 파일 경로
 ADMIN_HTML_PATH = STATIC_DIR / "index.html"
@@ -48,3 +48,77 @@ def load_server_config():
 # 서버 설정 로드
 SERVER_CONFIG = load_server_config()
 
+
+# 미디어 스트리밍 캐시 설정 (server.json의 "media_cache" 항목으로 덮어쓰기 가능)
+MEDIA_CACHE_CONFIG = {
+    "head_bytes": 4 * 1024 * 1024,    # 파일당 메모리에 올려둘 앞부분 크기
+    "max_bytes": 128 * 1024 * 1024,   # 전체 캐시 상한
+    "chunk_size": 256 * 1024,         # 디스크 읽기 단위
+    **SERVER_CONFIG.get("media_cache", {}),
+}
+
+# 이미지 업로드 후처리 설정 (server.json의 "media_ingest" 항목으로 덮어쓰기 가능)
+MEDIA_INGEST_CONFIG = {
+    "strip_metadata": True,          # EXIF 회전 적용 후 메타데이터 제거
+    "max_pixels": 3840 * 2160,       # 초과 시 축소 (0이면 사용 안 함)
+    "max_bytes": 0,                  # 초과 시 재압축 (0이면 사용 안 함)
+    "quality": 90,                   # 재인코딩 품질 (JPEG/WEBP)
+    "workers": 4,                    # 동시에 처리할 이미지 수
+    **SERVER_CONFIG.get("media_ingest", {}),
+}
+
+# 슬라이드 재생목록 설정 (server.json의 "playlist" 항목으로 덮어쓰기 가능)
+PLAYLIST_CONFIG = {
+    # 슬라이드 모드별 미리 받아둘 다음 항목 수
+    "prefetch_window": {"normal": 3, "low": 1},
+    "image_duration": 10,            # 이미지 기본 표시 시간 (초)
+    **SERVER_CONFIG.get("playlist", {}),
+}
+
+# prefetch 힌트 설정 (server.json의 "prefetch" 항목으로 덮어쓰기 가능)
+PREFETCH_CONFIG = {
+    "window_seconds": 60,            # 클라이언트별 다운로드 시작 지연을 분산할 구간
+    **SERVER_CONFIG.get("prefetch", {}),
+}
+
+# 전체 클라이언트 명령 분산 전송 설정 (server.json의 "fanout" 항목으로 덮어쓰기 가능)
+FANOUT_CONFIG = {
+    "batch_size": 20,                # 한 번에 전송할 클라이언트 수
+    "batch_delay_seconds": 2.0,      # 배치 간 대기 시간
+    "jitter_seconds": 1.0,           # 배치 간 대기 시간에 더할 무작위 지연 상한
+    "max_jobs": 20,                  # 상태 조회용으로 보관할 최근 작업 수
+    **SERVER_CONFIG.get("fanout", {}),
+}
+
+# SVG 최적화 설정 (server.json의 "svg_optimize" 항목으로 덮어쓰기 가능)
+SVG_OPTIMIZE_CONFIG = {
+    "enabled": True,                 # 업로드 시 SVG 최적화 여부
+    "precision": 2,                  # 좌표 소수점 자릿수
+    **SERVER_CONFIG.get("svg_optimize", {}),
+}
+
+# 층 요소 공간 인덱스 설정 (server.json의 "spatial_index" 항목으로 덮어쓰기 가능)
+SPATIAL_INDEX_CONFIG = {
+    "cell_size": 0,                  # 격자 셀 크기 (0이면 요소 수에 맞춰 자동)
+    "max_floors": 64,                # 메모리에 유지할 층 인덱스 수
+    "max_nearest": 50,               # 가까운 요소 조회 최대 개수
+    **SERVER_CONFIG.get("spatial_index", {}),
+}
+
+# 길찾기 설정 (server.json의 "wayfinding" 항목으로 덮어쓰기 가능)
+WAYFINDING_CONFIG = {
+    "elevator_cost": 30,             # 엘리베이터 이용 기본 비용 (대기 시간, 좌표 단위)
+    "elevator_cost_per_floor": 5,    # 엘리베이터 층당 비용
+    "stairs_cost_per_floor": 40,     # 계단 층당 비용
+    "attach_nodes": 3,               # 출발/도착 지점을 연결할 가까운 노드 수
+    "route_cache_size": 256,         # 보관할 경로 수
+    **SERVER_CONFIG.get("wayfinding", {}),
+}
+
+# 콘텐츠 저장소 설정 (server.json의 "content_store" 항목으로 덮어쓰기 가능)
+# 기존 JSON 파일을 옮기려면 sql/migrate_content.py를 먼저 실행
+CONTENT_STORE_CONFIG = {
+    "backend": "file",               # file: content/ 아래 JSON 파일, sqlite: data/viewo.db
+    "db_path": None,                 # SQLite 파일 경로 (None이면 data/viewo.db)
+    **SERVER_CONFIG.get("content_store", {}),
+}
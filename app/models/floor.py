@@ -8,11 +8,16 @@ class Floor(BaseModel):
     buildingId: str
     floorImage: Optional[str] = None
     imageSize: Optional[Dict[str, int]] = None
+    imagePlaceholder: Optional[str] = None
     createdAt: str
     updatedAt: str
     iconTypes: Optional[Dict[str, Any]] = None
+    iconRegistryVersion: Optional[str] = None
+    iconOverrides: Optional[Dict[str, Any]] = None
     elements: Optional[List[Dict[str, Any]]] = []
     currentLocation: Optional[Dict[str, Any]] = None
+    navigation: Optional[Dict[str, Any]] = None
+    revision: Optional[int] = None
 
 class FloorCreate(BaseModel):
     floor: int
@@ -24,6 +29,8 @@ class FloorUpdate(BaseModel):
     floorImage: Optional[str] = None
     imageSize: Optional[Dict[str, int]] = None
     iconTypes: Optional[Dict[str, Any]] = None
+    iconOverrides: Optional[Dict[str, Any]] = None
     elements: Optional[List[Dict[str, Any]]] = None
     currentLocation: Optional[Dict[str, Any]] = None
+    navigation: Optional[Dict[str, Any]] = None
 
@@ -8,6 +8,9 @@ class MediaItem(BaseModel):
     path: str
     order: int
     created_at: str
+    placeholder: Optional[str] = None
+    size: Optional[int] = None
+    bytesSaved: Optional[int] = None
 
 class MediaList(BaseModel):
     images: List[MediaItem]
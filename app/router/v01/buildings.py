@@ -1,19 +1,36 @@
 """건물 관리 라우터"""
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Body, Header, Query, Response
 from pathlib import Path
+from typing import List, Optional
+import asyncio
+import hashlib
+import json
 import shutil
 from app.services.building_service import (
     get_all_buildings, load_building_json, save_building_json,
     get_building_floors, load_building_floor_json, save_building_floor_json,
     get_building_dir,
+    fetch_all_buildings, fetch_building_detail, fetch_building_floors, fetch_building_floor,
     generate_building_id,
-    get_default_icon_types,
-    get_current_location_icon
+    get_icon_registry,
+    get_current_location_icon,
+    make_floor_change_payload,
+    get_building_revision, get_floor_revision,
+    building_lock, floors_lock,
+    delete_building_data, get_buildings_manifest,
+    add_floor_element, update_floor_element, delete_floor_element, move_floor_elements
 )
+from app.services.spatial_service import query_floor_elements, find_nearest_elements
+from app.services.wayfinding_service import find_route
 from app.utils.datetime_utils import get_timestamp, get_timestamp_filename
-from app.utils.image_utils import get_image_size
+from app.utils.image_utils import get_image_size, generate_placeholder
+from app.utils.revision_utils import ensure_revision, format_etag
+from app.utils.svg_utils import optimize_svg_file
+from app.utils.floor_codec import wants_compact, encode_floor
+from app.utils.json_utils import parse_fields
 from app.services.client_registry import client_registry
 from app.config.constants import ALLOWED_IMAGE_EXTENSIONS
+from app.config.settings import SVG_OPTIMIZE_CONFIG, SPATIAL_INDEX_CONFIG
 
 router = APIRouter(prefix="/api/v1/buildings", tags=["Buildings Management"])
 
@@ -23,7 +40,7 @@ router = APIRouter(prefix="/api/v1/buildings", tags=["Buildings Management"])
 async def get_buildings():
     """모든 건물 목록 조회"""
     try:
-        buildings = get_all_buildings()
+        buildings = await fetch_all_buildings()
         return {"code": 200, "data": buildings}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"건물 목록 조회 실패: {str(e)}")
@@ -58,24 +75,45 @@ async def create_building(building_data: dict):
         await client_registry.broadcast("building", {
             "action": "create",
             "payload": new_building
-        })
+        }, building_id=building_id)
         
         return {"code": 200, "message": "건물 생성 성공", "data": new_building}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"건물 생성 실패: {str(e)}")
 
+@router.get("/manifest")
+async def get_buildings_manifest_api():
+    """건물별 층 수, revision, 층 요약 목록 조회"""
+    try:
+        return {"code": 200, "data": get_buildings_manifest()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"건물 목록 조회 실패: {str(e)}")
+
 @router.get("/{building_id}")
-async def get_building(building_id: str):
+async def get_building(
+    building_id: str,
+    response: Response,
+    fields: Optional[str] = Query(None, description="반환할 필드 목록 (예: floor,floorName,floorImage)"),
+    format: Optional[str] = Query(None, description="compact: 요소를 열 단위 압축 표현으로 반환"),
+    resolveIcons: bool = Query(False, description="아이콘 레지스트리를 적용한 전체 iconTypes 포함 (관리자/레거시 클라이언트용)"),
+    accept: Optional[str] = Header(None)
+):
     """특정 건물 정보 조회"""
     try:
-        building = load_building_json(building_id)
+        # 해당 건물의 층 정보도 함께 반환
+        field_tree = parse_fields(fields)
+        building = await fetch_building_detail(building_id, field_tree, resolveIcons)
         if not building:
             raise HTTPException(status_code=404, detail="건물을 찾을 수 없습니다.")
         
-        # 해당 건물의 층 정보도 함께 반환
-        floors = get_building_floors(building_id)
-        building["floors"] = floors
-        
+        # fields로 revision을 제외해도 ETag는 유지 (일부 필드만 담은 응답은 구분자 추가)
+        revision = get_building_revision(building_id) if field_tree else building.get("revision")
+        variants = _etag_variants(field_tree, resolveIcons)
+        response.headers["Vary"] = "Accept"
+        if wants_compact(format, accept) and "floors" in building:
+            building = {**building, "floors": [encode_floor(f) for f in building["floors"]]}
+            variants.append("compact")
+        response.headers["ETag"] = format_etag(revision, *variants)
         return {"code": 200, "data": building}
     except HTTPException:
         raise
@@ -83,25 +121,33 @@ async def get_building(building_id: str):
         raise HTTPException(status_code=500, detail=f"건물 정보 조회 실패: {str(e)}")
 
 @router.patch("/{building_id}")
-async def update_building(building_id: str, building_data: dict):
-    """건물 정보 수정"""
+async def update_building(
+    building_id: str,
+    building_data: dict,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    """건물 정보 수정 (If-Match 또는 baseRevision이 현재 revision과 다르면 412)"""
     try:
-        existing = load_building_json(building_id)
-        if not existing:
-            raise HTTPException(status_code=404, detail="건물을 찾을 수 없습니다.")
-        
-        existing["name"] = building_data.get("name", existing["name"])
-        existing["description"] = building_data.get("description", existing.get("description", ""))
-        existing["updatedAt"] = get_timestamp()
-        
-        save_building_json(building_id, existing)
-        
-        # SSE 브로드캐스트
-        await client_registry.broadcast("building", {
-            "action": "update",
-            "payload": existing
-        })
+        async with building_lock(building_id):
+            existing = load_building_json(building_id)
+            if not existing:
+                raise HTTPException(status_code=404, detail="건물을 찾을 수 없습니다.")
+            ensure_revision(if_match, building_data.get("baseRevision"), existing.get("revision", 0))
+            
+            existing["name"] = building_data.get("name", existing["name"])
+            existing["description"] = building_data.get("description", existing.get("description", ""))
+            existing["updatedAt"] = get_timestamp()
+            
+            save_building_json(building_id, existing)
+            
+            # SSE 브로드캐스트
+            await client_registry.broadcast("building", {
+                "action": "update",
+                "payload": existing
+            }, building_id=building_id)
         
+        response.headers["ETag"] = format_etag(existing["revision"])
         return {"code": 200, "message": "건물 정보 수정 성공", "data": existing}
     except HTTPException:
         raise
@@ -109,22 +155,23 @@ async def update_building(building_id: str, building_data: dict):
         raise HTTPException(status_code=500, detail=f"건물 정보 수정 실패: {str(e)}")
 
 @router.delete("/{building_id}")
-async def delete_building(building_id: str):
-    """건물 삭제"""
+async def delete_building(building_id: str, if_match: Optional[str] = Header(None)):
+    """건물 삭제 (If-Match가 현재 revision과 다르면 412)"""
     try:
-        building_dir = get_building_dir(building_id)
-        if not building_dir.exists():
-            raise HTTPException(status_code=404, detail="건물을 찾을 수 없습니다.")
-        
-        # 건물 데이터 디렉토리 삭제 (이미지 포함)
-        shutil.rmtree(building_dir)
-        
-        # SSE 브로드캐스트
-        await client_registry.broadcast("building", {
-            "action": "delete",
-            "payload": {"buildingId": building_id}
-        })
-        
+        async with building_lock(building_id), floors_lock(building_id):
+            revision = get_building_revision(building_id)
+            if revision is not None:
+                ensure_revision(if_match, None, revision)
+            # 건물 데이터 디렉토리 삭제 (이미지 포함) 및 manifest에서 제거
+            if not delete_building_data(building_id):
+                raise HTTPException(status_code=404, detail="건물을 찾을 수 없습니다.")
+            
+            # SSE 브로드캐스트
+            await client_registry.broadcast("building", {
+                "action": "delete",
+                "payload": {"buildingId": building_id}
+            }, building_id=building_id)
+            
         return {"code": 200, "message": "건물 삭제 성공"}
     except HTTPException:
         raise
@@ -132,14 +179,24 @@ async def delete_building(building_id: str):
         raise HTTPException(status_code=500, detail=f"건물 삭제 실패: {str(e)}")
 
 @router.get("/{building_id}/floors")
-async def get_building_floors_api(building_id: str):
+async def get_building_floors_api(
+    building_id: str,
+    response: Response,
+    fields: Optional[str] = Query(None, description="반환할 필드 목록 (예: floor,floorName,floorImage)"),
+    format: Optional[str] = Query(None, description="compact: 요소를 열 단위 압축 표현으로 반환"),
+    resolveIcons: bool = Query(False, description="아이콘 레지스트리를 적용한 전체 iconTypes 포함 (관리자/레거시 클라이언트용)"),
+    accept: Optional[str] = Header(None)
+):
     """특정 건물의 모든 층 조회"""
     try:
         building = load_building_json(building_id)
         if not building:
             raise HTTPException(status_code=404, detail="건물을 찾을 수 없습니다.")
         
-        floors = get_building_floors(building_id)
+        floors = await fetch_building_floors(building_id, parse_fields(fields), resolveIcons)
+        response.headers["Vary"] = "Accept"
+        if wants_compact(format, accept):
+            floors = [encode_floor(f) for f in floors]
         return {"code": 200, "data": floors}
     except HTTPException:
         raise
@@ -147,12 +204,28 @@ async def get_building_floors_api(building_id: str):
         raise HTTPException(status_code=500, detail=f"층 목록 조회 실패: {str(e)}")
 
 @router.get("/{building_id}/floors/{floor_number}")
-async def get_building_floor(building_id: str, floor_number: int):
+async def get_building_floor(
+    building_id: str,
+    floor_number: int,
+    response: Response,
+    fields: Optional[str] = Query(None, description="반환할 필드 목록 (예: floor,floorName,floorImage)"),
+    format: Optional[str] = Query(None, description="compact: 요소를 열 단위 압축 표현으로 반환"),
+    resolveIcons: bool = Query(False, description="아이콘 레지스트리를 적용한 전체 iconTypes 포함 (관리자/레거시 클라이언트용)"),
+    accept: Optional[str] = Header(None)
+):
     """특정 건물의 특정 층 데이터 조회"""
     try:
-        floor_data = load_building_floor_json(building_id, floor_number)
-        if not floor_data:
+        field_tree = parse_fields(fields)
+        floor_data = await fetch_building_floor(building_id, floor_number, field_tree, resolveIcons)
+        if floor_data is None:
             raise HTTPException(status_code=404, detail=f"{floor_number}층 데이터를 찾을 수 없습니다.")
+        revision = get_floor_revision(building_id, floor_number) if field_tree else floor_data.get("revision")
+        variants = _etag_variants(field_tree, resolveIcons)
+        response.headers["Vary"] = "Accept"
+        if wants_compact(format, accept) and isinstance(floor_data.get("elements"), list):
+            floor_data = encode_floor(floor_data)
+            variants.append("compact")
+        response.headers["ETag"] = format_etag(revision, *variants)
         return {"code": 200, "data": floor_data}
     except HTTPException:
         raise
@@ -191,48 +264,59 @@ async def upload_building_floor_image(
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
         
-        # 이미지 크기 확인
-        width, height = get_image_size(file_path)
-        
-        # 층별 JSON 파일 업데이트
-        floor_data = load_building_floor_json(building_id, floor_number)
-        # 새로운 경로 구조에 맞게 경로 설정 (/content/ 접두사 포함)
-        image_path = f"/content/facilities/buildings/{building_id}/{new_filename}"
-        
-        if floor_data:
-            floor_data["floorImage"] = image_path
-            floor_data["imageSize"] = {"width": width, "height": height}
-            floor_data["updatedAt"] = get_timestamp()
-        else:
-            # icon.json에서 기본 아이콘 타입 로드
-            default_icon_types = get_default_icon_types()
-            current_location_icon = get_current_location_icon()
+        # SVG 청사도는 편집기 메타데이터 제거, 좌표 반올림, 그룹 정리
+        optimization = None
+        if file_ext == ".svg" and SVG_OPTIMIZE_CONFIG["enabled"]:
+            optimization = await asyncio.to_thread(optimize_svg_file, file_path, SVG_OPTIMIZE_CONFIG["precision"])
+            print(f"[Buildings] SVG 최적화: {new_filename} {optimization['originalSize']} → {optimization['size']} bytes")
+        
+        # 이미지 크기 확인, 저해상도 미리보기 생성 (이미지 디코딩이 이벤트 루프를 막지 않도록 스레드에서 실행)
+        width, height = await asyncio.to_thread(get_image_size, file_path)
+        placeholder = await asyncio.to_thread(generate_placeholder, file_path)
+        
+        async with floors_lock(building_id):
+            # 층별 JSON 파일 업데이트
+            floor_data = load_building_floor_json(building_id, floor_number)
+            # 새로운 경로 구조에 맞게 경로 설정 (/content/ 접두사 포함)
+            image_path = f"/content/facilities/buildings/{building_id}/{new_filename}"
             
-            floor_data = {
-                "floor": floor_number,
-                "floorName": f"{floor_number}층",
-                "buildingId": building_id,
-                "floorImage": image_path,
-                "imageSize": {"width": width, "height": height},
-                "createdAt": get_timestamp(),
-                "updatedAt": get_timestamp(),
-                "iconTypes": default_icon_types,
-                "elements": [],
-                "currentLocation": {
-                    "enabled": False,
-                    "x1": 0, "y1": 0, "x2": 50, "y2": 50,
-                    "icon": current_location_icon,
-                    "showLabel": True,
-                    "labelText": "현위치",
-                    "labelStyle": {
-                        "fontSize": 11, "fontFamily": "Pretendard", "fontWeight": "bold",
-                        "color": "#000000", "backgroundColor": "#FFEB3B", "borderRadius": 12
+            if floor_data:
+                floor_data["floorImage"] = image_path
+                floor_data["imageSize"] = {"width": width, "height": height}
+                floor_data["imagePlaceholder"] = placeholder
+                floor_data["updatedAt"] = get_timestamp()
+            else:
+                # 아이콘 타입은 공유 레지스트리를 참조 (층별 변경분만 저장)
+                icon_registry = get_icon_registry()
+                current_location_icon = get_current_location_icon()
+                
+                floor_data = {
+                    "floor": floor_number,
+                    "floorName": f"{floor_number}층",
+                    "buildingId": building_id,
+                    "floorImage": image_path,
+                    "imageSize": {"width": width, "height": height},
+                    "imagePlaceholder": placeholder,
+                    "createdAt": get_timestamp(),
+                    "updatedAt": get_timestamp(),
+                    "iconRegistryVersion": icon_registry["version"],
+                    "iconOverrides": {},
+                    "elements": [],
+                    "currentLocation": {
+                        "enabled": False,
+                        "x1": 0, "y1": 0, "x2": 50, "y2": 50,
+                        "icon": current_location_icon,
+                        "showLabel": True,
+                        "labelText": "현위치",
+                        "labelStyle": {
+                            "fontSize": 11, "fontFamily": "Pretendard", "fontWeight": "bold",
+                            "color": "#000000", "backgroundColor": "#FFEB3B", "borderRadius": 12
+                        }
                     }
                 }
-            }
-        
-        save_building_floor_json(building_id, floor_number, floor_data)
-        
+            
+            save_building_floor_json(building_id, floor_number, floor_data)
+            
         # SSE 브로드캐스트
         await client_registry.broadcast("floor_image", {
             "action": "update",
@@ -240,9 +324,13 @@ async def upload_building_floor_image(
                 "buildingId": building_id,
                 "floorNumber": floor_number,
                 "imagePath": image_path,
-                "imageSize": {"width": width, "height": height}
+                "imageSize": {"width": width, "height": height},
+                "imagePlaceholder": placeholder
             }
-        })
+        }, building_id=building_id)
+        await client_registry.broadcast_prefetch([
+            {"url": image_path, "size": file_path.stat().st_size}
+        ], event_type="floor_image", building_id=building_id)
         
         return {
             "code": 200,
@@ -250,7 +338,9 @@ async def upload_building_floor_image(
             "data": {
                 "filename": new_filename,
                 "path": image_path,
-                "imageSize": {"width": width, "height": height}
+                "imageSize": {"width": width, "height": height},
+                "imagePlaceholder": placeholder,
+                "optimization": optimization
             }
         }
     except HTTPException:
@@ -259,83 +349,273 @@ async def upload_building_floor_image(
         raise HTTPException(status_code=500, detail=f"이미지 업로드 실패: {str(e)}")
 
 @router.patch("/{building_id}/floors/{floor_number}")
-async def update_building_floor(building_id: str, floor_number: int, floor_data: dict):
-    """특정 건물의 청사도 데이터 저장"""
+async def update_building_floor(
+    building_id: str,
+    floor_number: int,
+    floor_data: dict,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    """특정 건물의 청사도 데이터 저장 (If-Match 또는 baseRevision이 현재 revision과 다르면 412)"""
     try:
-        # 건물 존재 확인
-        building = load_building_json(building_id)
-        if not building:
+        # 건물 존재 확인 (revision 캐시를 사용하여 파일을 다시 읽지 않음)
+        if get_building_revision(building_id) is None:
             raise HTTPException(status_code=404, detail="건물을 찾을 수 없습니다.")
-        
-        # currentLocation 아이콘을 elements에서 제거
-        if "elements" in floor_data:
-            floor_data["elements"] = [
-                e for e in floor_data["elements"]
-                if e.get("type") != "icon" or e.get("iconType") != "currentLocation"
-            ]
-        
-        floor_data["updatedAt"] = get_timestamp()
-        floor_data["floor"] = floor_number
-        floor_data["buildingId"] = building_id
-        
-        # currentLocation 기본값 설정
-        current_location_icon = get_current_location_icon()
-        if "currentLocation" not in floor_data:
-            floor_data["currentLocation"] = {
-                "enabled": False,
-                "x1": 0, "y1": 0, "x2": 50, "y2": 50,
-                "icon": current_location_icon,
-                "showLabel": True,
-                "labelText": "현위치",
-                "labelStyle": {
-                    "fontSize": 11, "fontFamily": "Pretendard", "fontWeight": "bold",
-                    "color": "#000000", "backgroundColor": "#FFEB3B", "borderRadius": 12
+        async with floors_lock(building_id):
+            ensure_revision(if_match, floor_data.pop("baseRevision", None), get_floor_revision(building_id, floor_number))
+            
+            # currentLocation 아이콘을 elements에서 제거
+            if "elements" in floor_data:
+                floor_data["elements"] = [
+                    e for e in floor_data["elements"]
+                    if e.get("type") != "icon" or e.get("iconType") != "currentLocation"
+                ]
+            
+            floor_data["updatedAt"] = get_timestamp()
+            floor_data["floor"] = floor_number
+            floor_data["buildingId"] = building_id
+            
+            # currentLocation 기본값 설정
+            current_location_icon = get_current_location_icon()
+            if "currentLocation" not in floor_data:
+                floor_data["currentLocation"] = {
+                    "enabled": False,
+                    "x1": 0, "y1": 0, "x2": 50, "y2": 50,
+                    "icon": current_location_icon,
+                    "showLabel": True,
+                    "labelText": "현위치",
+                    "labelStyle": {
+                        "fontSize": 11, "fontFamily": "Pretendard", "fontWeight": "bold",
+                        "color": "#000000", "backgroundColor": "#FFEB3B", "borderRadius": 12
+                    }
                 }
-            }
-        elif "icon" not in floor_data["currentLocation"] or not floor_data["currentLocation"]["icon"]:
-            floor_data["currentLocation"]["icon"] = current_location_icon
-        
-        save_building_floor_json(building_id, floor_number, floor_data)
-        
-        # SSE 브로드캐스트
+            elif "icon" not in floor_data["currentLocation"] or not floor_data["currentLocation"]["icon"]:
+                floor_data["currentLocation"]["icon"] = current_location_icon
+            
+            previous = save_building_floor_json(building_id, floor_number, floor_data)
+            
+            # SSE 브로드캐스트 (변경분만 JSON Patch로 전송, 패치가 더 크면 전체 전송)
+            action, payload = make_floor_change_payload(building_id, floor_number, previous, floor_data)
+            await client_registry.broadcast("floor", {
+                "action": action,
+                "payload": payload
+            }, building_id=building_id)
+            
+        response.headers["ETag"] = format_etag(floor_data["revision"])
+        return {"code": 200, "message": "청사도 데이터 저장 성공", "data": floor_data}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 저장 실패: {str(e)}")
+
+async def _apply_element_change(building_id: str, floor_number: int, if_match: Optional[str], response: Response, operation, *args):
+    """요소 단위 수정 실행 후 변경분만 브로드캐스트"""
+    async with floors_lock(building_id):
+        ensure_revision(if_match, None, get_floor_revision(building_id, floor_number))
+        try:
+            floor, base_revision, patch = operation(building_id, floor_number, *args, updated_at=get_timestamp())
+        except LookupError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # SSE 브로드캐스트 (변경된 요소만 JSON Patch로 전송)
         await client_registry.broadcast("floor", {
-            "action": "update",
+            "action": "patch",
             "payload": {
                 "buildingId": building_id,
                 "floorNumber": floor_number,
-                "data": floor_data
+                "baseRevision": base_revision,
+                "revision": floor["revision"],
+                "patch": patch
             }
-        })
-        
-        return {"code": 200, "message": "청사도 데이터 저장 성공", "data": floor_data}
+        }, building_id=building_id)
+    response.headers["ETag"] = format_etag(floor["revision"])
+    return floor, patch
+
+def _etag_variants(field_tree: Optional[dict], resolve_icons: bool = False) -> List[str]:
+    """전체 문서와 표현이 다른 응답의 ETag 구분자
+
+    fields로 일부만 담은 응답은 필드 트리 해시, iconTypes를 채운 응답은 아이콘 레지스트리 버전을 붙입니다.
+    """
+    variants = []
+    if field_tree:
+        digest = hashlib.sha256(json.dumps(field_tree, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+        variants.append(f"fields{digest}")
+    if resolve_icons:
+        variants.append(f"icons{get_icon_registry()['version']}")
+    return variants
+
+def _parse_bbox(bbox: str):
+    """"x1,y1,x2,y2" 형식의 영역 파싱"""
+    try:
+        x1, y1, x2, y2 = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"bbox 형식이 올바르지 않습니다 (x1,y1,x2,y2): {bbox}")
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+@router.get("/{building_id}/floors/{floor_number}/elements")
+async def get_building_floor_elements(
+    building_id: str,
+    floor_number: int,
+    response: Response,
+    bbox: Optional[str] = Query(None, description="조회 영역 x1,y1,x2,y2 (없으면 전체)"),
+    type: Optional[str] = Query(None, description="요소 타입 (text, icon 등)")
+):
+    """영역과 겹치는 청사도 요소 조회 (공간 인덱스 사용)"""
+    area = _parse_bbox(bbox) if bbox else None
+    try:
+        result = await asyncio.to_thread(query_floor_elements, building_id, floor_number, area, type)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"요소 조회 실패: {str(e)}")
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"{floor_number}층 데이터를 찾을 수 없습니다.")
+    response.headers["ETag"] = format_etag(result["revision"])
+    return {"code": 200, "data": {**result, "count": len(result["elements"])}}
+
+@router.get("/{building_id}/floors/{floor_number}/elements/nearest")
+async def get_nearest_floor_elements(
+    building_id: str,
+    floor_number: int,
+    response: Response,
+    x: float = Query(..., description="기준 x 좌표"),
+    y: float = Query(..., description="기준 y 좌표"),
+    limit: int = Query(1, ge=1, description="조회 개수"),
+    maxDistance: Optional[float] = Query(None, ge=0, description="최대 거리"),
+    type: Optional[str] = Query(None, description="요소 타입 (text, icon 등)")
+):
+    """기준 좌표에서 가까운 청사도 요소 조회 (hit-test용)"""
+    limit = min(limit, SPATIAL_INDEX_CONFIG["max_nearest"])
+    try:
+        result = await asyncio.to_thread(find_nearest_elements, building_id, floor_number, x, y, limit, maxDistance, type)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"요소 조회 실패: {str(e)}")
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"{floor_number}층 데이터를 찾을 수 없습니다.")
+    response.headers["ETag"] = format_etag(result["revision"])
+    return {"code": 200, "data": result}
+
+@router.get("/{building_id}/route")
+async def get_building_route(
+    building_id: str,
+    fromFloor: int = Query(..., description="출발 층"),
+    fromX: Optional[float] = Query(None, description="출발 x 좌표 (없으면 현위치)"),
+    fromY: Optional[float] = Query(None, description="출발 y 좌표 (없으면 현위치)"),
+    toElement: Optional[str] = Query(None, description="목적지 요소 ID"),
+    toFloor: Optional[int] = Query(None, description="목적지 층"),
+    department: Optional[str] = Query(None, description="목적지 부서 이름"),
+    accessible: bool = Query(False, description="계단 제외 (엘리베이터만 사용)")
+):
+    """현위치에서 요소/부서까지의 길찾기 경로 조회 (층 이동 포함)"""
+    try:
+        route = await asyncio.to_thread(
+            find_route, building_id, fromFloor, fromX, fromY, toElement, toFloor, department, accessible
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"경로 조회 실패: {str(e)}")
+    return {"code": 200, "data": route}
+
+@router.post("/{building_id}/floors/{floor_number}/elements")
+async def add_building_floor_element(
+    building_id: str,
+    floor_number: int,
+    element: dict,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    """청사도 요소 추가"""
+    try:
+        floor, patch = await _apply_element_change(building_id, floor_number, if_match, response, add_floor_element, element)
+        return {"code": 200, "message": "요소 추가 성공", "data": {"element": patch[0]["value"], "revision": floor["revision"]}}
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"데이터 저장 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"요소 추가 실패: {str(e)}")
+
+@router.post("/{building_id}/floors/{floor_number}/elements/move")
+async def move_building_floor_elements(
+    building_id: str,
+    floor_number: int,
+    response: Response,
+    ids: List[str] = Body(..., embed=True),
+    dx: float = Body(0, embed=True),
+    dy: float = Body(0, embed=True),
+    if_match: Optional[str] = Header(None)
+):
+    """선택한 청사도 요소 일괄 이동"""
+    try:
+        floor, patch = await _apply_element_change(building_id, floor_number, if_match, response, move_floor_elements, ids, dx, dy)
+        return {"code": 200, "message": f"요소 {len(ids)}개 이동 성공", "data": {"patch": patch, "revision": floor["revision"]}}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"요소 이동 실패: {str(e)}")
+
+@router.patch("/{building_id}/floors/{floor_number}/elements/{element_id}")
+async def update_building_floor_element(
+    building_id: str,
+    floor_number: int,
+    element_id: str,
+    changes: dict,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    """청사도 요소 수정 (전달한 필드만 변경)"""
+    try:
+        floor, patch = await _apply_element_change(building_id, floor_number, if_match, response, update_floor_element, element_id, changes)
+        element = next(e for e in floor["elements"] if e.get("id") == element_id)
+        return {"code": 200, "message": "요소 수정 성공", "data": {"element": element, "revision": floor["revision"]}}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"요소 수정 실패: {str(e)}")
+
+@router.delete("/{building_id}/floors/{floor_number}/elements/{element_id}")
+async def delete_building_floor_element(
+    building_id: str,
+    floor_number: int,
+    element_id: str,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    """청사도 요소 삭제"""
+    try:
+        floor, patch = await _apply_element_change(building_id, floor_number, if_match, response, delete_floor_element, element_id)
+        return {"code": 200, "message": "요소 삭제 성공", "data": {"revision": floor["revision"]}}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"요소 삭제 실패: {str(e)}")
 
 @router.delete("/{building_id}/floors/{floor_number}")
-async def delete_building_floor(building_id: str, floor_number: int):
+async def delete_building_floor(building_id: str, floor_number: int, if_match: Optional[str] = Header(None)):
     """특정 건물의 특정 층 삭제"""
     try:
-        floor_data = load_building_floor_json(building_id, floor_number)
-        if not floor_data:
-            raise HTTPException(status_code=404, detail=f"{floor_number}층을 찾을 수 없습니다.")
-        
-        # floors.json에서 해당 층 제거
-        from app.services.building_service import load_building_floors_json, save_building_floors_json
-        floors = load_building_floors_json(building_id)
-        floors = [floor for floor in floors if floor.get("floor") != floor_number]
-        save_building_floors_json(building_id, floors)
-        
-        # SSE 브로드캐스트
-        await client_registry.broadcast("floor", {
-            "action": "delete",
-            "payload": {
-                "buildingId": building_id,
-                "floorNumber": floor_number
-            }
-        })
-        
+        async with floors_lock(building_id):
+            floor_data = load_building_floor_json(building_id, floor_number)
+            if not floor_data:
+                raise HTTPException(status_code=404, detail=f"{floor_number}층을 찾을 수 없습니다.")
+            ensure_revision(if_match, None, floor_data.get("revision", 0))
+            
+            # floors.json에서 해당 층 제거
+            from app.services.building_service import load_building_floors_json, save_building_floors_json
+            floors = load_building_floors_json(building_id)
+            floors = [floor for floor in floors if floor.get("floor") != floor_number]
+            save_building_floors_json(building_id, floors)
+            
+            # SSE 브로드캐스트
+            await client_registry.broadcast("floor", {
+                "action": "delete",
+                "payload": {
+                    "buildingId": building_id,
+                    "floorNumber": floor_number
+                }
+            }, building_id=building_id)
+            
         return {"code": 200, "message": f"{floor_number}층 삭제 성공"}
     except HTTPException:
         raise
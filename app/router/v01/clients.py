@@ -1,5 +1,6 @@
 """클라이언트 관리 라우터"""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
 from app.models.client import AliasRequest, CommandRequest
 from app.services.client_registry import client_registry
 from app.utils.datetime_utils import get_timestamp
@@ -59,20 +60,25 @@ async def reset_client_indexeddb(client_id: str):
     return {"code": 200, "message": "IndexedDB 초기화 명령이 전송되었습니다."}
 
 @router.post("/reset-all-indexeddb")
-async def reset_all_indexeddb():
-    """모든 클라이언트의 IndexedDB 초기화 명령"""
-    await client_registry.broadcast("command", {
+async def reset_all_indexeddb(
+    batchSize: Optional[int] = Query(None, ge=1, description="배치당 클라이언트 수"),
+    delay: Optional[float] = Query(None, ge=0, description="배치 간 대기 시간(초)"),
+    jitter: Optional[float] = Query(None, ge=0, description="배치 간 무작위 추가 지연 상한(초)")
+):
+    """모든 클라이언트의 IndexedDB 초기화 명령 (배치 단위 분산 전송)"""
+    job = client_registry.broadcast_staggered("command", {
         "command": "reset_indexeddb",
         "targetClientId": "all",
         "params": {
             "reason": "관리자 전체 초기화 요청",
             "timestamp": get_timestamp()  # field 포맷 사용
         }
-    })
+    }, batch_size=batchSize, batch_delay=delay, jitter=jitter)
     
     return {
         "code": 200, 
-        "message": f"모든 클라이언트({client_registry.get_client_count()}대)에 초기화 명령이 전송되었습니다."
+        "message": f"모든 클라이언트({job['total']}대)에 초기화 명령 전송을 시작했습니다.",
+        "data": job
     }
 
 @router.post("/{client_id}/force-sync")
@@ -93,17 +99,21 @@ async def force_client_sync(client_id: str):
     return {"code": 200, "message": "강제 동기화 명령이 전송되었습니다."}
 
 @router.post("/broadcast-sync")
-async def broadcast_force_sync():
-    """모든 클라이언트 강제 동기화"""
-    await client_registry.broadcast("command", {
+async def broadcast_force_sync(
+    batchSize: Optional[int] = Query(None, ge=1, description="배치당 클라이언트 수"),
+    delay: Optional[float] = Query(None, ge=0, description="배치 간 대기 시간(초)"),
+    jitter: Optional[float] = Query(None, ge=0, description="배치 간 무작위 추가 지연 상한(초)")
+):
+    """모든 클라이언트 강제 동기화 (배치 단위 분산 전송)"""
+    job = client_registry.broadcast_staggered("command", {
         "command": "force_sync",
         "targetClientId": "all",
         "params": {
             "timestamp": get_timestamp()  # field 포맷 사용
         }
-    })
+    }, batch_size=batchSize, batch_delay=delay, jitter=jitter)
     
-    return {"code": 200, "message": "모든 클라이언트에 동기화 명령이 전송되었습니다."}
+    return {"code": 200, "message": "모든 클라이언트에 동기화 명령 전송을 시작했습니다.", "data": job}
 
 @router.post("/{client_id}/command")
 async def send_client_command(client_id: str, command_data: CommandRequest):
@@ -1,7 +1,8 @@
 """데이터 API 라우터"""
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
+import asyncio
 from app.utils.json_utils import load_json_file
-from app.services.building_service import get_all_buildings, get_building_floors
+from app.services.floor_info_service import get_floor_info_view
 
 router = APIRouter(prefix="/data", tags=["Data"])
 
@@ -12,20 +13,13 @@ async def get_dummy_table():
     return {"code": 200, "data": {}}
 
 @router.get("/floor-info")
-async def get_floor_info():
-    """모든 건물의 층 정보 반환 (하위 호환성)"""
-    # 모든 건물의 층 데이터 수집
-    all_floors = []
-    buildings = get_all_buildings()
-    
-    for building in buildings:
-        building_id = building.get("id")
-        if building_id:
-            floors = get_building_floors(building_id)
-            all_floors.extend(floors)
-    
-    # 층 번호로 정렬
-    all_floors.sort(key=lambda x: x.get("floor", 0))
-    
-    return {"code": 200, "data": all_floors}
-
+async def get_floor_info(
+    request: Request,
+    resolveIcons: bool = Query(False, description="아이콘 레지스트리를 적용한 전체 iconTypes 포함 (레거시 클라이언트용)")
+):
+    """모든 건물의 층 정보 반환 (하위 호환성, 미리 직렬화된 응답 + ETag)"""
+    body, etag = await asyncio.to_thread(get_floor_info_view, resolveIcons)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
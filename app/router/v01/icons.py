@@ -1,6 +1,63 @@
 """아이콘 관리 라우터"""
 # TODO: 기존 main.py의 icons_router 코드를 여기로 이동
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, RedirectResponse
+import hashlib
+import json
+from app.services.icon_service import get_icon_registry, get_icon_sprite
+from app.services.building_service import get_all_buildings, migrate_floor_icon_types, floors_lock
 
 router = APIRouter(prefix="/api/v1/icons", tags=["Icons"])
 
+@router.get("/registry")
+async def get_icon_registry_api(request: Request):
+    """공유 아이콘 레지스트리 조회 (ETag 지원, 키오스크는 버전이 바뀔 때만 다시 받음)"""
+    sprite = get_icon_sprite()
+    registry = {
+        **get_icon_registry(),
+        "sprite": {"url": sprite["url"], "symbolPrefix": sprite["symbolPrefix"]},
+    }
+    body = json.dumps({"code": 200, "data": registry}, ensure_ascii=False).encode("utf-8")
+    etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get("/sprite.svg")
+async def get_icon_sprite_latest(request: Request):
+    """최신 아이콘 스프라이트 조회 (ETag로 재검증)"""
+    sprite = get_icon_sprite()
+    etag = f'"{sprite["fingerprint"]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=sprite["body"], media_type="image/svg+xml", headers=headers)
+
+@router.get("/sprite/{fingerprint}.svg")
+async def get_icon_sprite_fingerprinted(fingerprint: str):
+    """fingerprint가 붙은 아이콘 스프라이트 조회 (내용이 바뀌면 URL이 바뀌므로 영구 캐시)"""
+    sprite = get_icon_sprite()
+    if fingerprint != sprite["fingerprint"]:
+        # 이전 버전 URL은 최신 스프라이트로 안내
+        return RedirectResponse(sprite["url"], status_code=307)
+    headers = {
+        "ETag": f'"{sprite["fingerprint"]}"',
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+    return Response(content=sprite["body"], media_type="image/svg+xml", headers=headers)
+
+@router.post("/migrate-floors")
+async def migrate_floor_icons():
+    """모든 층의 iconTypes 복사본을 레지스트리 참조로 변환"""
+    try:
+        result = {"buildings": 0, "floors": 0, "migrated": 0, "bytesSaved": 0}
+        for building in get_all_buildings():
+            async with floors_lock(building["id"]):
+                stats = migrate_floor_icon_types(building["id"])
+            result["buildings"] += 1
+            for key, value in stats.items():
+                result[key] += value
+        return {"code": 200, "message": f"층 {result['migrated']}개 아이콘 정보 변환 완료", "data": result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"아이콘 정보 변환 실패: {str(e)}")
@@ -1,36 +1,75 @@
 """콘텐츠 이미지 관리 라우터 (대시보드 및 홍보 이미지 통합)"""
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Body
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Body, Query, Request, Header
+from fastapi.responses import Response
 from pathlib import Path
+import asyncio
 import os
 import shutil
-from typing import Literal
-from app.config.paths import DASHBOARD_MEDIA_DIR, PR_MEDIA_DIR, DASHBOARD_METADATA_FILE, PR_METADATA_FILE
-from app.utils.json_utils import load_json_file, save_json_file
+import uuid
+from typing import Literal, List, Optional
+from app.config.paths import DASHBOARD_MEDIA_DIR, PR_MEDIA_DIR
 from app.utils.datetime_utils import get_timestamp, get_timestamp_filename
+from app.utils.image_utils import generate_placeholder, normalize_image
+from app.utils.svg_utils import optimize_svg_file
+from app.utils.revision_utils import ensure_revision, format_etag
 from app.services.client_registry import client_registry
-from app.config.constants import ALLOWED_IMAGE_EXTENSIONS
+from app.services.media_cache import media_cache
+from app.services.media_service import (
+    load_media_config, edit_media_config, save_media_config, find_media_position,
+    allocate_media_id, get_media_revision, media_lock
+)
+from app.services.playlist_service import get_playlist
+from app.config.constants import ALLOWED_IMAGE_EXTENSIONS, SLIDE_MODE_NORMAL, SLIDE_MODE_LOW
+from app.config.settings import MEDIA_INGEST_CONFIG, SVG_OPTIMIZE_CONFIG
 
 router = APIRouter(prefix="/api/v1/media", tags=["Media"])
 
 ImageType = Literal["dashboard", "pr"]
 
+# 이미지 후처리 작업 동시 실행 수 제한 (워커 풀)
+_ingest_semaphore = asyncio.Semaphore(MEDIA_INGEST_CONFIG["workers"])
+
 def get_image_config(image_type: ImageType):
-    """이미지 설정 파일 로드"""
-    config_file = DASHBOARD_METADATA_FILE if image_type == "dashboard" else PR_METADATA_FILE
-    config = load_json_file(config_file)
-    return config if config else {"images": []}
+    """이미지 설정 로드 (media_service 캐시와 공유되므로 수정하지 않음)"""
+    return load_media_config(image_type)
+
+def edit_image_config(image_type: ImageType):
+    """수정용 이미지 설정 사본 (save_image_config에 성공해야 캐시에 반영)"""
+    return edit_media_config(image_type)
 
 def save_image_config(image_type: ImageType, data: dict):
-    """이미지 설정 파일 저장"""
-    config_file = DASHBOARD_METADATA_FILE if image_type == "dashboard" else PR_METADATA_FILE
-    save_json_file(config_file, data)
+    """이미지 설정 저장"""
+    save_media_config(image_type, data)
 
 def get_images_dir(image_type: ImageType) -> Path:
     """이미지 디렉토리 경로 반환"""
     return DASHBOARD_MEDIA_DIR if image_type == "dashboard" else PR_MEDIA_DIR
 
+def process_uploaded_image(file_path: Path) -> dict:
+    """업로드된 이미지 후처리 (EXIF 회전/메타데이터 제거, 재압축, SVG 최적화, 미리보기 생성)"""
+    if file_path.suffix.lower() == ".svg" and SVG_OPTIMIZE_CONFIG["enabled"]:
+        ingest = optimize_svg_file(file_path, SVG_OPTIMIZE_CONFIG["precision"])
+    else:
+        ingest = normalize_image(
+            file_path,
+            strip_metadata=MEDIA_INGEST_CONFIG["strip_metadata"],
+            max_pixels=MEDIA_INGEST_CONFIG["max_pixels"],
+            max_bytes=MEDIA_INGEST_CONFIG["max_bytes"],
+            quality=MEDIA_INGEST_CONFIG["quality"],
+        )
+    return {
+        "size": ingest["size"],
+        "bytesSaved": ingest["bytesSaved"],
+        "placeholder": generate_placeholder(file_path),
+    }
+
+async def run_ingest(file_path: Path) -> dict:
+    """워커 풀에서 이미지 후처리 실행"""
+    async with _ingest_semaphore:
+        return await asyncio.to_thread(process_uploaded_image, file_path)
+
 def scan_images(image_type: ImageType):
-    """이미지 폴더를 스캔하여 설정 파일 동기화"""
+    """이미지 폴더를 스캔하여 설정 파일 동기화 (바뀐 것이 없으면 캐시된 설정 반환)"""
     config = get_image_config(image_type)
     existing_files = {img["filename"] for img in config.get("images", [])}
     
@@ -41,6 +80,17 @@ def scan_images(image_type: ImageType):
     if not images_dir.exists():
         images_dir.mkdir(parents=True, exist_ok=True)
     
+    actual_files = {f.name for f in images_dir.iterdir() if f.is_file()}
+    new_files = any(
+        Path(name).suffix.lower() in ALLOWED_IMAGE_EXTENSIONS and name not in existing_files
+        for name in actual_files
+    )
+    if not new_files and existing_files <= actual_files and all("name" in img for img in config.get("images", [])):
+        return config
+
+    config = edit_image_config(image_type)
+    changed = False
+    
     # 폴더에서 이미지 파일 스캔
     if images_dir.exists():
         for file_path in sorted(images_dir.iterdir()):
@@ -49,39 +99,54 @@ def scan_images(image_type: ImageType):
                     # 새 이미지 발견
                     default_name = get_timestamp()  # 기본 이름: 날짜+시간
                     new_image = {
-                        "id": len(config.get("images", [])) + 1,
+                        "id": allocate_media_id(config),
                         "filename": file_path.name,
                         "path": f"{image_path_prefix}/{file_path.name}",
                         "name": default_name,
                         "order": len(config.get("images", [])) + 1,
                         "created_at": get_timestamp()
                     }
-                    if "images" not in config:
-                        config["images"] = []
                     config["images"].append(new_image)
+                    changed = True
         
         # 삭제된 파일 제거
-        actual_files = {f.name for f in images_dir.iterdir() if f.is_file()}
-        config["images"] = [img for img in config.get("images", []) if img["filename"] in actual_files]
+        remaining = [img for img in config.get("images", []) if img["filename"] in actual_files]
+        if len(remaining) != len(config["images"]):
+            config["images"] = remaining
+            changed = True
     
     # 기존 이미지에 name 필드가 없으면 추가
     for img in config.get("images", []):
         if "name" not in img:
             img["name"] = img.get("created_at", get_timestamp())
+            changed = True
     
-    # ID 재정렬
-    for i, img in enumerate(config["images"], 1):
-        img["id"] = i
-    
-    save_image_config(image_type, config)
+    # ID는 고정이므로 재정렬하지 않음 (순서는 order 필드로만 관리)
+    if changed:
+        save_image_config(image_type, config)
     return config
 
 @router.get("/{image_type}")
-async def get_images(image_type: ImageType):
+async def get_images(image_type: ImageType, response: Response):
     """이미지 목록 조회"""
-    config = scan_images(image_type)
+    async with media_lock(image_type):
+        config = scan_images(image_type)
+    response.headers["ETag"] = format_etag(config.get("revision"))
     return {"code": 200, "data": config}
 
+@router.get("/{image_type}/playlist")
+async def get_image_playlist(
+    image_type: ImageType,
+    request: Request,
+    mode: Literal["normal", "low"] = Query(SLIDE_MODE_NORMAL, description=f"슬라이드 모드 ({SLIDE_MODE_NORMAL}/{SLIDE_MODE_LOW})")
+):
+    """정렬된 재생목록 및 prefetch 정보 조회 (ETag 지원)"""
+    playlist = await asyncio.to_thread(get_playlist, image_type, mode)
+    headers = {"ETag": playlist["etag"], "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == playlist["etag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=playlist["body"], media_type="application/json", headers=headers)
+
 @router.post("/{image_type}/upload")
 async def upload_image(
     image_type: ImageType,
@@ -104,20 +169,25 @@ async def upload_image(
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
 
-        config = get_image_config(image_type)
-        image_path_prefix = f"/content/media/dashboard" if image_type == "dashboard" else "/content/media/pr"
-        default_name = get_timestamp()  # 기본 이름: 날짜+시간
-        new_image = {
-            "id": len(config["images"]) + 1,
-            "filename": new_filename,
-            "path": f"{image_path_prefix}/{new_filename}",
-            "name": default_name,
-            "order": order if order > 0 else len(config["images"]) + 1,
-            "created_at": get_timestamp()
-        }
+        # 이미지 후처리 (이벤트 루프를 막지 않도록 워커 풀에서 실행)
+        processed = await run_ingest(file_path)
 
-        config["images"].append(new_image)
-        save_image_config(image_type, config)
+        async with media_lock(image_type):
+            config = edit_image_config(image_type)
+            image_path_prefix = f"/content/media/dashboard" if image_type == "dashboard" else "/content/media/pr"
+            default_name = get_timestamp()  # 기본 이름: 날짜+시간
+            new_image = {
+                "id": allocate_media_id(config),
+                "filename": new_filename,
+                "path": f"{image_path_prefix}/{new_filename}",
+                "name": default_name,
+                "order": order if order > 0 else len(config["images"]) + 1,
+                "created_at": get_timestamp(),
+                **processed
+            }
+
+            config["images"].append(new_image)
+            save_image_config(image_type, config)
 
         # SSE 브로드캐스트
         event_type = "dashboard_image" if image_type == "dashboard" else "pr_image"
@@ -125,6 +195,9 @@ async def upload_image(
             "action": "create",
             "payload": new_image
         })
+        await client_registry.broadcast_prefetch([
+            {"url": new_image["path"], "size": new_image["size"]}
+        ], event_type=event_type)
 
         return {"code": 200, "message": "이미지 업로드 성공", "data": new_image}
 
@@ -133,33 +206,123 @@ async def upload_image(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"이미지 업로드 실패: {str(e)}")
 
+@router.post("/{image_type}/upload-batch")
+async def upload_images_batch(
+    image_type: ImageType,
+    files: List[UploadFile] = File(...),
+    order: int = Form(default=0)
+):
+    """이미지 일괄 업로드 (병렬 후처리, 메타데이터 1회 저장, 브로드캐스트 1회)"""
+    try:
+        for file in files:
+            if Path(file.filename).suffix.lower() not in ALLOWED_IMAGE_EXTENSIONS:
+                raise HTTPException(status_code=400, detail=f"지원하지 않는 이미지 형식입니다: {file.filename}")
+
+        timestamp = get_timestamp_filename()
+        prefix = "dashboard" if image_type == "dashboard" else "pr"
+        images_dir = get_images_dir(image_type)
+
+        saved_paths = []
+        try:
+            # 1. 파일 저장 (같은 초의 다른 일괄 업로드와 겹치지 않도록 고유 접미사 사용)
+            for index, file in enumerate(files, 1):
+                file_ext = Path(file.filename).suffix.lower()
+                file_path = images_dir / f"{prefix}_{timestamp}_{index:03d}_{uuid.uuid4().hex[:8]}{file_ext}"
+                saved_paths.append(file_path)
+                with open(file_path, "wb") as buffer:
+                    shutil.copyfileobj(file.file, buffer)
+
+            # 2. 후처리를 워커 풀에서 병렬 실행 (실패가 있어도 모든 작업이 끝난 뒤 파일 정리)
+            results = await asyncio.gather(*(run_ingest(path) for path in saved_paths), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            async with media_lock(image_type):
+                # 3. 메타데이터 1회 저장 (사본을 수정하므로 저장에 실패하면 캐시에 남지 않음)
+                config = edit_image_config(image_type)
+                image_path_prefix = f"/content/media/dashboard" if image_type == "dashboard" else "/content/media/pr"
+                start_order = order if order > 0 else len(config["images"]) + 1
+                # 지정한 순서 이후의 기존 이미지는 추가한 개수만큼 뒤로 밀기
+                shifted = False
+                for img in config["images"]:
+                    if img.get("order", 0) >= start_order:
+                        img["order"] += len(saved_paths)
+                        shifted = True
+                new_images = []
+                for offset, (file_path, processed) in enumerate(zip(saved_paths, results)):
+                    new_image = {
+                        "id": allocate_media_id(config),
+                        "filename": file_path.name,
+                        "path": f"{image_path_prefix}/{file_path.name}",
+                        "name": get_timestamp(),
+                        "order": start_order + offset,
+                        "created_at": get_timestamp(),
+                        **processed
+                    }
+                    config["images"].append(new_image)
+                    new_images.append(new_image)
+                order_ids = [img["id"] for img in sorted(config["images"], key=lambda img: img.get("order", 0))]
+                save_image_config(image_type, config)
+        except BaseException:
+            # 메타데이터에 반영되지 않은 파일 정리
+            for file_path in saved_paths:
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+            raise
+
+        # 4. SSE 브로드캐스트 (일괄 1회)
+        event_type = "dashboard_image" if image_type == "dashboard" else "pr_image"
+        payload = {"items": new_images}
+        if shifted:
+            # 기존 이미지의 순서도 바뀌었으면 새 순서 전체를 함께 전송
+            payload["order"] = order_ids
+        await client_registry.broadcast(event_type, {
+            "action": "batch_create",
+            "payload": payload
+        })
+        await client_registry.broadcast_prefetch([
+            {"url": img["path"], "size": img["size"]} for img in new_images
+        ], event_type=event_type)
+
+        return {
+            "code": 200,
+            "message": f"이미지 {len(new_images)}개 업로드 성공",
+            "data": {
+                "items": new_images,
+                "bytesSaved": sum(img["bytesSaved"] for img in new_images)
+            }
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"이미지 일괄 업로드 실패: {str(e)}")
+
 @router.delete("/{image_type}/{image_id}")
-async def delete_image(image_type: ImageType, image_id: int):
+async def delete_image(image_type: ImageType, image_id: int, if_match: Optional[str] = Header(None)):
     """이미지 삭제"""
     try:
-        config = get_image_config(image_type)
-
-        image_to_delete = None
-        for img in config["images"]:
-            if img["id"] == image_id:
-                image_to_delete = img
-                break
+        async with media_lock(image_type):
+            ensure_revision(if_match, None, get_media_revision(image_type))
+            config = edit_image_config(image_type)
+            position = find_media_position(image_type, config, image_id)
 
-        if not image_to_delete:
-            raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+            if position is None:
+                raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+            image_to_delete = config["images"][position]
 
-        images_dir = get_images_dir(image_type)
-        file_path = images_dir / image_to_delete["filename"]
-        if file_path.exists():
-            os.remove(file_path)
+            images_dir = get_images_dir(image_type)
+            file_path = images_dir / image_to_delete["filename"]
+            if file_path.exists():
+                media_cache.invalidate(file_path.resolve())
+                os.remove(file_path)
 
-        config["images"] = [img for img in config["images"] if img["id"] != image_id]
-        
-        # ID 재정렬
-        for i, img in enumerate(config["images"], 1):
-            img["id"] = i
-        
-        save_image_config(image_type, config)
+            # 다른 이미지의 ID는 그대로 유지 (인덱스의 위치로 바로 삭제)
+            del config["images"][position]
+            save_image_config(image_type, config)
 
         # SSE 브로드캐스트
         event_type = "dashboard_image" if image_type == "dashboard" else "pr_image"
@@ -175,53 +338,96 @@ async def delete_image(image_type: ImageType, image_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"이미지 삭제 실패: {str(e)}")
 
+@router.put("/{image_type}/order")
+async def replace_image_order(
+    image_type: ImageType,
+    ids: List[int] = Body(..., embed=True),
+    baseRevision: Optional[int] = Body(None, embed=True),
+    if_match: Optional[str] = Header(None)
+):
+    """전체 재생 순서 일괄 변경 (ID 목록 순서대로 order 재지정)"""
+    async with media_lock(image_type):
+        ensure_revision(if_match, baseRevision, get_media_revision(image_type))
+        config = edit_image_config(image_type)
+        existing_ids = {img["id"] for img in config["images"]}
+
+        if len(ids) != len(set(ids)):
+            raise HTTPException(status_code=400, detail="중복된 이미지 ID가 있습니다.")
+        if set(ids) != existing_ids:
+            missing = sorted(existing_ids - set(ids))
+            unknown = sorted(set(ids) - existing_ids)
+            raise HTTPException(
+                status_code=400,
+                detail=f"ID 목록이 현재 이미지 목록과 일치하지 않습니다. (누락: {missing}, 없는 ID: {unknown})"
+            )
+
+        position = {image_id: index for index, image_id in enumerate(ids, 1)}
+        for img in config["images"]:
+            img["order"] = position[img["id"]]
+        save_image_config(image_type, config)
+
+    # SSE 브로드캐스트 (새 순서 전체를 1회 전송)
+    event_type = "dashboard_image" if image_type == "dashboard" else "pr_image"
+    await client_registry.broadcast(event_type, {
+        "action": "reorder",
+        "payload": {"order": ids}
+    })
+
+    return {"code": 200, "message": "순서 일괄 변경 성공", "data": config}
+
 @router.patch("/{image_type}/{image_id}/order")
 async def update_image_order(
     image_type: ImageType, 
     image_id: int, 
-    order: int = Body(..., embed=True)
+    order: int = Body(..., embed=True),
+    if_match: Optional[str] = Header(None)
 ):
     """이미지 순서 변경"""
-    config = get_image_config(image_type)
+    async with media_lock(image_type):
+        ensure_revision(if_match, None, get_media_revision(image_type))
+        config = edit_image_config(image_type)
+        position = find_media_position(image_type, config, image_id)
+        if position is None:
+            raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+        img = config["images"][position]
 
-    for img in config["images"]:
-        if img["id"] == image_id:
-            img["order"] = order
-            save_image_config(image_type, config)
-            
-            # SSE 브로드캐스트
-            event_type = "dashboard_image" if image_type == "dashboard" else "pr_image"
-            await client_registry.broadcast(event_type, {
-                "action": "update",
-                "payload": {"id": image_id, "order": order}
-            })
-            
-            return {"code": 200, "message": "순서 변경 성공"}
-
-    raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+        img["order"] = order
+        save_image_config(image_type, config)
+        
+    # SSE 브로드캐스트
+    event_type = "dashboard_image" if image_type == "dashboard" else "pr_image"
+    await client_registry.broadcast(event_type, {
+        "action": "update",
+        "payload": {"id": image_id, "order": order}
+    })
+    
+    return {"code": 200, "message": "순서 변경 성공"}
 
 @router.patch("/{image_type}/{image_id}/name")
 async def update_image_name(
     image_type: ImageType,
     image_id: int,
-    name: str = Body(..., embed=True)
+    name: str = Body(..., embed=True),
+    if_match: Optional[str] = Header(None)
 ):
     """이미지 이름 변경"""
-    config = get_image_config(image_type)
+    async with media_lock(image_type):
+        ensure_revision(if_match, None, get_media_revision(image_type))
+        config = edit_image_config(image_type)
+        position = find_media_position(image_type, config, image_id)
+        if position is None:
+            raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+        img = config["images"][position]
 
-    for img in config["images"]:
-        if img["id"] == image_id:
-            img["name"] = name
-            save_image_config(image_type, config)
-            
-            # SSE 브로드캐스트
-            event_type = "dashboard_image" if image_type == "dashboard" else "pr_image"
-            await client_registry.broadcast(event_type, {
-                "action": "update",
-                "payload": {"id": image_id, "name": name}
-            })
-            
-            return {"code": 200, "message": "이름 변경 성공", "data": img}
-
-    raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+        img["name"] = name
+        save_image_config(image_type, config)
+        
+    # SSE 브로드캐스트
+    event_type = "dashboard_image" if image_type == "dashboard" else "pr_image"
+    await client_registry.broadcast(event_type, {
+        "action": "update",
+        "payload": {"id": image_id, "name": name}
+    })
+    
+    return {"code": 200, "message": "이름 변경 성공", "data": img}
 
@@ -0,0 +1,149 @@
+"""미디어 파일 스트리밍 라우터 (HTTP Range 지원)"""
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+from pathlib import Path
+from typing import Optional
+from email.utils import formatdate
+import asyncio
+import mimetypes
+from app.config.paths import MEDIA_DIR
+from app.config.settings import MEDIA_CACHE_CONFIG
+from app.services.media_cache import media_cache, parse_range_header
+
+router = APIRouter(prefix="/content/media", tags=["Media Streaming"])
+
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+class RangeFileResponse(Response):
+    """파일의 특정 구간을 전송하는 응답
+
+    캐시된 앞부분은 메모리에서 먼저 보내고, 나머지는 서버가 ASGI zero-copy
+    확장을 지원하면 sendfile로, 아니면 청크 단위로 읽어 전송합니다.
+    """
+    def __init__(
+        self,
+        file_path: Path,
+        start: int,
+        end: int,
+        status_code: int,
+        headers: dict,
+        media_type: Optional[str],
+        head: Optional[bytes] = None,
+        send_body: bool = True,
+    ):
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.file_path = file_path
+        self.start = start
+        self.end = end
+        self.head = head
+        self.send_body = send_body
+        self.chunk_size = MEDIA_CACHE_CONFIG["chunk_size"]
+
+    async def __call__(self, scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if not self.send_body or self.end < self.start:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        position = self.start
+        remaining = self.end - self.start + 1
+
+        # 1. 캐시된 앞부분에서 전송
+        if self.head is not None and position < len(self.head):
+            cached = self.head[position:position + remaining]
+            position += len(cached)
+            remaining -= len(cached)
+            await send({"type": "http.response.body", "body": cached, "more_body": remaining > 0})
+            if remaining <= 0:
+                return
+
+        # 2. 나머지 구간은 디스크에서 전송
+        if ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+            with open(self.file_path, "rb") as f:
+                await send({
+                    "type": ZEROCOPY_EXTENSION,
+                    "file": f,
+                    "offset": position,
+                    "count": remaining,
+                    "more_body": False,
+                })
+            return
+
+        with open(self.file_path, "rb") as f:
+            f.seek(position)
+            while remaining > 0:
+                chunk = await asyncio.to_thread(f.read, min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            # 전송 중 파일이 줄어든 경우 응답 종료
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def _resolve_media_path(file_path: str) -> Path:
+    """요청 경로를 미디어 디렉토리 내부 경로로 변환 (디렉토리 이탈 방지)"""
+    media_root = MEDIA_DIR.resolve()
+    target = (media_root / file_path).resolve()
+    if not target.is_relative_to(media_root) or not target.is_file():
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    return target
+
+
+@router.api_route("/{file_path:path}", methods=["GET", "HEAD"])
+async def stream_media_file(file_path: str, request: Request):
+    """미디어 파일 전송 (단일 Range 요청은 206, 다중 Range는 416)"""
+    target = _resolve_media_path(file_path)
+    stat = target.stat()
+    file_size = stat.st_size
+    etag = f'"{stat.st_mtime_ns:x}-{file_size:x}"'
+    media_type = mimetypes.guess_type(str(target))[0] or "application/octet-stream"
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+    }
+    send_body = request.method != "HEAD"
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range", "")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range != etag:
+        # 파일이 바뀌었으면 Range를 무시하고 전체 전송
+        range_header = ""
+
+    result, byte_range = parse_range_header(range_header, file_size)
+    if result in ("multi", "invalid"):
+        headers["Content-Range"] = f"bytes */{file_size}"
+        detail = "다중 Range 요청은 지원하지 않습니다." if result == "multi" else "요청한 범위가 올바르지 않습니다."
+        return Response(content=detail, status_code=416, headers=headers, media_type="text/plain; charset=utf-8")
+
+    if result == "ok":
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    else:
+        start, end = 0, file_size - 1
+        status_code = 200
+    headers["Content-Length"] = str(end - start + 1)
+
+    head = None
+    if send_body:
+        head = await media_cache.get_head(target, stat.st_mtime_ns, file_size, start)
+
+    return RangeFileResponse(
+        target, start, end,
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+        head=head,
+        send_body=send_body,
+    )
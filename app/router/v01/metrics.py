@@ -0,0 +1,40 @@
+"""서버 내부 지표 라우터"""
+from fastapi import APIRouter
+from app.services.media_cache import media_cache
+from app.utils.singleflight import get_singleflight_stats
+from app.utils.lock_utils import get_lock_stats
+from app.services.spatial_service import get_spatial_index_stats
+from app.services.wayfinding_service import get_wayfinding_stats
+from app.services.floor_info_service import get_floor_info_stats
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+@router.get("/media-cache")
+async def get_media_cache_metrics():
+    """미디어 hot range 캐시 상태 및 파일별 적중률 조회"""
+    return {"code": 200, "data": media_cache.get_stats()}
+
+@router.get("/singleflight")
+async def get_singleflight_metrics():
+    """동시 조회 합치기(single-flight) 적중/미스 통계 조회"""
+    return {"code": 200, "data": get_singleflight_stats()}
+
+@router.get("/locks")
+async def get_lock_metrics():
+    """파일 단위 쓰기 잠금 대기 시간 통계 조회"""
+    return {"code": 200, "data": get_lock_stats()}
+
+@router.get("/spatial-index")
+async def get_spatial_index_metrics():
+    """층 요소 공간 인덱스 캐시 통계 조회"""
+    return {"code": 200, "data": get_spatial_index_stats()}
+
+@router.get("/wayfinding")
+async def get_wayfinding_metrics():
+    """길찾기 경로 캐시 통계 조회"""
+    return {"code": 200, "data": get_wayfinding_stats()}
+
+@router.get("/floor-info")
+async def get_floor_info_metrics():
+    """/data/floor-info 집계 캐시 통계 조회"""
+    return {"code": 200, "data": get_floor_info_stats()}
@@ -1,6 +1,6 @@
 """메인 라우터 (모든 라우터 통합)"""
 from fastapi import APIRouter
-from . import sse, clients, sync, auth, config, data, department
+from . import sse, clients, sync, auth, config, data, department, metrics
 
 api_router = APIRouter(prefix="/api/v1")
 
@@ -12,4 +12,5 @@ api_router.include_router(auth.router)
 api_router.include_router(config.router)
 api_router.include_router(data.router)
 api_router.include_router(department.router)
+api_router.include_router(metrics.router)
 
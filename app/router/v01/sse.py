@@ -20,15 +20,21 @@ def set_app_instance(app):
 @sse_router.get("/events")
 async def sse_events(
     request: Request,
-    clientId: str = Query(..., description="클라이언트 UUID")
+    clientId: str = Query(..., description="클라이언트 UUID"),
+    topics: Optional[str] = Query(None, description="구독 토픽 (쉼표 구분: building,floor,dashboard,pr,theme). 생략 시 전체"),
+    buildingId: Optional[str] = Query(None, description="구독할 건물 ID. 생략 시 전체 건물")
 ):
     """SSE 이벤트 스트림"""
+    topic_list = [t.strip() for t in topics.split(",") if t.strip()] if topics else None
     
     async def event_generator():
         # 클라이언트 등록
         user_agent = request.headers.get("user-agent")
         ip_address = request.client.host if request.client else None
-        client = await client_registry.register(clientId, user_agent, ip_address)
+        client = await client_registry.register(
+            clientId, user_agent, ip_address,
+            topics=topic_list, building_id=buildingId
+        )
         
         try:
             # 연결 성공 이벤트 전송
@@ -37,7 +43,9 @@ async def sse_events(
                 "clientId": clientId,
                 "alias": client.alias,
                 "serverTime": get_timestamp(),  # field 포맷 사용
-                "serverVersion": client_registry.version
+                "serverVersion": client_registry.version,
+                "topics": sorted(client.topics) if client.topics is not None else None,
+                "buildingId": client.building_id
             }
             yield f"event: connection\ndata: {json.dumps(connection_data, ensure_ascii=False)}\n\n"
             # app이 설정되지 않았거나 종료 중이 아닐 때 계속 실행
@@ -63,8 +71,8 @@ async def sse_events(
                     yield f"event: heartbeat\ndata: {json.dumps(heartbeat_data, ensure_ascii=False)}\n\n"
                     
         finally:
-            # 클라이언트 해제
-            client_registry.unregister(clientId)
+            # 클라이언트 해제 (같은 ID로 재연결된 새 연결은 유지)
+            client_registry.unregister(clientId, client)
     
     return StreamingResponse(
         event_generator(),
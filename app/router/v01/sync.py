@@ -39,7 +39,8 @@ async def get_sync_status(clientId: str = Query(None)):
         "code": 200,
         "data": {
             "serverVersion": client_registry.version,
-            "connectedClients": client_registry.get_all_clients()
+            "connectedClients": client_registry.get_all_clients(),
+            "fanoutJobs": client_registry.get_fanout_jobs()
         }
     }
 
@@ -1,18 +1,58 @@
 """비즈니스 로직 서비스"""
 from .client_registry import ClientRegistry, ClientInfo
+from .content_store import (
+    FileContentStore,
+    SqliteContentStore,
+    create_content_store,
+    content_store
+)
 from .building_service import (
     get_building_dir,
     get_floors_file,
+    get_building_file,
+    get_building_revision,
+    get_floor_revision,
+    get_floor_revisions,
+    building_lock,
+    floors_lock,
     load_building_json,
     save_building_json,
     load_building_floors_json,
     save_building_floors_json,
+    save_single_floor_json,
     load_building_floor_json,
     save_building_floor_json,
     get_all_buildings,
+    get_buildings_manifest,
+    get_buildings_floor_versions,
+    rebuild_buildings_manifest,
+    delete_building_data,
     get_building_floors,
+    load_building_floor,
+    load_building_detail,
+    fetch_building_detail,
+    fetch_building_floors,
+    fetch_building_floor,
+    fetch_all_buildings,
+    make_floor_change_payload,
+    modify_floor_elements,
+    add_floor_element,
+    update_floor_element,
+    delete_floor_element,
+    move_floor_elements,
+    migrate_floor_icon_types,
     generate_building_id
 )
+from .icon_service import (
+    get_default_icon_types,
+    get_current_location_icon,
+    get_icon_registry,
+    get_icon_sprite,
+    compute_icon_overrides,
+    dedupe_floor_icons,
+    resolve_icon_types,
+    with_icon_types
+)
 from .floor_service import (
     load_floor_json,
     save_floor_json,
@@ -23,13 +63,34 @@ from .media_service import (
     get_media_dir,
     get_metadata_file,
     load_media_config,
+    edit_media_config,
     save_media_config,
+    migrate_media_config,
+    allocate_media_id,
+    get_media_item,
+    find_media_position,
+    get_media_revision,
+    media_lock,
     scan_media_files,
     get_media_list,
     add_media_item,
     remove_media_item,
     update_media_order
 )
+from .spatial_service import (
+    get_floor_index,
+    query_floor_elements,
+    find_nearest_elements,
+    get_spatial_index_stats
+)
+from .wayfinding_service import (
+    find_route,
+    get_wayfinding_stats
+)
+from .floor_info_service import (
+    get_floor_info_view,
+    get_floor_info_stats
+)
 from .sync_service import SyncService
 from .theme_service import (
     load_themes,
@@ -45,16 +106,52 @@ from app.utils.datetime_utils import (
 __all__ = [
     "ClientRegistry",
     "ClientInfo",
+    "FileContentStore",
+    "SqliteContentStore",
+    "create_content_store",
+    "content_store",
     "get_building_dir",
     "get_floors_file",
+    "get_building_file",
+    "get_building_revision",
+    "get_floor_revision",
+    "get_floor_revisions",
+    "building_lock",
+    "floors_lock",
     "load_building_json",
     "save_building_json",
     "load_building_floors_json",
     "save_building_floors_json",
+    "save_single_floor_json",
     "load_building_floor_json",
     "save_building_floor_json",
     "get_all_buildings",
+    "get_buildings_manifest",
+    "get_buildings_floor_versions",
+    "rebuild_buildings_manifest",
+    "delete_building_data",
     "get_building_floors",
+    "load_building_floor",
+    "load_building_detail",
+    "fetch_building_detail",
+    "fetch_building_floors",
+    "fetch_building_floor",
+    "fetch_all_buildings",
+    "make_floor_change_payload",
+    "modify_floor_elements",
+    "add_floor_element",
+    "update_floor_element",
+    "delete_floor_element",
+    "move_floor_elements",
+    "migrate_floor_icon_types",
+    "get_default_icon_types",
+    "get_current_location_icon",
+    "get_icon_registry",
+    "get_icon_sprite",
+    "compute_icon_overrides",
+    "dedupe_floor_icons",
+    "resolve_icon_types",
+    "with_icon_types",
     "generate_building_id",
     "load_floors_json",
     "save_floors_json",
@@ -65,12 +162,27 @@ __all__ = [
     "get_media_dir",
     "get_metadata_file",
     "load_media_config",
+    "edit_media_config",
     "save_media_config",
+    "migrate_media_config",
+    "allocate_media_id",
+    "get_media_item",
+    "find_media_position",
+    "get_media_revision",
+    "media_lock",
     "scan_media_files",
     "get_media_list",
     "add_media_item",
     "remove_media_item",
     "update_media_order",
+    "get_floor_index",
+    "query_floor_elements",
+    "find_nearest_elements",
+    "get_spatial_index_stats",
+    "find_route",
+    "get_wayfinding_stats",
+    "get_floor_info_view",
+    "get_floor_info_stats",
     "SyncService",
     "load_themes",
     "save_themes",
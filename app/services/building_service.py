@@ -1,10 +1,49 @@
 """건물 데이터 관리 서비스"""
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Callable
+import copy
+import json
+import shutil
+import threading
 import uuid
 from app.config.paths import BUILDINGS_DATA_DIR
-from app.utils.json_utils import load_json_file, save_json_file
-from app.config.paths import ICONS_METADATA_FILE
+from app.utils.json_utils import project_fields
+from app.services.icon_service import (
+    get_default_icon_types, get_current_location_icon, get_icon_registry, dedupe_floor_icons, with_icon_types
+)
+from app.utils.singleflight import SingleFlight
+from app.services.content_store import content_store
+from app.utils.lock_utils import KeyedLockManager
+from app.utils.json_patch import make_patch, JsonPatch
+
+# 동시 조회 요청 합치기 (브로드캐스트 직후 키오스크가 한꺼번에 조회하는 경로용)
+read_flight = SingleFlight("building_reads")
+# 읽기-수정-저장 구간 직렬화 (building.json / floors.json 파일 단위)
+building_locks = KeyedLockManager("building_writes")
+
+def building_lock(building_id: str):
+    """building.json 수정 구간 잠금 (async with로 사용)"""
+    return building_locks.hold(f"building:{building_id}")
+
+def floors_lock(building_id: str):
+    """floors.json 수정 구간 잠금 (async with로 사용)"""
+    return building_locks.hold(f"floors:{building_id}")
+
+# 건물별 저장 세대 (None은 건물 목록 전체). 동시 요청 합치기 키에 포함해,
+# 저장이 끝난 뒤 들어온 조회가 저장 전에 시작된 조회 결과를 받지 않도록 함
+_generations: Dict[Optional[str], int] = {}
+_generations_lock = threading.Lock()
+
+def _bump_generation(building_id: str):
+    """건물 데이터 저장/삭제 후 호출 (저장이 끝난 뒤에 올려야 이후 조회가 새 데이터를 읽음)"""
+    with _generations_lock:
+        _generations[building_id] = _generations.get(building_id, 0) + 1
+        _generations[None] = _generations.get(None, 0) + 1
+
+def get_building_generation(building_id: Optional[str] = None) -> int:
+    """건물(None이면 전체 건물)의 현재 저장 세대"""
+    return _generations.get(building_id, 0)
+
 def get_building_dir(building_id: str) -> Path:
     """건물 데이터 디렉토리 경로 반환"""
     return BUILDINGS_DATA_DIR / building_id
@@ -13,125 +52,523 @@ def get_floors_file(building_id: str) -> Path:
     """건물의 층 데이터 파일 경로 반환"""
     return get_building_dir(building_id) / "floors.json"
 
+# (문서 종류, 건물 ID) → (저장소 변경 토큰, revision 정보) 캐시
+# 저장 전 revision 확인(If-Match) 시 문서를 다시 읽지 않고 변경 토큰만으로 검사하기 위함
+_revision_cache: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+
+def _version(kind: str, building_id: str) -> Optional[int]:
+    """문서의 저장소 변경 토큰 (file: mtime, sqlite: 저장 시각)"""
+    if kind == "building":
+        return content_store.building_version(building_id)
+    return content_store.floors_version(building_id)
+
+def _remember_revision(kind: str, building_id: str, value: Any):
+    """문서의 현재 revision 정보 기록"""
+    version = _version(kind, building_id)
+    if version is None:
+        _revision_cache.pop((kind, building_id), None)
+    else:
+        _revision_cache[(kind, building_id)] = (version, value)
+
+def _cached_revision(kind: str, building_id: str) -> Tuple[bool, Any]:
+    """문서가 바뀌지 않았으면 (True, revision 정보) 반환"""
+    cached = _revision_cache.get((kind, building_id))
+    if cached is not None and _version(kind, building_id) == cached[0]:
+        return True, cached[1]
+    return False, None
+
+def _floor_revisions(floors: List[Dict[str, Any]]) -> Dict[int, int]:
+    """층 번호 → revision 매핑"""
+    return {floor.get("floor"): floor.get("revision", 0) for floor in floors}
+
+def get_building_file(building_id: str) -> Path:
+    """건물 메타데이터 파일 경로 반환"""
+    return get_building_dir(building_id) / "building.json"
+
 def load_building_json(building_id: str) -> Optional[Dict[str, Any]]:
     """건물 메타데이터 로드"""
-    file_path = get_building_dir(building_id) / "building.json"
-    return load_json_file(file_path)
+    building = content_store.load_building(building_id)
+    if building is not None:
+        _remember_revision("building", building_id, building.get("revision", 0))
+    return building
 
 def save_building_json(building_id: str, data: Dict[str, Any]):
-    """건물 메타데이터 저장"""
-    building_dir = get_building_dir(building_id)
-    building_dir.mkdir(parents=True, exist_ok=True)
-    file_path = building_dir / "building.json"
-    save_json_file(file_path, data)
+    """건물 메타데이터 저장 (저장할 때마다 revision 1 증가)"""
+    # 층 이미지는 저장소와 관계없이 건물 디렉토리에 저장
+    get_building_dir(building_id).mkdir(parents=True, exist_ok=True)
+    data["revision"] = data.get("revision", 0) + 1
+    _save_with_manifest(building_id, lambda: content_store.save_building(building_id, data), building=data)
+    _remember_revision("building", building_id, data["revision"])
+    _bump_generation(building_id)
+
+def get_building_revision(building_id: str) -> Optional[int]:
+    """건물 revision 조회 (문서가 바뀌지 않았으면 다시 읽지 않음, 건물이 없으면 None)"""
+    hit, revision = _cached_revision("building", building_id)
+    if hit:
+        return revision
+    building = load_building_json(building_id)
+    return building.get("revision", 0) if building else None
 
 def load_building_floors_json(building_id: str) -> List[Dict[str, Any]]:
     """건물의 모든 층 데이터 로드"""
-    floors_file = get_floors_file(building_id)
-    floors = load_json_file(floors_file)
+    floors = content_store.load_floors(building_id)
     if floors is None:
         return []
-    if isinstance(floors, list):
-        return floors
-    return []
+    _remember_revision("floors", building_id, _floor_revisions(floors))
+    return floors
 
 def save_building_floors_json(building_id: str, floors: List[Dict[str, Any]]):
     """건물의 모든 층 데이터 저장"""
-    building_dir = get_building_dir(building_id)
-    building_dir.mkdir(parents=True, exist_ok=True)
-    floors_file = get_floors_file(building_id)
-    save_json_file(floors_file, floors)
+    get_building_dir(building_id).mkdir(parents=True, exist_ok=True)
+    _save_with_manifest(building_id, lambda: content_store.save_floors(building_id, floors), floors=floors)
+    _remember_revision("floors", building_id, _floor_revisions(floors))
+    _bump_generation(building_id)
+
+def save_single_floor_json(building_id: str, floor: Dict[str, Any]):
+    """층 1개 저장 (SQLite 저장소는 해당 층 행만 갱신, revision은 호출자가 관리)"""
+    hit, revisions = _cached_revision("floors", building_id)
+    _save_with_manifest(building_id, lambda: content_store.save_floor(building_id, floor), floor=floor)
+    if hit:
+        _remember_revision("floors", building_id, {**revisions, floor.get("floor"): floor.get("revision", 0)})
+    else:
+        _revision_cache.pop(("floors", building_id), None)
+    _bump_generation(building_id)
+
+def get_floor_revisions(building_id: str) -> Dict[int, int]:
+    """건물의 층 번호 → revision 매핑 (문서가 바뀌지 않았으면 다시 읽지 않음)"""
+    hit, revisions = _cached_revision("floors", building_id)
+    if not hit:
+        revisions = _floor_revisions(load_building_floors_json(building_id))
+    return revisions
+
+def get_floor_revision(building_id: str, floor_number: int) -> Optional[int]:
+    """층 revision 조회 (문서가 바뀌지 않았으면 다시 읽지 않음, 층이 없으면 None)"""
+    return get_floor_revisions(building_id).get(floor_number)
 
 def load_building_floor_json(building_id: str, floor_number: int) -> Optional[Dict[str, Any]]:
-    """특정 건물의 특정 층 데이터 로드"""
-    floors = load_building_floors_json(building_id)
-    for floor in floors:
-        if floor.get("floor") == floor_number:
-            return floor
-    return None
+    """특정 건물의 특정 층 데이터 로드 (SQLite 저장소는 해당 층 행만 읽음)"""
+    return content_store.load_floor(building_id, floor_number)
+
+def save_building_floor_json(building_id: str, floor_number: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """특정 건물의 특정 층 데이터 저장 또는 업데이트
 
-def save_building_floor_json(building_id: str, floor_number: int, data: Dict[str, Any]):
-    """특정 건물의 특정 층 데이터 저장 또는 업데이트"""
+    저장할 때마다 층의 revision을 1씩 올리고, 변경 전 층 데이터를 반환합니다 (새 층이면 None).
+    """
     floors = load_building_floors_json(building_id)
     
     # 기존 층 찾기
-    found = False
+    previous = None
     for i, floor in enumerate(floors):
         if floor.get("floor") == floor_number:
+            previous = floor
             floors[i] = data
-            found = True
             break
     
     # 새 층 추가
-    if not found:
+    if previous is None:
         floors.append(data)
     
+    # 아이콘 타입 전체 목록 대신 레지스트리 참조 + 층별 변경분만 저장
+    dedupe_floor_icons(data, previous=previous)
+    
+    data["revision"] = (previous.get("revision", 0) if previous else 0) + 1
+    
     # 층 번호로 정렬
     floors.sort(key=lambda x: x.get("floor", 0))
     
     save_building_floors_json(building_id, floors)
+    return previous
+
+def _serialized_size(data: Any) -> int:
+    """JSON 파일로 저장했을 때의 크기 (저장소와 관계없이 절감량 비교용)"""
+    return len(json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+
+def migrate_floor_icon_types(building_id: str) -> Dict[str, int]:
+    """층마다 저장된 iconTypes 복사본을 아이콘 레지스트리 참조로 변환 (변환된 층만 revision 증가)"""
+    floors = load_building_floors_json(building_id)
+    registry = get_icon_registry()
+    size_before = _serialized_size(floors)
+    
+    migrated = 0
+    for floor in floors:
+        if dedupe_floor_icons(floor, registry):
+            floor["revision"] = floor.get("revision", 0) + 1
+            migrated += 1
+    
+    if not migrated:
+        return {"floors": len(floors), "migrated": 0, "bytesSaved": 0}
+    save_building_floors_json(building_id, floors)
+    return {
+        "floors": len(floors),
+        "migrated": migrated,
+        "bytesSaved": size_before - _serialized_size(floors)
+    }
+
+def make_floor_change_payload(
+    building_id: str,
+    floor_number: int,
+    previous: Optional[Dict[str, Any]],
+    current: Dict[str, Any]
+) -> Tuple[str, Dict[str, Any]]:
+    """층 변경 브로드캐스트용 (action, payload) 생성
+
+    이전 층 데이터가 있으면 RFC 6902 JSON Patch와 기준 revision을 보내고,
+    패치가 전체 데이터보다 크거나 이전 데이터가 없으면 전체 데이터를 보냅니다.
+    """
+    payload = {
+        "buildingId": building_id,
+        "floorNumber": floor_number,
+        "revision": current.get("revision")
+    }
+    if previous is not None:
+        patch = make_patch(previous, current)
+        full_size = len(json.dumps(current, ensure_ascii=False))
+        if len(json.dumps(patch, ensure_ascii=False)) < full_size:
+            payload["baseRevision"] = previous.get("revision", 0)
+            payload["patch"] = patch
+            return "patch", payload
+    payload["data"] = current
+    return "update", payload
+
+def _is_current_location_element(element: Dict[str, Any]) -> bool:
+    """currentLocation 아이콘 요소 여부 (층의 currentLocation 필드로 별도 관리)"""
+    return element.get("type") == "icon" and element.get("iconType") == "currentLocation"
+
+def _find_element_index(floor: Dict[str, Any], element_id: str) -> int:
+    """요소 ID로 elements 내 위치 조회"""
+    for i, element in enumerate(floor.get("elements", [])):
+        if element.get("id") == element_id:
+            return i
+    raise LookupError(f"요소를 찾을 수 없습니다: {element_id}")
+
+def modify_floor_elements(
+    building_id: str,
+    floor_number: int,
+    mutator: Callable[[Dict[str, Any]], JsonPatch],
+    updated_at: Optional[str] = None
+) -> Tuple[Dict[str, Any], int, JsonPatch]:
+    """층 요소 단위 수정 (해당 층 1개만 읽고 저장)
+
+    mutator는 층 데이터를 제자리에서 수정하고 수행한 변경을 JSON Patch로 반환합니다.
+    revision/updatedAt 변경도 패치에 포함하여 (층 데이터, 기준 revision, 패치)를 반환합니다.
+    층이 없으면 LookupError를 발생시킵니다.
+    """
+    floor = load_building_floor_json(building_id, floor_number)
+    if floor is None:
+        raise LookupError(f"{floor_number}층을 찾을 수 없습니다.")
+    floor.setdefault("elements", [])
+    
+    patch = mutator(floor)
+    base_revision = floor.get("revision", 0)
+    floor["revision"] = base_revision + 1
+    patch.append({"op": "add", "path": "/revision", "value": floor["revision"]})
+    if updated_at:
+        floor["updatedAt"] = updated_at
+        patch.append({"op": "add", "path": "/updatedAt", "value": updated_at})
+    
+    save_single_floor_json(building_id, floor)
+    return floor, base_revision, patch
+
+def add_floor_element(building_id: str, floor_number: int, element: Dict[str, Any], updated_at: Optional[str] = None):
+    """층에 요소 1개 추가 (ID가 없으면 생성)"""
+    if _is_current_location_element(element):
+        raise ValueError("currentLocation 아이콘은 요소로 추가할 수 없습니다.")
+    element = dict(element)
+    element.setdefault("id", f"element_{uuid.uuid4().hex[:12]}")
+    
+    def mutator(floor):
+        if any(e.get("id") == element["id"] for e in floor["elements"]):
+            raise ValueError(f"이미 존재하는 요소 ID입니다: {element['id']}")
+        floor["elements"].append(element)
+        return [{"op": "add", "path": "/elements/-", "value": element}]
+    
+    return modify_floor_elements(building_id, floor_number, mutator, updated_at)
+
+def update_floor_element(building_id: str, floor_number: int, element_id: str, changes: Dict[str, Any], updated_at: Optional[str] = None):
+    """층 요소 1개의 일부 필드 수정 (id는 변경 불가)"""
+    changes = {k: v for k, v in changes.items() if k != "id"}
+    
+    def mutator(floor):
+        index = _find_element_index(floor, element_id)
+        element = floor["elements"][index]
+        merged = {**element, **changes}
+        if _is_current_location_element(merged):
+            raise ValueError("currentLocation 아이콘은 요소로 저장할 수 없습니다.")
+        floor["elements"][index] = merged
+        return make_patch(element, merged, f"/elements/{index}")
+    
+    return modify_floor_elements(building_id, floor_number, mutator, updated_at)
+
+def delete_floor_element(building_id: str, floor_number: int, element_id: str, updated_at: Optional[str] = None):
+    """층 요소 1개 삭제"""
+    def mutator(floor):
+        index = _find_element_index(floor, element_id)
+        del floor["elements"][index]
+        return [{"op": "remove", "path": f"/elements/{index}"}]
+    
+    return modify_floor_elements(building_id, floor_number, mutator, updated_at)
+
+def move_floor_elements(building_id: str, floor_number: int, element_ids: List[str], dx: float, dy: float, updated_at: Optional[str] = None):
+    """선택한 요소들을 (dx, dy)만큼 일괄 이동"""
+    targets = set(element_ids)
+    
+    def mutator(floor):
+        patch = []
+        found = set()
+        for index, element in enumerate(floor["elements"]):
+            if element.get("id") not in targets:
+                continue
+            found.add(element["id"])
+            for key, delta in (("x1", dx), ("x2", dx), ("y1", dy), ("y2", dy)):
+                if key in element and delta:
+                    value = element[key]
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        raise ValueError(f"요소 좌표가 숫자가 아닙니다: {element['id']}.{key}")
+                    moved = value + delta
+                    # 정수 좌표는 정수로 유지
+                    if isinstance(element[key], int) and float(moved).is_integer():
+                        moved = int(moved)
+                    element[key] = moved
+                    patch.append({"op": "replace", "path": f"/elements/{index}/{key}", "value": element[key]})
+        missing = targets - found
+        if missing:
+            raise LookupError(f"요소를 찾을 수 없습니다: {', '.join(sorted(missing))}")
+        return patch
+    
+    return modify_floor_elements(building_id, floor_number, mutator, updated_at)
+
+# 건물 목록 manifest (건물 ID → 건물 메타데이터 + 층 요약)
+# 목록 조회 시 저장소 전체를 읽지 않도록 저장/삭제 경로에서 함께 갱신
+MANIFEST_VERSION = 2
+_manifest_lock = threading.RLock()
+_manifest_cache: Dict[str, Any] = {"version": None, "data": None}
+
+def _floor_summary(floor: Dict[str, Any]) -> Dict[str, Any]:
+    """manifest에 저장하는 층 요약"""
+    return {
+        "floor": floor.get("floor"),
+        "floorName": floor.get("floorName"),
+        "floorImage": floor.get("floorImage"),
+        "revision": floor.get("revision", 0),
+        "elementCount": len(floor.get("elements") or []),
+    }
+
+def get_buildings_floor_versions() -> List[Tuple[str, Tuple[Optional[int], Tuple[Any, ...]]]]:
+    """건물 ID와 (층 목록 변경 토큰, 층별 (층 번호, revision)) 목록 (manifest 기준, 층 데이터 변경 감지용)
+
+    저장소 변경 토큰의 해상도가 낮아 같은 값이 나오더라도 층 revision으로 변경을 감지합니다.
+    """
+    return [
+        (building_id, (entry.get("floorsVersion"), tuple((f.get("floor"), f.get("revision")) for f in entry["floors"])))
+        for building_id, entry in _load_manifest()["buildings"].items()
+        if entry.get("building")
+    ]
+
+def _write_manifest(manifest: Dict[str, Any]):
+    """manifest 전체 저장 후 메모리 캐시 갱신 (_manifest_lock 안에서 호출)"""
+    content_store.save_manifest(manifest)
+    _manifest_cache["version"] = content_store.manifest_version()
+    _manifest_cache["data"] = manifest
+
+def _scan_buildings() -> Dict[str, Any]:
+    """저장소의 모든 건물을 읽어 manifest 생성"""
+    buildings = {}
+    for building_id in content_store.building_ids():
+        building = content_store.load_building(building_id)
+        if building is None:
+            continue
+        floors = content_store.load_floors(building_id) or []
+        buildings[building_id] = {
+            "building": building,
+            "floors": [_floor_summary(f) for f in sorted(floors, key=lambda x: x.get("floor", 0))],
+            "floorsVersion": content_store.floors_version(building_id),
+        }
+    return {"version": MANIFEST_VERSION, "backend": content_store.name, "buildings": buildings}
+
+def rebuild_buildings_manifest() -> Dict[str, Any]:
+    """저장소 기준으로 manifest 재생성 (시작 시, 파일을 직접 수정한 경우)"""
+    with _manifest_lock:
+        manifest = _scan_buildings()
+        _write_manifest(manifest)
+    return manifest
+
+def _load_manifest() -> Dict[str, Any]:
+    """manifest 조회 (저장된 manifest가 바뀌지 않았으면 메모리 캐시, 없거나 형식/저장소가 다르면 재생성)"""
+    version = content_store.manifest_version()
+    if version is not None and version == _manifest_cache["version"]:
+        return _manifest_cache["data"]
+    manifest = content_store.load_manifest() if version is not None else None
+    if manifest is None or manifest.get("version") != MANIFEST_VERSION \
+            or manifest.get("backend") != content_store.name:
+        return rebuild_buildings_manifest()
+    _manifest_cache["version"] = version
+    _manifest_cache["data"] = manifest
+    return manifest
+
+def _persisted_fields(entry: Optional[Dict[str, Any]]) -> Any:
+    """JSON 파일 manifest에 바로 반영해야 하는 값 (층 revision, 요소 수, 변경 토큰처럼 요소 편집마다 바뀌는 값 제외)"""
+    if entry is None:
+        return None
+    return entry.get("building"), [(f.get("floor"), f.get("floorName"), f.get("floorImage")) for f in entry["floors"]]
+
+def _apply_manifest_changes(manifest: Dict[str, Any], building_id: str, changes: Dict[str, Any]) -> Dict[str, Any]:
+    """건물 1개의 항목을 바꾼 새 manifest (building=메타데이터, floors=층 목록, floor=층 1개, remove=True면 삭제)
+
+    기존 manifest 객체는 수정하지 않으므로 조회 중인 목록에 영향이 없습니다.
+    """
+    buildings = dict(manifest["buildings"])
+    if changes.get("remove"):
+        buildings.pop(building_id, None)
+    else:
+        entry = dict(buildings.get(building_id) or {"building": None, "floors": []})
+        if "building" in changes:
+            entry["building"] = copy.deepcopy(changes["building"])
+        if "floors" in changes:
+            floors = sorted(changes["floors"], key=lambda x: x.get("floor", 0))
+            entry["floors"] = [_floor_summary(f) for f in floors]
+            entry["floorsVersion"] = content_store.floors_version(building_id)
+        if "floor" in changes:
+            summary = _floor_summary(changes["floor"])
+            floors = [f for f in entry["floors"] if f.get("floor") != summary["floor"]] + [summary]
+            entry["floors"] = sorted(floors, key=lambda x: x.get("floor", 0))
+            entry["floorsVersion"] = content_store.floors_version(building_id)
+        buildings[building_id] = entry
+    return {**manifest, "buildings": dict(sorted(buildings.items()))}
+
+def _save_with_manifest(building_id: str, write: Callable[[], None], **changes):
+    """저장소 쓰기(write)와 manifest 항목 갱신을 함께 수행 (changes는 _apply_manifest_changes 참고)
+
+    SQLite 저장소는 내용과 manifest 행을 한 트랜잭션으로 저장하므로 둘이 어긋나지 않습니다.
+    JSON 파일 저장소는 내용 파일을 쓴 뒤 manifest 파일을 쓰므로, 그 사이에 프로세스가 종료되면
+    manifest가 이전 상태로 남습니다. 서버 시작 시 저장소 기준으로 manifest를 재생성(main.py)하여 복구합니다.
+    같은 이유로 층 revision, 요소 수만 바뀐 경우(요소 편집)는 manifest 파일을 다시 쓰지 않고 메모리만 갱신합니다.
+    """
+    with _manifest_lock:
+        manifest = _load_manifest()
+        with content_store.transaction():
+            write()
+            updated = _apply_manifest_changes(manifest, building_id, changes)
+            persist = content_store.partial_manifest_writes or \
+                _persisted_fields(manifest["buildings"].get(building_id)) != _persisted_fields(updated["buildings"].get(building_id))
+            if persist:
+                content_store.save_manifest(updated, building_id)
+        if persist:
+            _manifest_cache["version"] = content_store.manifest_version()
+        _manifest_cache["data"] = updated
+
+def delete_building_data(building_id: str) -> bool:
+    """건물 데이터와 디렉토리(이미지 포함) 삭제 후 manifest에서 제거 (건물이 없으면 False)"""
+    building_dir = get_building_dir(building_id)
+    if content_store.building_version(building_id) is None and not building_dir.exists():
+        return False
+    _save_with_manifest(building_id, lambda: content_store.delete_building(building_id), remove=True)
+    if building_dir.exists():
+        shutil.rmtree(building_dir)
+    _revision_cache.pop(("building", building_id), None)
+    _revision_cache.pop(("floors", building_id), None)
+    _bump_generation(building_id)
+    return True
 
 def get_all_buildings() -> List[Dict[str, Any]]:
-    """모든 건물 목록 조회"""
-    buildings = []
-    if BUILDINGS_DATA_DIR.exists():
-        for building_dir in sorted(BUILDINGS_DATA_DIR.iterdir()):
-            if building_dir.is_dir():
-                building_data = load_building_json(building_dir.name)
-                if building_data:
-                    buildings.append(building_data)
-    return buildings
-
-def get_building_floors(building_id: str) -> List[Dict[str, Any]]:
-    """특정 건물의 모든 층 데이터 조회"""
+    """모든 건물 목록 조회 (manifest 기준, 건물 디렉토리를 순회하지 않음)"""
+    buildings = _load_manifest()["buildings"]
+    return [dict(entry["building"]) for entry in buildings.values() if entry.get("building")]
+
+def get_buildings_manifest() -> List[Dict[str, Any]]:
+    """건물별 ID, 이름, revision, 층 수와 층 요약 목록"""
+    result = []
+    for building_id, entry in _load_manifest()["buildings"].items():
+        building = entry.get("building")
+        if not building:
+            continue
+        result.append({
+            "id": building_id,
+            "name": building.get("name"),
+            "revision": building.get("revision", 0),
+            "floorCount": len(entry["floors"]),
+            "floors": entry["floors"],
+        })
+    return result
+
+def get_building_floors(
+    building_id: str,
+    fields: Optional[Dict[str, Any]] = None,
+    resolve_icons: bool = False
+) -> List[Dict[str, Any]]:
+    """특정 건물의 모든 층 데이터 조회 (fields가 있으면 해당 필드만, resolve_icons면 전체 iconTypes 포함)"""
     floors = load_building_floors_json(building_id)
+    if resolve_icons:
+        registry = get_icon_registry()
+        floors = [with_icon_types(f, registry) for f in floors]
     floors.sort(key=lambda x: x.get("floor", 0))
-    return floors
+    return project_fields(floors, fields)
+
+def load_building_floor(
+    building_id: str,
+    floor_number: int,
+    fields: Optional[Dict[str, Any]] = None,
+    resolve_icons: bool = False
+) -> Optional[Dict[str, Any]]:
+    """특정 층 데이터 조회 (fields가 있으면 해당 필드만, resolve_icons면 전체 iconTypes 포함)"""
+    floor = load_building_floor_json(building_id, floor_number)
+    if resolve_icons:
+        floor = with_icon_types(floor)
+    return project_fields(floor, fields)
+
+def load_building_detail(
+    building_id: str,
+    fields: Optional[Dict[str, Any]] = None,
+    resolve_icons: bool = False
+) -> Optional[Dict[str, Any]]:
+    """건물 메타데이터와 전체 층 데이터를 함께 로드
+
+    fields가 있으면 해당 필드만 남기고, floors를 요청하지 않으면 floors.json을 읽지 않습니다.
+    층 데이터는 기본적으로 아이콘 레지스트리 참조만 담고, resolve_icons면 전체 iconTypes를 채웁니다.
+    """
+    building = load_building_json(building_id)
+    if not building:
+        return None
+    if fields is not None and "floors" not in fields:
+        return project_fields(building, fields)
+    building["floors"] = get_building_floors(building_id, fields.get("floors") if fields else None, resolve_icons)
+    return project_fields(building, fields)
+
+def _fields_key(fields: Optional[Dict[str, Any]]) -> str:
+    """필드 트리를 동시 요청 합치기 키로 변환"""
+    return json.dumps(fields, sort_keys=True) if fields else ""
+
+async def fetch_building_detail(
+    building_id: str,
+    fields: Optional[Dict[str, Any]] = None,
+    resolve_icons: bool = False
+) -> Optional[Dict[str, Any]]:
+    """건물 상세 조회 (동시 요청 합치기, 반환값은 수정하지 말 것)"""
+    key = ("detail", building_id, get_building_generation(building_id), _fields_key(fields), resolve_icons)
+    return await read_flight.do(key, load_building_detail, building_id, fields, resolve_icons)
+
+async def fetch_building_floors(
+    building_id: str,
+    fields: Optional[Dict[str, Any]] = None,
+    resolve_icons: bool = False
+) -> List[Dict[str, Any]]:
+    """건물의 층 목록 조회 (동시 요청 합치기, 반환값은 수정하지 말 것)"""
+    key = ("floors", building_id, get_building_generation(building_id), _fields_key(fields), resolve_icons)
+    return await read_flight.do(key, get_building_floors, building_id, fields, resolve_icons)
+
+async def fetch_building_floor(
+    building_id: str,
+    floor_number: int,
+    fields: Optional[Dict[str, Any]] = None,
+    resolve_icons: bool = False
+) -> Optional[Dict[str, Any]]:
+    """특정 층 조회 (동시 요청 합치기, 반환값은 수정하지 말 것)"""
+    key = ("floor", building_id, floor_number, get_building_generation(building_id), _fields_key(fields), resolve_icons)
+    return await read_flight.do(key, load_building_floor, building_id, floor_number, fields, resolve_icons)
+
+async def fetch_all_buildings() -> List[Dict[str, Any]]:
+    """건물 목록 조회 (동시 요청 합치기, 반환값은 수정하지 말 것)"""
+    return await read_flight.do(("all", get_building_generation()), get_all_buildings)
 
 def generate_building_id() -> str:
     """UUID로 건물 ID 생성"""
     return str(uuid.uuid4())
-
-def get_default_icon_types():
-    """icon.json에서 모든 아이콘 타입 로드 (currentLocation 제외)"""
-    icon_data = load_json_file(ICONS_METADATA_FILE)
-    if icon_data and "iconTypes" in icon_data:
-        icon_types = {}
-        
-        # iconTypes의 모든 아이콘 반환 (currentLocation 제외)
-        for icon_id, icon_info in icon_data["iconTypes"].items():
-            # currentLocation은 별도 필드로 관리하므로 제외
-            if icon_id != "currentLocation":
-                icon_path = icon_info.get("icon", "")
-                # icon.json에 /content/가 없으면 추가
-                if icon_path and not icon_path.startswith("/content/"):
-                    icon_path = f"/content/{icon_path}"
-                # floor_data에 필요한 형식으로 변환 (icon, label만)
-                icon_types[icon_id] = {
-                    "icon": icon_path,
-                    "label": icon_info.get("label", "")
-                }
-        
-        return icon_types
-    
-    # 기본값 (icon.json이 없을 경우)
-    return {
-        "toiletMan": {"icon": "/content/facilities/icons/toilet_man.svg", "label": "남자화장실"},
-        "toiletWoman": {"icon": "/content/facilities/icons/toilet_woman.svg", "label": "여자화장실"},
-        "restaurant": {"icon": "/content/facilities/icons/dish-02.svg", "label": "식당"},
-        "printer": {"icon": "/content/facilities/icons/printer.svg", "label": "복사기"}
-    }
-
-def get_current_location_icon():
-    """icon.json에서 currentLocation 아이콘 정보 로드"""
-    icon_data = load_json_file(ICONS_METADATA_FILE)
-    if icon_data and "iconTypes" in icon_data and "currentLocation" in icon_data["iconTypes"]:
-        icon_info = icon_data["iconTypes"]["currentLocation"]
-        icon_path = icon_info.get("icon", "/content/facilities/icons/current_location.svg")
-        # icon.json에 /content/가 없으면 추가
-        if not icon_path.startswith("/content/"):
-            icon_path = f"/content/{icon_path}"
-        return icon_path
-    
-    # 기본값
-    return "/content/facilities/icons/current_location.svg"
\ No newline at end of file
@@ -1,12 +1,26 @@
 """SSE 클라이언트 관리 서비스"""
 import asyncio
-from typing import Dict, Optional
+import random
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Iterable
 from app.config.paths import CLIENT_INFO_FILE
+from app.config.settings import PREFETCH_CONFIG, FANOUT_CONFIG
 from app.utils.json_utils import load_json_file, save_json_file
 # from app.utils.datetime_utils import get_timestamp
 def get_timestamp() -> str:
     return "test"
 
+# 이벤트 타입 → 구독 토픽 매핑 (매핑되지 않은 이벤트는 모든 클라이언트에 전송)
+EVENT_TOPICS = {
+    "building": "building",
+    "floor": "floor",
+    "floor_image": "floor",
+    "dashboard_image": "dashboard",
+    "pr_image": "pr",
+    "theme": "theme",
+}
+
 class ClientInfo:
     """개별 클라이언트 정보"""
     def __init__(self, client_id: str, queue: asyncio.Queue):
@@ -17,6 +31,8 @@ class ClientInfo:
         self.queue = queue
         self.user_agent: Optional[str] = None
         self.ip_address: Optional[str] = None
+        self.topics: Optional[Set[str]] = None  # None이면 모든 토픽 구독
+        self.building_id: Optional[str] = None  # None이면 모든 건물 구독
     
     def to_dict(self) -> dict:
         return {
@@ -26,6 +42,8 @@ class ClientInfo:
             "lastHeartbeat": self.last_heartbeat,
             "userAgent": self.user_agent,
             "ipAddress": self.ip_address,
+            "topics": sorted(self.topics) if self.topics is not None else None,
+            "buildingId": self.building_id,
             "isOnline": True
         }
 
@@ -35,28 +53,94 @@ class ClientRegistry:
         self.clients: Dict[str, ClientInfo] = {}
         self.aliases: Dict[str, str] = {}  # clientId -> alias 매핑 (영구 저장용)
         self.version = 0
+        self.fanout_jobs: "OrderedDict[str, dict]" = OrderedDict()  # 분산 전송 작업 진행 상황
+        self._fanout_tasks = set()
+        # 구독 인덱스: 토픽/건물별 클라이언트 ID 집합
+        self.topic_index: Dict[str, Set[str]] = {}
+        self.all_topic_clients: Set[str] = set()
+        self.building_index: Dict[str, Set[str]] = {}
+        self.all_building_clients: Set[str] = set()
         self._load_aliases()
     
-    async def register(self, client_id: str, user_agent: str = None, ip_address: str = None) -> ClientInfo:
-        """새 클라이언트 등록"""
+    async def register(
+        self,
+        client_id: str,
+        user_agent: str = None,
+        ip_address: str = None,
+        topics: Optional[Iterable[str]] = None,
+        building_id: Optional[str] = None
+    ) -> ClientInfo:
+        """새 클라이언트 등록 (topics/building_id를 지정하면 해당 이벤트만 수신)"""
         queue = asyncio.Queue()
         client = ClientInfo(client_id, queue)
         client.user_agent = user_agent
         client.ip_address = ip_address
+        client.topics = set(topics) if topics else None
+        client.building_id = building_id or None
         
         # 기존 별칭이 있으면 복원
         if client_id in self.aliases:
             client.alias = self.aliases[client_id]
         
+        # 같은 ID로 재연결한 경우 이전 구독 정보 제거
+        if client_id in self.clients:
+            self._unindex(self.clients[client_id])
         self.clients[client_id] = client
+        self._index(client)
         print(f"[ClientRegistry] 클라이언트 등록: {client_id} (총 {len(self.clients)}개)")
         return client
     
-    def unregister(self, client_id: str):
-        """클라이언트 연결 해제"""
-        if client_id in self.clients:
-            del self.clients[client_id]
-            print(f"[ClientRegistry] 클라이언트 해제: {client_id} (남은 {len(self.clients)}개)")
+    def unregister(self, client_id: str, client: Optional[ClientInfo] = None):
+        """클라이언트 연결 해제
+
+        client를 넘기면 그 연결이 현재 등록된 연결일 때만 해제합니다
+        (재연결 직후 이전 연결의 정리 작업이 새 연결을 지우지 않도록).
+        """
+        current = self.clients.get(client_id)
+        if current is None or (client is not None and current is not client):
+            return
+        self._unindex(current)
+        del self.clients[client_id]
+        print(f"[ClientRegistry] 클라이언트 해제: {client_id} (남은 {len(self.clients)}개)")
+    
+    def _index(self, client: ClientInfo):
+        """구독 인덱스에 클라이언트 추가"""
+        if client.topics is None:
+            self.all_topic_clients.add(client.client_id)
+        else:
+            for topic in client.topics:
+                self.topic_index.setdefault(topic, set()).add(client.client_id)
+        if client.building_id is None:
+            self.all_building_clients.add(client.client_id)
+        else:
+            self.building_index.setdefault(client.building_id, set()).add(client.client_id)
+    
+    def _unindex(self, client: ClientInfo):
+        """구독 인덱스에서 클라이언트 제거"""
+        self.all_topic_clients.discard(client.client_id)
+        for topic in client.topics or ():
+            subscribers = self.topic_index.get(topic)
+            if subscribers is not None:
+                subscribers.discard(client.client_id)
+                if not subscribers:
+                    del self.topic_index[topic]
+        self.all_building_clients.discard(client.client_id)
+        if client.building_id is not None:
+            subscribers = self.building_index.get(client.building_id)
+            if subscribers is not None:
+                subscribers.discard(client.client_id)
+                if not subscribers:
+                    del self.building_index[client.building_id]
+    
+    def get_subscribers(self, topic: Optional[str] = None, building_id: Optional[str] = None) -> Set[str]:
+        """토픽/건물 조건에 맞는 클라이언트 ID 집합"""
+        if topic is None:
+            recipients = set(self.clients)
+        else:
+            recipients = self.all_topic_clients | self.topic_index.get(topic, set())
+        if building_id is not None:
+            recipients &= self.all_building_clients | self.building_index.get(building_id, set())
+        return recipients
     
     def update_heartbeat(self, client_id: str):
         """하트비트 시간 업데이트"""
@@ -83,8 +167,12 @@ class ClientRegistry:
         """연결된 클라이언트 수"""
         return len(self.clients)
     
-    async def broadcast(self, event_type: str, data: dict, exclude_client: str = None):
-        """모든 클라이언트에 메시지 전송"""
+    async def broadcast(self, event_type: str, data: dict, exclude_client: str = None, building_id: str = None):
+        """구독 중인 클라이언트에 메시지 전송
+
+        이벤트 타입에 해당하는 토픽을 구독한 클라이언트에만 보내며,
+        building_id를 지정하면 다른 건물만 구독한 클라이언트는 제외합니다.
+        """
         self.version += 1
         message = {
             "type": event_type,
@@ -93,14 +181,139 @@ class ClientRegistry:
             "version": self.version
         }
         
-        for client_id, client in self.clients.items():
+        for client_id in self.get_subscribers(EVENT_TOPICS.get(event_type), building_id):
             if exclude_client and client_id == exclude_client:
                 continue
+            client = self.clients[client_id]
             try:
                 await client.queue.put(message)
             except Exception as e:
                 print(f"[ClientRegistry] 브로드캐스트 실패 ({client_id}): {e}")
     
+    def broadcast_staggered(
+        self,
+        event_type: str,
+        data: dict,
+        batch_size: Optional[int] = None,
+        batch_delay: Optional[float] = None,
+        jitter: Optional[float] = None
+    ) -> dict:
+        """모든 클라이언트에 메시지를 배치 단위로 나누어 전송 (백그라운드 작업)
+
+        전체 명령을 한 번에 보내면 모든 키오스크가 동시에 데이터를 다시 받아
+        서버에 부하가 몰리므로, batch_size만큼 보내고 batch_delay + 무작위 jitter만큼
+        쉬었다가 다음 배치를 보냅니다. 작업 상태 dict를 즉시 반환합니다.
+        """
+        batch_size = max(1, batch_size or FANOUT_CONFIG["batch_size"])
+        batch_delay = FANOUT_CONFIG["batch_delay_seconds"] if batch_delay is None else batch_delay
+        jitter = FANOUT_CONFIG["jitter_seconds"] if jitter is None else jitter
+        
+        self.version += 1
+        message = {
+            "type": event_type,
+            "data": data,
+            "timestamp": get_timestamp(),  # field 포맷 사용
+            "version": self.version
+        }
+        target_ids = list(self.clients.keys())
+        batches = [target_ids[i:i + batch_size] for i in range(0, len(target_ids), batch_size)]
+        
+        job = {
+            "jobId": uuid.uuid4().hex[:12],
+            "eventType": event_type,
+            "command": data.get("command"),
+            "status": "running",
+            "total": len(target_ids),
+            "sent": 0,
+            "skipped": 0,
+            "batchSize": batch_size,
+            "batchDelaySeconds": batch_delay,
+            "jitterSeconds": jitter,
+            "totalBatches": len(batches),
+            "batchesSent": 0,
+            "startedAt": get_timestamp(),
+            "finishedAt": None
+        }
+        self.fanout_jobs[job["jobId"]] = job
+        while len(self.fanout_jobs) > FANOUT_CONFIG["max_jobs"]:
+            self.fanout_jobs.popitem(last=False)
+        
+        task = asyncio.create_task(self._run_fanout(job, message, batches))
+        self._fanout_tasks.add(task)
+        task.add_done_callback(self._fanout_tasks.discard)
+        return job
+    
+    async def _run_fanout(self, job: dict, message: dict, batches: List[List[str]]):
+        """분산 전송 작업 실행"""
+        try:
+            for index, batch in enumerate(batches):
+                if index > 0:
+                    await asyncio.sleep(job["batchDelaySeconds"] + random.uniform(0, job["jitterSeconds"]))
+                for client_id in batch:
+                    client = self.clients.get(client_id)
+                    if not client:
+                        # 전송 전에 연결이 끊긴 클라이언트
+                        job["skipped"] += 1
+                        continue
+                    try:
+                        await client.queue.put(message)
+                        job["sent"] += 1
+                    except Exception as e:
+                        job["skipped"] += 1
+                        print(f"[ClientRegistry] 분산 전송 실패 ({client_id}): {e}")
+                job["batchesSent"] = index + 1
+            job["status"] = "completed"
+        except asyncio.CancelledError:
+            job["status"] = "cancelled"
+            raise
+        finally:
+            job["finishedAt"] = get_timestamp()
+    
+    def get_fanout_jobs(self) -> list:
+        """분산 전송 작업 목록 (최신순)"""
+        return list(reversed(self.fanout_jobs.values()))
+    
+    async def broadcast_prefetch(
+        self,
+        assets: List[dict],
+        window_seconds: Optional[float] = None,
+        exclude_client: str = None,
+        event_type: str = None,
+        building_id: str = None
+    ):
+        """prefetch 힌트 전송
+
+        assets는 {"url", "size"} 목록입니다. 모든 키오스크가 동시에 내려받지 않도록
+        클라이언트마다 0 ~ window 사이의 무작위 fetchAfterMs를 지정합니다.
+        event_type/building_id를 지정하면 해당 이벤트 구독자에게만 보냅니다.
+        데이터 변경이 아니므로 version은 올리지 않습니다.
+        """
+        if not assets:
+            return
+        if window_seconds is None:
+            window_seconds = PREFETCH_CONFIG["window_seconds"]
+        window_ms = int(window_seconds * 1000)
+        
+        topic = EVENT_TOPICS.get(event_type) if event_type else None
+        for client_id in self.get_subscribers(topic, building_id):
+            if exclude_client and client_id == exclude_client:
+                continue
+            client = self.clients[client_id]
+            message = {
+                "type": "prefetch",
+                "data": {
+                    "assets": assets,
+                    "fetchAfterMs": random.randint(0, window_ms) if window_ms > 0 else 0,
+                    "windowMs": window_ms
+                },
+                "timestamp": get_timestamp(),  # field 포맷 사용
+                "version": self.version
+            }
+            try:
+                await client.queue.put(message)
+            except Exception as e:
+                print(f"[ClientRegistry] prefetch 전송 실패 ({client_id}): {e}")
+    
     async def send_to_client(self, client_id: str, event_type: str, data: dict) -> bool:
         """특정 클라이언트에 메시지 전송"""
         client = self.clients.get(client_id)
@@ -0,0 +1,378 @@
+"""콘텐츠 문서 저장소 (건물, 층, 미디어 설정)
+
+CONTENT_STORE_CONFIG["backend"]로 JSON 파일(file)과 SQLite(sqlite) 중 선택합니다.
+문서마다 변경 토큰(version)을 제공하므로, 캐시는 문서를 다시 읽지 않고 변경 여부만 확인할 수 있습니다.
+(file: 파일 mtime, sqlite: 저장 시각 ns)
+
+건물 목록 manifest도 저장소가 보관합니다. SQLite는 건물마다 한 행으로 저장하고
+내용 저장과 같은 트랜잭션(transaction())에서 갱신할 수 있습니다.
+"""
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from app.config.paths import (
+    BUILDINGS_DATA_DIR, BUILDINGS_MANIFEST_FILE, DB_PATH, SQL_SCHEMA_FILE,
+    DASHBOARD_METADATA_FILE, PR_METADATA_FILE
+)
+from app.config.settings import CONTENT_STORE_CONFIG
+from app.utils.json_utils import load_json_file, save_json_file
+
+
+def _mtime(file_path: Path) -> Optional[int]:
+    """파일 수정 시각 (없으면 None)"""
+    try:
+        return file_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class FileContentStore:
+    """content/ 아래 JSON 파일 저장소 (기존 구조)"""
+    name = "file"
+    # manifest는 파일 하나이므로 건물 1개만 바뀌어도 전체를 다시 씀
+    partial_manifest_writes = False
+
+    def __init__(self, buildings_dir: Path = BUILDINGS_DATA_DIR, media_files: Optional[Dict[str, Path]] = None,
+                 manifest_file: Path = BUILDINGS_MANIFEST_FILE):
+        self.buildings_dir = buildings_dir
+        self.media_files = media_files or {"dashboard": DASHBOARD_METADATA_FILE, "pr": PR_METADATA_FILE}
+        self.manifest_file = manifest_file
+
+    def transaction(self):
+        """여러 저장을 묶는 구간 (JSON 파일은 원자적으로 묶을 수 없어 순서대로 씀)"""
+        return contextlib.nullcontext()
+
+    def _building_file(self, building_id: str) -> Path:
+        return self.buildings_dir / building_id / "building.json"
+
+    def _floors_file(self, building_id: str) -> Path:
+        return self.buildings_dir / building_id / "floors.json"
+
+    def load_building(self, building_id: str) -> Optional[Dict[str, Any]]:
+        """건물 메타데이터 (없으면 None)"""
+        building = load_json_file(self._building_file(building_id))
+        return building if isinstance(building, dict) else None
+
+    def save_building(self, building_id: str, data: Dict[str, Any]):
+        """건물 메타데이터 저장"""
+        save_json_file(self._building_file(building_id), data)
+
+    def building_version(self, building_id: str) -> Optional[int]:
+        """건물 메타데이터 변경 토큰 (없으면 None)"""
+        return _mtime(self._building_file(building_id))
+
+    def load_floors(self, building_id: str) -> Optional[List[Dict[str, Any]]]:
+        """건물의 층 목록 (저장 순서, 없으면 None)"""
+        floors = load_json_file(self._floors_file(building_id))
+        return floors if isinstance(floors, list) else None
+
+    def load_floor(self, building_id: str, floor_number: int) -> Optional[Dict[str, Any]]:
+        """특정 층 (없으면 None)"""
+        return next((f for f in self.load_floors(building_id) or [] if f.get("floor") == floor_number), None)
+
+    def save_floors(self, building_id: str, floors: List[Dict[str, Any]]):
+        """건물의 층 목록 저장"""
+        save_json_file(self._floors_file(building_id), floors)
+
+    def save_floor(self, building_id: str, floor: Dict[str, Any]):
+        """층 1개 저장 (같은 층 번호 항목 교체, 없으면 추가). 파일 하나에 모든 층이 있으므로 파일 전체를 다시 씀"""
+        floors = self.load_floors(building_id) or []
+        for index, existing in enumerate(floors):
+            if existing.get("floor") == floor.get("floor"):
+                floors[index] = floor
+                break
+        else:
+            floors.append(floor)
+        self.save_floors(building_id, floors)
+
+    def floors_version(self, building_id: str) -> Optional[int]:
+        """층 목록 변경 토큰 (없으면 None)"""
+        return _mtime(self._floors_file(building_id))
+
+    def building_ids(self) -> List[str]:
+        """저장된 건물 ID 목록 (정렬)"""
+        if not self.buildings_dir.exists():
+            return []
+        return sorted(d.name for d in self.buildings_dir.iterdir() if d.is_dir())
+
+    def delete_building(self, building_id: str):
+        """건물 메타데이터와 층 목록 삭제 (이미지 등 디렉토리는 호출자가 정리)"""
+        for file_path in (self._building_file(building_id), self._floors_file(building_id)):
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        """건물 목록 manifest (없으면 None)"""
+        manifest = load_json_file(self.manifest_file)
+        return manifest if isinstance(manifest, dict) else None
+
+    def save_manifest(self, manifest: Dict[str, Any], building_id: Optional[str] = None):
+        """manifest 저장 (building_id와 관계없이 파일 전체를 들여쓰기 없이 씀)"""
+        save_json_file(self.manifest_file, manifest, compact=True)
+
+    def manifest_version(self) -> Optional[int]:
+        """manifest 변경 토큰 (없으면 None)"""
+        return _mtime(self.manifest_file)
+
+    def load_media(self, media_type: str) -> Optional[Dict[str, Any]]:
+        """미디어 설정 (없으면 None)"""
+        config = load_json_file(self.media_files[media_type])
+        return config if isinstance(config, dict) else None
+
+    def save_media(self, media_type: str, data: Dict[str, Any]):
+        """미디어 설정 저장"""
+        save_json_file(self.media_files[media_type], data)
+
+    def media_version(self, media_type: str) -> Optional[int]:
+        """미디어 설정 변경 토큰 (없으면 None)"""
+        return _mtime(self.media_files[media_type])
+
+
+class SqliteContentStore:
+    """SQLite 저장소 (sql/schema.sql의 content_* 테이블)
+
+    층은 한 행에 하나씩 저장하므로 특정 층 조회는 인덱스로 해당 행만 읽습니다.
+    연결은 스레드마다 따로 열고 WAL 모드로 읽기와 쓰기가 서로 막지 않게 합니다.
+    """
+    name = "sqlite"
+    # manifest는 건물마다 한 행이므로 바뀐 건물 행만 씀
+    partial_manifest_writes = True
+
+    def __init__(self, db_path: Path = DB_PATH, schema_file: Path = SQL_SCHEMA_FILE):
+        self.db_path = Path(db_path)
+        self.schema_file = schema_file
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 DB 연결 (처음 연결할 때 스키마 적용)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(self.schema_file.read_text(encoding="utf-8"))
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """쓰기 트랜잭션 (같은 스레드에서 중첩하면 바깥 트랜잭션에 합류하고, 가장 바깥 구간이 끝날 때 커밋)"""
+        conn = self._connect()
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        try:
+            if depth:
+                yield conn
+            else:
+                with conn:
+                    yield conn
+        finally:
+            self._local.depth = depth
+
+    @staticmethod
+    def _dumps(data: Any) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    def _scalar(self, sql: str, params: tuple) -> Any:
+        row = self._connect().execute(sql, params).fetchone()
+        return row[0] if row else None
+
+    def load_building(self, building_id: str) -> Optional[Dict[str, Any]]:
+        """건물 메타데이터 (없으면 None)"""
+        body = self._scalar("SELECT body FROM content_buildings WHERE id = ?", (building_id,))
+        return json.loads(body) if body else None
+
+    def save_building(self, building_id: str, data: Dict[str, Any]):
+        """건물 메타데이터 저장"""
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO content_buildings (id, body, building_version) VALUES (?, json(?), ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    body = excluded.body,
+                    building_version = excluded.building_version,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (building_id, self._dumps(data), time.time_ns())
+            )
+
+    def building_version(self, building_id: str) -> Optional[int]:
+        """건물 메타데이터 변경 토큰 (없으면 None)"""
+        return self._scalar(
+            "SELECT building_version FROM content_buildings WHERE id = ? AND body IS NOT NULL", (building_id,)
+        )
+
+    def load_floors(self, building_id: str) -> Optional[List[Dict[str, Any]]]:
+        """건물의 층 목록 (저장 순서, 없으면 None)"""
+        if self.floors_version(building_id) is None:
+            return None
+        rows = self._connect().execute(
+            "SELECT body FROM content_floors WHERE building_id = ? ORDER BY position", (building_id,)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def load_floor(self, building_id: str, floor_number: int) -> Optional[Dict[str, Any]]:
+        """특정 층 (없으면 None)"""
+        body = self._scalar(
+            "SELECT body FROM content_floors WHERE building_id = ? AND floor = ? ORDER BY position LIMIT 1",
+            (building_id, floor_number)
+        )
+        return json.loads(body) if body else None
+
+    def save_floors(self, building_id: str, floors: List[Dict[str, Any]]):
+        """건물의 층 목록 저장 (해당 건물의 층 행 전체 교체)"""
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO content_buildings (id, floors_version) VALUES (?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    floors_version = excluded.floors_version,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (building_id, time.time_ns())
+            )
+            conn.execute("DELETE FROM content_floors WHERE building_id = ?", (building_id,))
+            conn.executemany(
+                "INSERT INTO content_floors (building_id, position, floor, body) VALUES (?, ?, ?, json(?))",
+                [
+                    (building_id, position, floor.get("floor"), self._dumps(floor))
+                    for position, floor in enumerate(floors)
+                ]
+            )
+
+    def save_floor(self, building_id: str, floor: Dict[str, Any]):
+        """층 1개 저장 (해당 층 행만 UPDATE, 없으면 마지막 위치에 추가)"""
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO content_buildings (id, floors_version) VALUES (?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    floors_version = excluded.floors_version,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (building_id, time.time_ns())
+            )
+            body = self._dumps(floor)
+            updated = conn.execute(
+                """
+                UPDATE content_floors SET body = json(?)
+                WHERE rowid = (
+                    SELECT rowid FROM content_floors WHERE building_id = ? AND floor = ? ORDER BY position LIMIT 1
+                )
+                """,
+                (body, building_id, floor.get("floor"))
+            ).rowcount
+            if not updated:
+                conn.execute(
+                    """
+                    INSERT INTO content_floors (building_id, position, floor, body)
+                    VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM content_floors WHERE building_id = ?), ?, json(?))
+                    """,
+                    (building_id, building_id, floor.get("floor"), body)
+                )
+
+    def floors_version(self, building_id: str) -> Optional[int]:
+        """층 목록 변경 토큰 (없으면 None)"""
+        return self._scalar("SELECT floors_version FROM content_buildings WHERE id = ?", (building_id,))
+
+    def building_ids(self) -> List[str]:
+        """저장된 건물 ID 목록 (정렬)"""
+        rows = self._connect().execute("SELECT id FROM content_buildings ORDER BY id").fetchall()
+        return [row[0] for row in rows]
+
+    def delete_building(self, building_id: str):
+        """건물 메타데이터와 층 목록 삭제"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM content_floors WHERE building_id = ?", (building_id,))
+            conn.execute("DELETE FROM content_buildings WHERE id = ?", (building_id,))
+
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        """건물 목록 manifest (없으면 None)"""
+        header = self._scalar("SELECT body FROM content_manifest_meta WHERE id = 1", ())
+        if not header:
+            return None
+        rows = self._connect().execute(
+            "SELECT building_id, entry FROM content_manifest ORDER BY building_id"
+        ).fetchall()
+        return {**json.loads(header), "buildings": {row[0]: json.loads(row[1]) for row in rows}}
+
+    def save_manifest(self, manifest: Dict[str, Any], building_id: Optional[str] = None):
+        """manifest 저장 (building_id가 있으면 해당 건물 행만, 없으면 전체 교체)"""
+        header = {key: value for key, value in manifest.items() if key != "buildings"}
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO content_manifest_meta (id, body, version) VALUES (1, json(?), ?)
+                ON CONFLICT(id) DO UPDATE SET body = excluded.body, version = excluded.version
+                """,
+                (self._dumps(header), time.time_ns())
+            )
+            if building_id is None:
+                conn.execute("DELETE FROM content_manifest")
+                entries = manifest["buildings"].items()
+            else:
+                entry = manifest["buildings"].get(building_id)
+                if entry is None:
+                    conn.execute("DELETE FROM content_manifest WHERE building_id = ?", (building_id,))
+                entries = [] if entry is None else [(building_id, entry)]
+            conn.executemany(
+                """
+                INSERT INTO content_manifest (building_id, entry) VALUES (?, json(?))
+                ON CONFLICT(building_id) DO UPDATE SET entry = excluded.entry
+                """,
+                [(key, self._dumps(entry)) for key, entry in entries]
+            )
+
+    def manifest_version(self) -> Optional[int]:
+        """manifest 변경 토큰 (없으면 None)"""
+        return self._scalar("SELECT version FROM content_manifest_meta WHERE id = 1", ())
+
+    def load_media(self, media_type: str) -> Optional[Dict[str, Any]]:
+        """미디어 설정 (없으면 None)"""
+        body = self._scalar("SELECT body FROM content_media WHERE media_type = ?", (media_type,))
+        return json.loads(body) if body else None
+
+    def save_media(self, media_type: str, data: Dict[str, Any]):
+        """미디어 설정 저장"""
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO content_media (media_type, body, version) VALUES (?, json(?), ?)
+                ON CONFLICT(media_type) DO UPDATE SET
+                    body = excluded.body,
+                    version = excluded.version,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (media_type, self._dumps(data), time.time_ns())
+            )
+
+    def media_version(self, media_type: str) -> Optional[int]:
+        """미디어 설정 변경 토큰 (없으면 None)"""
+        return self._scalar("SELECT version FROM content_media WHERE media_type = ?", (media_type,))
+
+
+def create_content_store(backend: Optional[str] = None, **options):
+    """설정된 저장소 생성 (backend가 없으면 CONTENT_STORE_CONFIG 사용)"""
+    backend = backend or CONTENT_STORE_CONFIG["backend"]
+    if backend == "file":
+        return FileContentStore(**options)
+    if backend == "sqlite":
+        options.setdefault("db_path", CONTENT_STORE_CONFIG["db_path"] or DB_PATH)
+        return SqliteContentStore(**options)
+    raise ValueError(f"지원하지 않는 콘텐츠 저장소입니다: {backend}")
+
+
+content_store = create_content_store()
@@ -0,0 +1,73 @@
+"""전체 층 정보(/data/floor-info) 집계 서비스
+
+레거시 키오스크가 주기적으로 조회하는 응답을 직렬화된 bytes로 보관하고,
+층 목록이 바뀐 건물만 다시 읽어 갱신합니다.
+"""
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from app.services.building_service import get_buildings_floor_versions, get_building_floors
+from app.services.icon_service import get_icon_registry
+
+_lock = threading.Lock()
+# (resolve_icons, 건물 ID) → ((층 목록 변경 토큰, 층별 revision), [(층 번호, 직렬화된 층 데이터)])
+_buildings: Dict[Tuple[bool, str], Tuple[Tuple[Optional[int], Tuple[Any, ...]], List[Tuple[Any, bytes]]]] = {}
+# resolve_icons → 조립된 응답
+_views: Dict[bool, Dict[str, Any]] = {
+    False: {"key": None, "body": None, "etag": None},
+    True: {"key": None, "body": None, "etag": None},
+}
+_stats = {"hits": 0, "rebuilds": 0, "buildingsReloaded": 0}
+
+
+def _dumps(data: Any) -> bytes:
+    """JSONResponse와 같은 형식으로 직렬화"""
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def get_floor_info_view(resolve_icons: bool = False) -> Tuple[bytes, str]:
+    """직렬화된 /data/floor-info 응답 본문과 ETag
+
+    건물 목록이나 층 목록 변경 토큰, 층 revision이 바뀐 경우에만 해당 건물의 층을 다시 읽고 본문을 다시 조립합니다.
+    resolve_icons면 층마다 전체 iconTypes를 채우고, 아이콘 레지스트리가 바뀌면 모든 건물을 다시 읽습니다.
+    """
+    with _lock:
+        view = _views[resolve_icons]
+        versions = get_buildings_floor_versions()
+        icon_version = get_icon_registry()["version"] if resolve_icons else None
+        key = (icon_version, tuple(versions))
+        if key == view["key"]:
+            _stats["hits"] += 1
+            return view["body"], view["etag"]
+
+        if view["key"] is not None and view["key"][0] != icon_version:
+            for cache_key in [k for k in _buildings if k[0] == resolve_icons]:
+                del _buildings[cache_key]
+        current = dict(versions)
+        for cache_key in list(_buildings):
+            if cache_key[0] == resolve_icons and cache_key[1] not in current:
+                del _buildings[cache_key]
+        for building_id, version in versions:
+            cached = _buildings.get((resolve_icons, building_id))
+            if cached is None or cached[0] != version:
+                floors = get_building_floors(building_id, resolve_icons=resolve_icons)
+                _buildings[(resolve_icons, building_id)] = (version, [(f.get("floor", 0), _dumps(f)) for f in floors])
+                _stats["buildingsReloaded"] += 1
+
+        # 건물 순서대로 이어 붙인 뒤 층 번호로 안정 정렬 (기존 응답과 같은 순서)
+        fragments = [item for building_id, _ in versions for item in _buildings[(resolve_icons, building_id)][1]]
+        fragments.sort(key=lambda item: item[0])
+        body = b'{"code":200,"data":[' + b",".join(data for _, data in fragments) + b"]}"
+        view.update(key=key, body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:16]}"')
+        _stats["rebuilds"] += 1
+        return body, view["etag"]
+
+
+def get_floor_info_stats() -> Dict[str, Any]:
+    """집계 캐시 통계"""
+    return {
+        "buildings": len(_buildings),
+        "bytes": sum(len(view["body"] or b"") for view in _views.values()),
+        **_stats,
+    }
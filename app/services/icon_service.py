@@ -0,0 +1,188 @@
+"""아이콘 레지스트리 관리 서비스"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Any, Optional
+from app.config.paths import CONTENT_DIR, ICONS_METADATA_FILE
+from app.utils.json_utils import load_json_file
+from app.utils.svg_utils import build_sprite
+
+# 스프라이트 <symbol> id 접두사 (<use href="sprite.svg#icon-toiletMan">)
+SPRITE_SYMBOL_PREFIX = "icon-"
+
+# icon.json 메모리 캐시 (파일 mtime이 바뀐 경우에만 다시 읽음)
+_registry_cache: Dict[str, Any] = {"mtime": None, "registry": None}
+# 스프라이트 캐시 (레지스트리 버전과 SVG 파일 상태가 같으면 재사용)
+_sprite_cache: Dict[str, Any] = {"key": None, "sprite": None}
+
+DEFAULT_ICON_TYPES = {
+    "toiletMan": {"icon": "/content/facilities/icons/toilet_man.svg", "label": "남자화장실"},
+    "toiletWoman": {"icon": "/content/facilities/icons/toilet_woman.svg", "label": "여자화장실"},
+    "restaurant": {"icon": "/content/facilities/icons/dish-02.svg", "label": "식당"},
+    "printer": {"icon": "/content/facilities/icons/printer.svg", "label": "복사기"}
+}
+DEFAULT_CURRENT_LOCATION_ICON = "/content/facilities/icons/current_location.svg"
+
+def _normalize_icon_path(icon_path: str) -> str:
+    """icon.json에 /content/가 없으면 추가"""
+    if icon_path and not icon_path.startswith("/content/"):
+        return f"/content/{icon_path}"
+    return icon_path
+
+def _build_registry(icon_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """icon.json 내용으로 레지스트리 생성"""
+    if icon_data and "iconTypes" in icon_data:
+        icon_types = {}
+        # iconTypes의 모든 아이콘 (currentLocation은 별도 필드로 관리하므로 제외)
+        for icon_id, icon_info in icon_data["iconTypes"].items():
+            if icon_id != "currentLocation":
+                # floor_data에 필요한 형식으로 변환 (icon, label만)
+                icon_types[icon_id] = {
+                    "icon": _normalize_icon_path(icon_info.get("icon", "")),
+                    "label": icon_info.get("label", "")
+                }
+        current_info = icon_data["iconTypes"].get("currentLocation", {})
+        current_location = _normalize_icon_path(current_info.get("icon", DEFAULT_CURRENT_LOCATION_ICON))
+    else:
+        # 기본값 (icon.json이 없을 경우)
+        icon_types = {icon_id: dict(info) for icon_id, info in DEFAULT_ICON_TYPES.items()}
+        current_location = DEFAULT_CURRENT_LOCATION_ICON
+    
+    content = json.dumps(
+        {"iconTypes": icon_types, "currentLocation": current_location},
+        ensure_ascii=False, sort_keys=True
+    ).encode("utf-8")
+    return {
+        "version": hashlib.sha256(content).hexdigest()[:12],
+        "iconTypes": icon_types,
+        "currentLocation": current_location,
+    }
+
+def get_icon_registry() -> Dict[str, Any]:
+    """공유 아이콘 레지스트리 (아이콘 타입 목록과 내용 해시 기반 버전)
+
+    층 데이터는 전체 아이콘 목록 대신 이 레지스트리의 버전과 층별 변경분(iconOverrides)만 저장합니다.
+    반환값은 캐시와 공유되므로 수정하면 안 됩니다.
+    """
+    try:
+        mtime = ICONS_METADATA_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    if _registry_cache["registry"] is None or _registry_cache["mtime"] != mtime:
+        icon_data = load_json_file(ICONS_METADATA_FILE) if mtime is not None else None
+        _registry_cache["registry"] = _build_registry(icon_data)
+        _registry_cache["mtime"] = mtime
+    return _registry_cache["registry"]
+
+def get_default_icon_types() -> Dict[str, Any]:
+    """모든 아이콘 타입 (currentLocation 제외, 캐시된 레지스트리의 복사본)"""
+    return {icon_id: dict(info) for icon_id, info in get_icon_registry()["iconTypes"].items()}
+
+def get_current_location_icon() -> str:
+    """currentLocation 아이콘 경로"""
+    return get_icon_registry()["currentLocation"]
+
+def _resolve_icon_file(icon_path: str) -> Optional[Path]:
+    """/content/... 아이콘 경로를 실제 파일 경로로 변환 (콘텐츠 디렉토리 밖이면 None)"""
+    if not icon_path.startswith("/content/"):
+        return None
+    content_root = CONTENT_DIR.resolve()
+    target = (content_root / icon_path[len("/content/"):]).resolve()
+    if not target.is_relative_to(content_root) or target.suffix.lower() != ".svg":
+        return None
+    return target
+
+def get_icon_sprite() -> Dict[str, Any]:
+    """아이콘 타입별 <symbol>을 모은 SVG 스프라이트 (fingerprint, body, url)
+
+    아이콘 SVG 파일이나 icon.json이 바뀌면 다시 생성합니다.
+    """
+    registry = get_icon_registry()
+    icon_paths = {icon_id: info["icon"] for icon_id, info in registry["iconTypes"].items()}
+    icon_paths["currentLocation"] = registry["currentLocation"]
+    
+    symbols = {}
+    file_states = []
+    for icon_id, icon_path in icon_paths.items():
+        file_path = _resolve_icon_file(icon_path)
+        if file_path is None:
+            continue
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            continue
+        symbols[f"{SPRITE_SYMBOL_PREFIX}{icon_id}"] = file_path
+        file_states.append((icon_id, str(file_path), stat.st_mtime_ns, stat.st_size))
+    
+    key = (registry["version"], tuple(file_states))
+    if _sprite_cache["key"] != key:
+        body = build_sprite(symbols)
+        fingerprint = hashlib.sha256(body).hexdigest()[:12]
+        _sprite_cache["sprite"] = {
+            "fingerprint": fingerprint,
+            "body": body,
+            "url": f"/api/v1/icons/sprite/{fingerprint}.svg",
+            "symbolPrefix": SPRITE_SYMBOL_PREFIX,
+        }
+        _sprite_cache["key"] = key
+    return _sprite_cache["sprite"]
+
+def resolve_icon_types(floor: Dict[str, Any], registry: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """층에 적용되는 전체 아이콘 타입 (레지스트리 + 층별 변경분, None인 변경분은 제외)"""
+    registry = registry or get_icon_registry()
+    if "iconTypes" in floor and "iconOverrides" not in floor:
+        # 아직 변환되지 않은 층은 저장된 목록 그대로
+        return dict(floor["iconTypes"] or {})
+    icon_types = {icon_id: dict(info) for icon_id, info in registry["iconTypes"].items()}
+    for icon_id, info in (floor.get("iconOverrides") or {}).items():
+        if info is None:
+            icon_types.pop(icon_id, None)
+        else:
+            icon_types[icon_id] = info
+    return icon_types
+
+def with_icon_types(floor: Optional[Dict[str, Any]], registry: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """조회 응답용 층 데이터 (관리자 화면, 레거시 클라이언트를 위해 전체 iconTypes를 채운 복사본)"""
+    if not isinstance(floor, dict):
+        return floor
+    registry = registry or get_icon_registry()
+    return {**floor, "iconTypes": resolve_icon_types(floor, registry), "iconRegistryVersion": registry["version"]}
+
+def compute_icon_overrides(
+    icon_types: Dict[str, Any],
+    registry_types: Dict[str, Any],
+    previous_types: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """층의 아이콘 타입 중 레지스트리와 다른 항목만 추출
+
+    previous_types(저장 전 층에 적용되던 목록)에 있던 레지스트리 항목이 빠졌으면 삭제로 보고 None을 저장합니다.
+    클라이언트가 받은 적 없는 레지스트리 항목(새 층, 이후 추가된 아이콘)은 레지스트리를 따릅니다.
+    """
+    overrides = {
+        icon_id: info for icon_id, info in icon_types.items()
+        if registry_types.get(icon_id) != info
+    }
+    for icon_id in registry_types:
+        if icon_id not in icon_types and icon_id in (previous_types or {}):
+            overrides[icon_id] = None
+    return overrides
+
+def dedupe_floor_icons(
+    floor: Dict[str, Any],
+    registry: Optional[Dict[str, Any]] = None,
+    previous: Optional[Dict[str, Any]] = None
+) -> bool:
+    """층에 포함된 iconTypes 전체 목록을 레지스트리 참조 + 변경분으로 변환 (iconTypes를 변환했으면 True)
+
+    레지스트리 버전만 바뀐 층은 변경으로 보지 않습니다 (조회 시 현재 레지스트리로 다시 계산).
+    """
+    registry = registry or get_icon_registry()
+    if "iconTypes" not in floor:
+        floor.setdefault("iconOverrides", {})
+        floor.setdefault("iconRegistryVersion", registry["version"])
+        return False
+    # iconTypes는 층에 적용되는 전체 목록이므로 기존 변경분을 대체
+    previous_types = resolve_icon_types(previous, registry) if previous is not None else None
+    floor["iconOverrides"] = compute_icon_overrides(floor.pop("iconTypes") or {}, registry["iconTypes"], previous_types)
+    floor["iconRegistryVersion"] = registry["version"]
+    return True
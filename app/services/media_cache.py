@@ -0,0 +1,165 @@
+"""미디어 파일 앞부분(hot range) 메모리 캐시 서비스"""
+import asyncio
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from app.config.settings import MEDIA_CACHE_CONFIG
+
+
+class _CacheEntry:
+    """캐시된 파일 앞부분"""
+    def __init__(self, mtime_ns: int, size: int, head: bytes):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.head = head
+
+
+class HotRangeCache:
+    """자주 반복 재생되는 파일의 앞부분 N바이트를 LRU로 보관
+
+    키오스크가 같은 영상을 반복 재생할 때 루프 재시작 구간을 디스크 대신
+    메모리에서 바로 응답하기 위한 용도입니다.
+    """
+    def __init__(self, head_bytes: int, max_bytes: int):
+        self.head_bytes = head_bytes
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _record(self, key: str, hit: bool, served: int = 0):
+        """파일별 적중 통계 기록"""
+        stats = self._stats.setdefault(key, {"hits": 0, "misses": 0, "bytesFromCache": 0})
+        if hit:
+            stats["hits"] += 1
+            stats["bytesFromCache"] += served
+        else:
+            stats["misses"] += 1
+
+    def _evict(self, key: str):
+        """캐시 항목 제거"""
+        entry = self._entries.pop(key, None)
+        if entry:
+            self.current_bytes -= len(entry.head)
+
+    def _lookup(self, key: str, mtime_ns: int, size: int) -> Optional[bytes]:
+        """유효한 캐시 항목 조회 (파일이 바뀌었으면 폐기)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.mtime_ns != mtime_ns or entry.size != size:
+            self._evict(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.head
+
+    def _store(self, key: str, mtime_ns: int, size: int, head: bytes):
+        """캐시 항목 저장 후 상한을 넘으면 오래된 항목부터 제거"""
+        if len(head) > self.max_bytes:
+            return
+        self._evict(key)
+        self._entries[key] = _CacheEntry(mtime_ns, size, head)
+        self.current_bytes += len(head)
+        while self.current_bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._evict(oldest_key)
+
+    async def get_head(self, file_path: Path, mtime_ns: int, size: int, start: int) -> Optional[bytes]:
+        """요청 구간 시작점이 캐시 범위에 있으면 파일 앞부분 반환
+
+        캐시에 없으면 앞부분을 읽어 저장하고, 이번 요청은 miss로 기록합니다.
+        """
+        key = str(file_path)
+        head_len = min(size, self.head_bytes)
+        if head_len <= 0 or start >= head_len:
+            # 앞부분 밖의 구간은 캐시 대상이 아님
+            return None
+
+        head = self._lookup(key, mtime_ns, size)
+        if head is not None:
+            self._record(key, hit=True, served=len(head) - start)
+            return head
+
+        self._record(key, hit=False)
+        head = await asyncio.to_thread(_read_head, file_path, head_len)
+        if len(head) == head_len:
+            self._store(key, mtime_ns, size, head)
+        return head
+
+    def invalidate(self, file_path: Path):
+        """특정 파일 캐시 무효화 (삭제/교체 시)"""
+        self._evict(str(file_path))
+
+    def get_stats(self) -> Dict[str, object]:
+        """캐시 상태 및 파일별 적중률 반환"""
+        files = []
+        for key, stats in self._stats.items():
+            total = stats["hits"] + stats["misses"]
+            files.append({
+                "path": key,
+                "cached": key in self._entries,
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "hitRate": round(stats["hits"] / total, 4) if total else 0.0,
+                "bytesFromCache": stats["bytesFromCache"],
+            })
+        files.sort(key=lambda x: x["hits"] + x["misses"], reverse=True)
+        return {
+            "headBytes": self.head_bytes,
+            "maxBytes": self.max_bytes,
+            "currentBytes": self.current_bytes,
+            "cachedFiles": len(self._entries),
+            "files": files,
+        }
+
+
+def _read_head(file_path: Path, length: int) -> bytes:
+    """파일 앞부분 읽기"""
+    with open(file_path, "rb") as f:
+        return f.read(length)
+
+
+def parse_range_header(range_header: str, file_size: int) -> Tuple[str, Optional[Tuple[int, int]]]:
+    """Range 헤더 해석
+
+    Returns:
+        ("none", None): Range 없음 또는 bytes 단위가 아님 → 전체 응답
+        ("ok", (start, end)): 단일 구간 (end 포함)
+        ("multi", None): 다중 구간 요청 (지원하지 않음)
+        ("invalid", None): 만족할 수 없는 구간
+    """
+    if not range_header:
+        return "none", None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return "none", None
+    if "," in spec:
+        return "multi", None
+
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep:
+        return "invalid", None
+    try:
+        if start_str == "":
+            # bytes=-N : 마지막 N바이트
+            suffix = int(end_str)
+            if suffix <= 0 or file_size == 0:
+                return "invalid", None
+            start = max(file_size - suffix, 0)
+            end = file_size - 1
+        else:
+            start = int(start_str)
+            end = int(end_str) if end_str else file_size - 1
+    except ValueError:
+        return "invalid", None
+
+    if start < 0 or start >= file_size or end < start:
+        return "invalid", None
+    return "ok", (start, min(end, file_size - 1))
+
+
+# 전역 캐시 인스턴스
+media_cache = HotRangeCache(
+    head_bytes=MEDIA_CACHE_CONFIG["head_bytes"],
+    max_bytes=MEDIA_CACHE_CONFIG["max_bytes"],
+)
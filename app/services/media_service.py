@@ -1,16 +1,25 @@
 """미디어 콘텐츠 관리 서비스"""
+import itertools
 from pathlib import Path
 from typing import Literal, List, Dict, Any, Optional
 from app.config.paths import (
     DASHBOARD_MEDIA_DIR, PR_MEDIA_DIR,
     DASHBOARD_METADATA_FILE, PR_METADATA_FILE
 )
-from app.utils.json_utils import load_json_file, save_json_file
+from app.services.content_store import content_store
 from app.utils.datetime_utils import get_timestamp
+from app.utils.lock_utils import KeyedLockManager
 from app.config.constants import ALLOWED_IMAGE_EXTENSIONS
 
 ImageType = Literal["dashboard", "pr"]
 
+# 읽기-수정-저장 구간 직렬화 (미디어 타입별 설정 파일 단위)
+media_locks = KeyedLockManager("media_writes")
+
+def media_lock(image_type: ImageType):
+    """미디어 설정 수정 구간 잠금 (async with로 사용)"""
+    return media_locks.hold(f"media:{image_type}")
+
 def get_media_dir(image_type: ImageType) -> Path:
     """미디어 디렉토리 경로 반환"""
     return DASHBOARD_MEDIA_DIR if image_type == "dashboard" else PR_MEDIA_DIR
@@ -19,19 +28,122 @@ def get_metadata_file(image_type: ImageType) -> Path:
     """메타데이터 파일 경로 반환"""
     return DASHBOARD_METADATA_FILE if image_type == "dashboard" else PR_METADATA_FILE
 
+# 미디어 타입별 메모리 캐시: 설정, 저장소 변경 토큰, id→images 목록 위치 인덱스
+_media_cache: Dict[str, Dict[str, Any]] = {}
+# 캐시가 갱신될 때마다 증가하는 버전 (재생목록 등 파생 데이터 무효화용)
+_media_version_counter = itertools.count(1)
+
+def _set_cache(image_type: ImageType, config: Dict[str, Any]):
+    """캐시 및 id 인덱스 갱신"""
+    _media_cache[image_type] = {
+        "storeVersion": content_store.media_version(image_type),
+        "config": config,
+        "positions": {img["id"]: position for position, img in enumerate(config.get("images", []))},
+        "version": next(_media_version_counter),
+    }
+
+def migrate_media_config(config: Dict[str, Any]) -> bool:
+    """기존 설정을 고정 ID 형식으로 변환
+
+    이전 버전은 삭제할 때마다 ID를 재정렬했으므로 nextId가 없습니다.
+    현재 ID는 그대로 유지하고, 중복/누락된 ID만 새로 할당한 뒤 nextId를 기록합니다.
+    변경 사항이 있으면 True를 반환합니다.
+    """
+    images = config.setdefault("images", [])
+    changed = False
+    seen = set()
+    needs_id = []
+    for img in images:
+        image_id = img.get("id")
+        if isinstance(image_id, int) and image_id > 0 and image_id not in seen:
+            seen.add(image_id)
+        else:
+            needs_id.append(img)
+
+    next_id = max(seen, default=0) + 1
+    if isinstance(config.get("nextId"), int):
+        next_id = max(next_id, config["nextId"])
+    for img in needs_id:
+        img["id"] = next_id
+        next_id += 1
+        changed = True
+
+    if config.get("nextId") != next_id:
+        config["nextId"] = next_id
+        changed = True
+    return changed
+
+def allocate_media_id(config: Dict[str, Any]) -> int:
+    """새 미디어 ID 할당 (삭제된 ID는 재사용하지 않음)"""
+    if "nextId" not in config:
+        migrate_media_config(config)
+    image_id = config["nextId"]
+    config["nextId"] = image_id + 1
+    return image_id
+
 def load_media_config(image_type: ImageType) -> Dict[str, Any]:
-    """미디어 설정 파일 로드"""
-    config_file = get_metadata_file(image_type)
-    config = load_json_file(config_file)
-    return config if config else {"images": []}
+    """미디어 설정 로드 (저장소의 설정이 바뀐 경우에만 다시 읽음)
+
+    반환된 설정은 캐시와 공유되므로 수정하지 않습니다. 수정할 때는 edit_media_config 사본을 사용합니다.
+    """
+    cached = _media_cache.get(image_type)
+    store_version = content_store.media_version(image_type)
+    if cached and cached["storeVersion"] == store_version:
+        return cached["config"]
+
+    config = content_store.load_media(image_type)
+    if config is None:
+        config = {"images": []}
+    if migrate_media_config(config) and store_version is not None:
+        save_media_config(image_type, config)
+    else:
+        _set_cache(image_type, config)
+    return config
+
+def edit_media_config(image_type: ImageType) -> Dict[str, Any]:
+    """수정용 설정 사본 (항목까지 복사, save_media_config로 저장에 성공해야 캐시가 사본으로 교체됨)"""
+    config = load_media_config(image_type)
+    return {**config, "images": [dict(img) for img in config.get("images", [])]}
 
 def save_media_config(image_type: ImageType, data: Dict[str, Any]):
-    """미디어 설정 파일 저장"""
-    config_file = get_metadata_file(image_type)
-    save_json_file(config_file, data)
+    """미디어 설정 저장 (저장할 때마다 revision 1 증가, 저장소에 저장한 뒤 캐시 교체)"""
+    data["revision"] = data.get("revision", 0) + 1
+    content_store.save_media(image_type, data)
+    _set_cache(image_type, data)
+
+def get_media_revision(image_type: ImageType) -> int:
+    """미디어 설정 revision 조회 (설정이 바뀌지 않았으면 다시 읽지 않음)"""
+    return load_media_config(image_type).get("revision", 0)
+
+def get_media_version(image_type: ImageType) -> int:
+    """미디어 설정 변경 감지용 버전 (저장 또는 저장소의 설정 변경 시 증가)"""
+    load_media_config(image_type)
+    return _media_cache[image_type]["version"]
+
+def get_media_item(image_type: ImageType, image_id: int) -> Optional[Dict[str, Any]]:
+    """ID로 미디어 항목 조회 (인덱스 사용, 캐시와 공유되므로 수정하지 않음)"""
+    load_media_config(image_type)
+    cached = _media_cache[image_type]
+    position = cached["positions"].get(image_id)
+    return None if position is None else cached["config"]["images"][position]
+
+def find_media_position(image_type: ImageType, config: Dict[str, Any], image_id: int) -> Optional[int]:
+    """edit_media_config 사본의 images에서 ID 위치 조회 (없으면 None)
+
+    사본은 캐시와 항목 순서가 같으므로 목록을 탐색하지 않고 캐시 인덱스를 사용합니다.
+    사본을 만든 뒤 목록이 바뀌어 위치가 맞지 않을 때만 목록을 탐색합니다.
+    """
+    load_media_config(image_type)
+    position = _media_cache[image_type]["positions"].get(image_id)
+    if position is None:
+        return None
+    images = config.get("images", [])
+    if position < len(images) and images[position].get("id") == image_id:
+        return position
+    return next((index for index, img in enumerate(images) if img.get("id") == image_id), None)
 
 def scan_media_files(image_type: ImageType) -> Dict[str, Any]:
-    """미디어 폴더를 스캔하여 설정 파일 동기화"""
+    """미디어 폴더를 스캔하여 설정 파일 동기화 (바뀐 것이 없으면 캐시된 설정 반환)"""
     config = load_media_config(image_type)
     existing_files = {img["filename"] for img in config.get("images", [])}
     
@@ -40,37 +152,48 @@ def scan_media_files(image_type: ImageType) -> Dict[str, Any]:
     
     # 폴더에서 이미지 파일 스캔
     if media_dir.exists():
+        actual_files = {f.name for f in media_dir.iterdir() if f.is_file()}
+        new_files = any(
+            Path(name).suffix.lower() in ALLOWED_IMAGE_EXTENSIONS and name not in existing_files
+            for name in actual_files
+        )
+        if not new_files and existing_files <= actual_files \
+                and all("name" in img for img in config.get("images", [])):
+            return config
+
+        config = edit_media_config(image_type)
+        changed = False
         for file_path in sorted(media_dir.iterdir()):
             if file_path.is_file() and file_path.suffix.lower() in ALLOWED_IMAGE_EXTENSIONS:
                 if file_path.name not in existing_files:
                     # 새 이미지 발견
                     default_name = get_timestamp()  # 기본 이름: 날짜+시간
                     new_image = {
-                        "id": len(config.get("images", [])) + 1,
+                        "id": allocate_media_id(config),
                         "filename": file_path.name,
                         "path": f"{image_path_prefix}/{file_path.name}",
                         "name": default_name,
                         "order": len(config.get("images", [])) + 1,
                         "created_at": get_timestamp()
                     }
-                    if "images" not in config:
-                        config["images"] = []
                     config["images"].append(new_image)
+                    changed = True
         
         # 삭제된 파일 제거
-        actual_files = {f.name for f in media_dir.iterdir() if f.is_file()}
-        config["images"] = [img for img in config.get("images", []) if img["filename"] in actual_files]
+        remaining = [img for img in config.get("images", []) if img["filename"] in actual_files]
+        if len(remaining) != len(config.get("images", [])):
+            config["images"] = remaining
+            changed = True
         
         # 기존 이미지에 name 필드가 없으면 추가
         for img in config.get("images", []):
             if "name" not in img:
                 img["name"] = img.get("created_at", get_timestamp())
+                changed = True
         
-        # ID 재정렬
-        for i, img in enumerate(config.get("images", []), 1):
-            img["id"] = i
-        
-        save_media_config(image_type, config)
+        # ID는 고정이므로 재정렬하지 않음 (순서는 order 필드로만 관리)
+        if changed:
+            save_media_config(image_type, config)
     
     return config
 
@@ -81,12 +204,12 @@ def get_media_list(image_type: ImageType) -> List[Dict[str, Any]]:
 
 def add_media_item(image_type: ImageType, filename: str, order: Optional[int] = None) -> Dict[str, Any]:
     """미디어 항목 추가"""
-    config = load_media_config(image_type)
+    config = edit_media_config(image_type)
     image_path_prefix = f"media/dashboard" if image_type == "dashboard" else "media/pr"
     default_name = get_timestamp()  # 기본 이름: 날짜+시간
     
     new_image = {
-        "id": len(config.get("images", [])) + 1,
+        "id": allocate_media_id(config),
         "filename": filename,
         "path": f"{image_path_prefix}/{filename}",
         "name": default_name,
@@ -94,8 +217,6 @@ def add_media_item(image_type: ImageType, filename: str, order: Optional[int] =
         "created_at": get_timestamp()
     }
     
-    if "images" not in config:
-        config["images"] = []
     config["images"].append(new_image)
     save_media_config(image_type, config)
     
@@ -103,42 +224,31 @@ def add_media_item(image_type: ImageType, filename: str, order: Optional[int] =
 
 def remove_media_item(image_type: ImageType, image_id: int) -> bool:
     """미디어 항목 삭제"""
-    config = load_media_config(image_type)
+    config = edit_media_config(image_type)
+    position = find_media_position(image_type, config, image_id)
     
-    image_to_delete = None
-    for img in config.get("images", []):
-        if img["id"] == image_id:
-            image_to_delete = img
-            break
-    
-    if not image_to_delete:
+    if position is None:
         return False
     
     # 파일 삭제
     media_dir = get_media_dir(image_type)
-    file_path = media_dir / image_to_delete["filename"]
+    file_path = media_dir / config["images"][position]["filename"]
     if file_path.exists():
         file_path.unlink()
     
-    # 설정에서 제거
-    config["images"] = [img for img in config.get("images", []) if img["id"] != image_id]
-    
-    # ID 재정렬
-    for i, img in enumerate(config.get("images", []), 1):
-        img["id"] = i
-    
+    # 설정에서 제거 (다른 항목의 ID는 유지, 인덱스의 위치로 바로 삭제)
+    del config["images"][position]
     save_media_config(image_type, config)
     return True
 
 def update_media_order(image_type: ImageType, image_id: int, order: int) -> bool:
     """미디어 순서 업데이트"""
-    config = load_media_config(image_type)
-    
-    for img in config.get("images", []):
-        if img["id"] == image_id:
-            img["order"] = order
-            save_media_config(image_type, config)
-            return True
+    config = edit_media_config(image_type)
+    position = find_media_position(image_type, config, image_id)
+    if position is None:
+        return False
     
-    return False
+    config["images"][position]["order"] = order
+    save_media_config(image_type, config)
+    return True
 
@@ -0,0 +1,97 @@
+"""슬라이드 재생목록(playlist) 관리 서비스"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from app.config.settings import PLAYLIST_CONFIG
+from app.config.constants import SLIDE_MODE_NORMAL
+from app.services.media_service import (
+    ImageType, get_media_dir, load_media_config, get_media_version
+)
+from app.utils.datetime_utils import get_timestamp
+from app.utils.video_utils import is_video_file, get_video_duration
+
+# (타입, 모드) → 컴파일된 재생목록 캐시
+_playlist_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+# 파일 경로 → (mtime, size, 해시, 재생 시간) 캐시
+_file_info_cache: Dict[str, Tuple[int, int, str, Optional[float]]] = {}
+
+def _get_file_info(file_path: Path) -> Optional[Tuple[int, str, Optional[float]]]:
+    """파일 크기, 콘텐츠 해시, 재생 시간 반환 (파일이 바뀌지 않았으면 캐시 사용)"""
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        return None
+
+    key = str(file_path)
+    cached = _file_info_cache.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[1], cached[2], cached[3]
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    content_hash = digest.hexdigest()[:16]
+    duration = get_video_duration(file_path) if is_video_file(file_path) else None
+
+    _file_info_cache[key] = (stat.st_mtime_ns, stat.st_size, content_hash, duration)
+    return stat.st_size, content_hash, duration
+
+def build_playlist(image_type: ImageType, mode: str = SLIDE_MODE_NORMAL) -> Dict[str, Any]:
+    """재생목록 생성 (order 순 정렬, 파일 정보 및 prefetch 권장 범위 포함)"""
+    config = load_media_config(image_type)
+    media_dir = get_media_dir(image_type)
+    window_config = PLAYLIST_CONFIG["prefetch_window"]
+    window = window_config.get(mode, window_config.get(SLIDE_MODE_NORMAL, 1))
+
+    items = []
+    for img in sorted(config.get("images", []), key=lambda x: (x.get("order", 0), x["id"])):
+        file_path = media_dir / img["filename"]
+        info = _get_file_info(file_path)
+        if info is None:
+            continue
+        size, content_hash, duration = info
+        items.append({
+            "id": img["id"],
+            "name": img.get("name"),
+            "url": img["path"],
+            "size": size,
+            "hash": content_hash,
+            "duration": duration if is_video_file(file_path) else PLAYLIST_CONFIG["image_duration"],
+            "placeholder": img.get("placeholder"),
+        })
+
+    return {
+        "type": image_type,
+        "mode": mode,
+        "generatedAt": get_timestamp(),
+        "totalBytes": sum(item["size"] for item in items),
+        "prefetch": {
+            "window": window,
+            "initial": [item["url"] for item in items[:window]],
+        },
+        "items": items,
+    }
+
+def get_playlist(image_type: ImageType, mode: str = SLIDE_MODE_NORMAL) -> Dict[str, Any]:
+    """캐시된 재생목록 반환 (미디어 설정이 바뀐 경우에만 다시 생성)
+
+    반환값의 body는 직렬화된 응답 본문, etag는 본문 해시입니다.
+    """
+    version = get_media_version(image_type)
+    key = (image_type, mode)
+    cached = _playlist_cache.get(key)
+    if cached and cached["version"] == version:
+        return cached
+
+    playlist = build_playlist(image_type, mode)
+    body = json.dumps({"code": 200, "data": playlist}, ensure_ascii=False).encode("utf-8")
+    cached = {
+        "version": version,
+        "playlist": playlist,
+        "body": body,
+        "etag": f'"{hashlib.sha256(body).hexdigest()[:16]}"',
+    }
+    _playlist_cache[key] = cached
+    return cached
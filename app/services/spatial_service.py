@@ -0,0 +1,115 @@
+"""층 요소 공간 질의 서비스 (영역 조회, 가까운 요소 조회)"""
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from app.config.settings import SPATIAL_INDEX_CONFIG
+from app.services.building_service import get_floor_revision, load_building_floor_json
+from app.utils.spatial_index import GridIndex, BBox, element_bounds
+
+# (건물 ID, 층 번호) → {revision, elements, index, typed} (최근 사용 순, revision이 바뀌면 다시 생성)
+_index_cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+_stats = {"hits": 0, "builds": 0}
+
+
+def _build_index(elements: List[Dict[str, Any]], element_type: Optional[str] = None) -> GridIndex:
+    """요소 목록으로 격자 인덱스 생성 (키는 elements 내 위치)"""
+    items = []
+    for position, element in enumerate(elements):
+        if element_type and element.get("type") != element_type:
+            continue
+        bounds = element_bounds(element)
+        if bounds is not None:
+            items.append((position, bounds))
+    return GridIndex(items, SPATIAL_INDEX_CONFIG["cell_size"])
+
+
+def _index_for(entry: Dict[str, Any], element_type: Optional[str]) -> GridIndex:
+    """타입 조건에 맞는 인덱스 (타입별 인덱스는 처음 요청될 때 생성)"""
+    if not element_type:
+        return entry["index"]
+    typed = entry["typed"]
+    if element_type not in typed:
+        typed[element_type] = _build_index(entry["elements"], element_type)
+    return typed[element_type]
+
+
+def get_floor_index(building_id: str, floor_number: int) -> Optional[Dict[str, Any]]:
+    """층의 공간 인덱스 조회 (revision이 같으면 floors.json을 다시 읽지 않음, 층이 없으면 None)"""
+    key = (building_id, floor_number)
+    revision = get_floor_revision(building_id, floor_number)
+    if revision is None:
+        _index_cache.pop(key, None)
+        return None
+
+    entry = _index_cache.get(key)
+    if entry is not None and entry["revision"] == revision:
+        _index_cache.move_to_end(key)
+        _stats["hits"] += 1
+        return entry
+
+    floor = load_building_floor_json(building_id, floor_number)
+    if floor is None:
+        return None
+    elements = floor.get("elements", [])
+    entry = {
+        "revision": floor.get("revision", 0),
+        "elements": elements,
+        "index": _build_index(elements),
+        "typed": {},
+    }
+    _stats["builds"] += 1
+    _index_cache[key] = entry
+    _index_cache.move_to_end(key)
+    while len(_index_cache) > SPATIAL_INDEX_CONFIG["max_floors"]:
+        _index_cache.popitem(last=False)
+    return entry
+
+
+def query_floor_elements(
+    building_id: str,
+    floor_number: int,
+    bbox: Optional[BBox] = None,
+    element_type: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """영역과 겹치는 층 요소 조회 (bbox가 없으면 전체, 층이 없으면 None)"""
+    entry = get_floor_index(building_id, floor_number)
+    if entry is None:
+        return None
+    elements = entry["elements"]
+    if bbox is None:
+        matched = [e for e in elements if not element_type or e.get("type") == element_type]
+    else:
+        matched = [elements[position] for position in _index_for(entry, element_type).query(bbox)]
+    return {"revision": entry["revision"], "elements": matched}
+
+
+def find_nearest_elements(
+    building_id: str,
+    floor_number: int,
+    x: float,
+    y: float,
+    limit: int = 1,
+    max_distance: Optional[float] = None,
+    element_type: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """점에서 가까운 층 요소 조회 (층이 없으면 None)"""
+    entry = get_floor_index(building_id, floor_number)
+    if entry is None:
+        return None
+    elements = entry["elements"]
+    candidates = _index_for(entry, element_type).nearest(x, y, limit, max_distance)
+    return {
+        "revision": entry["revision"],
+        "items": [
+            {"distance": round(distance, 2), "element": elements[position]}
+            for distance, position in candidates
+        ],
+    }
+
+
+def get_spatial_index_stats() -> Dict[str, Any]:
+    """공간 인덱스 캐시 통계"""
+    return {
+        "floors": len(_index_cache),
+        "elements": sum(len(entry["index"]) for entry in _index_cache.values()),
+        **_stats,
+    }
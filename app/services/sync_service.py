@@ -43,7 +43,8 @@ class SyncService:
                 "data": {
                     "version": self.client_registry.version,
                     "connectedClients": self.client_registry.get_client_count(),
-                    "clients": self.client_registry.get_all_clients()
+                    "clients": self.client_registry.get_all_clients(),
+                    "fanoutJobs": self.client_registry.get_fanout_jobs()
                 }
             }
     
@@ -70,8 +71,8 @@ class SyncService:
         }
     
     async def broadcast_sync(self) -> Dict[str, Any]:
-        """모든 클라이언트 강제 동기화"""
-        await self.client_registry.broadcast("command", {
+        """모든 클라이언트 강제 동기화 (배치 단위 분산 전송)"""
+        job = self.client_registry.broadcast_staggered("command", {
             "command": "force_sync",
             "targetClientId": "all",
             "params": {
@@ -81,6 +82,7 @@ class SyncService:
         
         return {
             "code": 200,
-            "message": "모든 클라이언트에 동기화 명령이 전송되었습니다."
+            "message": "모든 클라이언트에 동기화 명령 전송을 시작했습니다.",
+            "data": job
         }
 
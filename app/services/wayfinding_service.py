@@ -0,0 +1,362 @@
+"""길찾기 서비스 (층별 이동 그래프 + A* 최단 경로)
+
+각 층 데이터의 navigation 항목에 이동 가능한 노드와 간선을 저장합니다.
+
+    "navigation": {
+        "nodes": [{"id": "n1", "x": 100, "y": 200},
+                  {"id": "ev1", "x": 300, "y": 200, "kind": "elevator", "linkId": "EV-A"}],
+        "edges": [{"from": "n1", "to": "ev1"}]
+    }
+
+같은 linkId를 가진 다른 층의 노드는 엘리베이터/계단으로 연결됩니다.
+간선 비용은 weight가 없으면(null 포함) 두 노드 사이의 거리이며, weight 0도 그대로 사용합니다.
+음수 weight는 0으로 취급하고, 숫자가 아닌 weight가 있는 간선은 건너뜁니다.
+"""
+import heapq
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+from app.config.settings import WAYFINDING_CONFIG
+from app.services.building_service import (
+    load_building_json, load_building_floors_json, get_floor_revisions
+)
+from app.services.department_service import DEPARTMENTS_FILE, load_departments
+from app.utils.spatial_index import GridIndex, element_bounds, bbox_center
+
+NodeKey = Tuple[int, str]
+Point = Tuple[float, float]
+
+# 건물 ID → {key: 층 revision 목록, graph: NavGraph}
+_graph_cache: Dict[str, Dict[str, Any]] = {}
+# 요청 조건 + 층 revision → 경로 (최근 사용 순)
+_route_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "graphBuilds": 0}
+# 요청 스레드 간 캐시/통계 접근 보호 (그래프 생성, 경로 계산은 잠금 밖에서 수행)
+_cache_lock = threading.Lock()
+
+
+def parse_floor_number(floor_name: Any) -> Optional[int]:
+    """층 이름을 층 번호로 변환 ("2층" → 2, "B1층"/"지하1층" → -1)"""
+    if isinstance(floor_name, int):
+        return floor_name
+    match = re.search(r"(B|지하)?\s*(\d+)", str(floor_name or ""), re.IGNORECASE)
+    if not match:
+        return None
+    number = int(match.group(2))
+    return -number if match.group(1) else number
+
+
+def _distance(a: Point, b: Point) -> float:
+    """두 점 사이 거리"""
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def _edge_weight(weight: Any) -> Optional[float]:
+    """간선 weight를 비용으로 변환 (음수는 0, 숫자가 아니거나 유한하지 않으면 None)"""
+    if isinstance(weight, bool):
+        return None
+    try:
+        cost = float(weight)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(cost):
+        return None
+    return max(cost, 0.0)
+
+
+class NavGraph:
+    """건물 전체의 이동 그래프 (노드 키는 (층 번호, 노드 ID))"""
+    def __init__(self, floors: List[Dict[str, Any]]):
+        self.positions: Dict[NodeKey, Point] = {}
+        self.adjacency: Dict[NodeKey, List[Tuple[NodeKey, float, str]]] = {}
+        self.floors: Dict[int, Dict[str, Any]] = {}
+        self.node_index: Dict[int, Tuple[List[NodeKey], GridIndex]] = {}
+        # 거리보다 작은 weight가 있는 층 (직선 거리 휴리스틱을 쓰면 최단 경로를 놓칠 수 있음)
+        self.shortcut_floors: Set[int] = set()
+        links: Dict[str, List[Tuple[NodeKey, str]]] = {}
+
+        for floor in floors:
+            floor_number = floor.get("floor")
+            self.floors[floor_number] = floor
+            navigation = floor.get("navigation") or {}
+            for node in navigation.get("nodes", []):
+                try:
+                    key = (floor_number, str(node["id"]))
+                    self.positions[key] = (float(node["x"]), float(node["y"]))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self.adjacency.setdefault(key, [])
+                if node.get("linkId"):
+                    links.setdefault(str(node["linkId"]), []).append((key, node.get("kind", "stairs")))
+
+            for edge in navigation.get("edges", []):
+                a = (floor_number, str(edge.get("from")))
+                b = (floor_number, str(edge.get("to")))
+                if a not in self.positions or b not in self.positions:
+                    continue
+                weight = edge.get("weight")
+                length = _distance(self.positions[a], self.positions[b])
+                cost = _edge_weight(weight) if weight is not None else length
+                if cost is None:
+                    continue
+                if cost < length:
+                    self.shortcut_floors.add(floor_number)
+                self.adjacency[a].append((b, cost, "walk"))
+                if not edge.get("oneWay"):
+                    self.adjacency[b].append((a, cost, "walk"))
+
+        # 같은 linkId의 다른 층 노드끼리 연결
+        for members in links.values():
+            for a, kind in members:
+                for b, _ in members:
+                    if a[0] == b[0]:
+                        continue
+                    floors_moved = abs(a[0] - b[0])
+                    if kind == "elevator":
+                        cost = WAYFINDING_CONFIG["elevator_cost"] + WAYFINDING_CONFIG["elevator_cost_per_floor"] * floors_moved
+                    else:
+                        kind = "stairs"
+                        cost = WAYFINDING_CONFIG["stairs_cost_per_floor"] * floors_moved
+                    self.adjacency[a].append((b, cost, kind))
+
+        # 층별 노드 위치 인덱스 (출발/도착 지점에서 가까운 노드 조회용)
+        by_floor: Dict[int, List[NodeKey]] = {}
+        for key in self.positions:
+            by_floor.setdefault(key[0], []).append(key)
+        for floor_number, keys in by_floor.items():
+            items = [(i, (*self.positions[k], *self.positions[k])) for i, k in enumerate(keys)]
+            self.node_index[floor_number] = (keys, GridIndex(items))
+
+    def nearest_nodes(self, floor_number: int, point: Point, limit: int) -> List[Tuple[NodeKey, float]]:
+        """층에서 지점과 가까운 노드 (노드 키, 거리) 목록"""
+        if floor_number not in self.node_index:
+            return []
+        keys, index = self.node_index[floor_number]
+        return [(keys[i], distance) for distance, i in index.nearest(point[0], point[1], limit)]
+
+    def shortest_path(
+        self,
+        starts: List[Tuple[NodeKey, float]],
+        goals: Dict[NodeKey, float],
+        goal_floor: int,
+        goal_point: Point,
+        accessible: bool = False
+    ) -> Optional[Tuple[float, List[NodeKey], List[str]]]:
+        """A* 최단 경로 (총 비용, 노드 목록, 노드 사이 이동 수단 목록)
+
+        휴리스틱은 목적지와 같은 층에서만 직선 거리를 사용합니다 (층마다 좌표계가 다를 수 있음).
+        목적지 층에 거리보다 작은 weight가 있으면 휴리스틱을 쓰지 않습니다.
+        accessible이면 계단 연결을 사용하지 않습니다.
+        """
+        use_heuristic = goal_floor not in self.shortcut_floors
+
+        def heuristic(key: NodeKey) -> float:
+            return _distance(self.positions[key], goal_point) if use_heuristic and key[0] == goal_floor else 0.0
+
+        best: Dict[Any, float] = {}
+        came_from: Dict[Any, Tuple[Optional[NodeKey], str]] = {}
+        heap: List[Tuple[float, float, int, Any]] = []
+        counter = 0
+        for key, cost in starts:
+            if cost < best.get(key, math.inf):
+                best[key] = cost
+                came_from[key] = (None, "walk")
+                heapq.heappush(heap, (cost + heuristic(key), cost, counter, key))
+                counter += 1
+
+        goal = ("goal",)
+        while heap:
+            _, cost, _, key = heapq.heappop(heap)
+            if key == goal:
+                break
+            if cost > best.get(key, math.inf):
+                continue
+            if key in goals:
+                total = cost + goals[key]
+                if total < best.get(goal, math.inf):
+                    best[goal] = total
+                    came_from[goal] = (key, "walk")
+                    heapq.heappush(heap, (total, total, counter, goal))
+                    counter += 1
+            for neighbor, step, kind in self.adjacency.get(key, ()):
+                if accessible and kind == "stairs":
+                    continue
+                new_cost = cost + step
+                if new_cost < best.get(neighbor, math.inf):
+                    best[neighbor] = new_cost
+                    came_from[neighbor] = (key, kind)
+                    heapq.heappush(heap, (new_cost + heuristic(neighbor), new_cost, counter, neighbor))
+                    counter += 1
+
+        if goal not in came_from:
+            return None
+        path: List[NodeKey] = []
+        modes: List[str] = []
+        key = came_from[goal][0]
+        while key is not None:
+            path.append(key)
+            previous, mode = came_from[key]
+            if previous is not None:
+                modes.append(mode)
+            key = previous
+        path.reverse()
+        modes.reverse()
+        return best[goal], path, modes
+
+
+def get_nav_graph(building_id: str) -> Tuple[Tuple, NavGraph]:
+    """건물 이동 그래프 조회 (층 revision이 같으면 다시 만들지 않음)"""
+    revisions = tuple(sorted(get_floor_revisions(building_id).items()))
+    with _cache_lock:
+        cached = _graph_cache.get(building_id)
+    if cached and cached["key"] == revisions:
+        return revisions, cached["graph"]
+    graph = NavGraph(load_building_floors_json(building_id))
+    with _cache_lock:
+        _stats["graphBuilds"] += 1
+        _graph_cache[building_id] = {"key": revisions, "graph": graph}
+    return revisions, graph
+
+
+def _departments_mtime() -> Optional[int]:
+    """부서 파일 수정 시각 (부서 기준 경로 캐시 무효화용)"""
+    try:
+        return DEPARTMENTS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _find_element(graph: NavGraph, floor_number: Optional[int], match) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """조건에 맞는 요소 검색 (층 번호가 있으면 그 층을 먼저 확인)"""
+    floor_numbers = list(graph.floors)
+    if floor_number in graph.floors:
+        floor_numbers.remove(floor_number)
+        floor_numbers.insert(0, floor_number)
+    for number in floor_numbers:
+        for element in graph.floors[number].get("elements", []):
+            if match(element) and element_bounds(element) is not None:
+                return number, element
+    return None
+
+
+def _resolve_department(building_id: str, graph: NavGraph, name: str) -> Tuple[int, Dict[str, Any]]:
+    """부서 이름으로 목적지 요소 검색 (부서 데이터의 층 정보 우선)"""
+    building = load_building_json(building_id) or {}
+    floor_hint = None
+    for department in load_departments():
+        if name in (department.get("department"), department.get("team")):
+            if not department.get("building") or department.get("building") == building.get("name"):
+                floor_hint = parse_floor_number(department.get("floor"))
+                break
+    found = _find_element(graph, floor_hint, lambda e: e.get("type") == "text" and str(e.get("text", "")).strip() == name)
+    if found is None:
+        raise LookupError(f"부서 위치를 찾을 수 없습니다: {name}")
+    return found
+
+
+def _start_point(graph: NavGraph, floor_number: int, x: Optional[float], y: Optional[float]) -> Point:
+    """출발 지점 (좌표가 없으면 층의 현위치)"""
+    if x is not None and y is not None:
+        if not (math.isfinite(x) and math.isfinite(y)):
+            raise ValueError("출발 좌표가 올바르지 않습니다.")
+        return x, y
+    floor = graph.floors.get(floor_number)
+    if floor is None:
+        raise LookupError(f"{floor_number}층을 찾을 수 없습니다.")
+    bounds = element_bounds(floor.get("currentLocation") or {})
+    if bounds is None:
+        raise ValueError(f"{floor_number}층에 현위치가 설정되어 있지 않습니다.")
+    return bbox_center(bounds)
+
+
+def find_route(
+    building_id: str,
+    from_floor: int,
+    from_x: Optional[float] = None,
+    from_y: Optional[float] = None,
+    to_element: Optional[str] = None,
+    to_floor: Optional[int] = None,
+    department: Optional[str] = None,
+    accessible: bool = False
+) -> Dict[str, Any]:
+    """현위치(또는 지정 좌표)에서 요소/부서까지의 경로 조회
+
+    결과는 층 revision과 요청 조건으로 캐시되어, 같은 경로는 다시 계산하지 않습니다.
+    건물/층/목적지를 찾을 수 없으면 LookupError, 요청이 잘못되면 ValueError를 발생시킵니다.
+    """
+    if not to_element and not department:
+        raise ValueError("목적지(toElement 또는 department)를 지정해야 합니다.")
+    if load_building_json(building_id) is None:
+        raise LookupError("건물을 찾을 수 없습니다.")
+
+    revisions, graph = get_nav_graph(building_id)
+    destination_key = ("department", department, _departments_mtime()) if department else ("element", to_floor, to_element)
+    cache_key = (building_id, revisions, from_floor, from_x, from_y, destination_key, accessible)
+    with _cache_lock:
+        cached = _route_cache.get(cache_key)
+        if cached is not None:
+            _route_cache.move_to_end(cache_key)
+            _stats["hits"] += 1
+        else:
+            _stats["misses"] += 1
+    if cached is not None:
+        return {**cached, "cached": True}
+
+    start = _start_point(graph, from_floor, from_x, from_y)
+    if department:
+        goal_floor, element = _resolve_department(building_id, graph, department)
+    else:
+        found = _find_element(graph, to_floor, lambda e: e.get("id") == to_element)
+        if found is None or (to_floor is not None and found[0] != to_floor):
+            raise LookupError(f"요소를 찾을 수 없습니다: {to_element}")
+        goal_floor, element = found
+    goal = bbox_center(element_bounds(element))
+
+    attach = WAYFINDING_CONFIG["attach_nodes"]
+    starts = graph.nearest_nodes(from_floor, start, attach)
+    goals = dict(graph.nearest_nodes(goal_floor, goal, attach))
+    result = graph.shortest_path(starts, goals, goal_floor, goal, accessible) if starts and goals else None
+
+    if result is None:
+        if from_floor != goal_floor:
+            raise LookupError("목적지까지 연결된 이동 경로가 없습니다.")
+        # 같은 층에 이동 그래프가 없으면 직선 경로
+        total, path, modes = _distance(start, goal), [], []
+    else:
+        total, path, modes = result
+
+    # 층별 구간과 층 이동 정보 구성
+    segments = [{"floor": from_floor, "points": [list(start)]}]
+    transitions = []
+    for index, key in enumerate(path):
+        if key[0] != segments[-1]["floor"]:
+            transitions.append({
+                "fromFloor": segments[-1]["floor"],
+                "toFloor": key[0],
+                "via": modes[index - 1] if index > 0 else "walk",
+            })
+            segments.append({"floor": key[0], "points": []})
+        segments[-1]["points"].append(list(graph.positions[key]))
+    segments[-1]["points"].append(list(goal))
+
+    route = {
+        "buildingId": building_id,
+        "distance": round(total, 2),
+        "destination": {"floor": goal_floor, "element": element},
+        "segments": segments,
+        "transitions": transitions,
+        "revisions": {str(floor): revision for floor, revision in revisions},
+    }
+    with _cache_lock:
+        _route_cache[cache_key] = route
+        while len(_route_cache) > WAYFINDING_CONFIG["route_cache_size"]:
+            _route_cache.popitem(last=False)
+    return {**route, "cached": False}
+
+
+def get_wayfinding_stats() -> Dict[str, Any]:
+    """경로 캐시 통계"""
+    with _cache_lock:
+        return {"routes": len(_route_cache), "graphs": len(_graph_cache), **_stats}
@@ -0,0 +1,125 @@
+"""층 요소 압축 표현 (타입별 열 단위 인코딩)
+
+요소 목록을 타입별 그룹으로 나누고, 그룹마다 키별 값 배열(열)로 저장합니다.
+
+    {"encoding": "columnar-v1", "count": 3, "groups": [
+        {"type": "icon", "positions": [0, 2],
+         "columns": {"id": ["a", "b"], "x": [10, 20], "iconType": [0, 0]},
+         "dictionaries": {"iconType": ["toilet"]}}
+    ]}
+
+positions는 원래 목록에서의 위치, absent는 해당 키가 없던 그룹 내 위치입니다.
+decode_elements(encode_elements(x)) == x 가 항상 성립합니다.
+"""
+from typing import Any, Dict, List, Optional
+
+ENCODING = "columnar-v1"
+COMPACT_MEDIA_TYPE = "application/vnd.viewo.compact+json"
+# 값 사전(인덱스)으로 저장하는 열
+DICTIONARY_COLUMNS = ("iconType",)
+
+
+def wants_compact(format: Optional[str] = None, accept: Optional[str] = None) -> bool:
+    """?format=compact 또는 Accept 헤더로 압축 표현을 요청했는지"""
+    if format:
+        return format == "compact"
+    return bool(accept) and COMPACT_MEDIA_TYPE in accept
+
+
+def _encode_group(elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """같은 타입 요소들을 열 단위로 변환"""
+    keys: List[str] = []
+    for element in elements:
+        for key in element:
+            if key != "type" and key not in keys:
+                keys.append(key)
+
+    columns: Dict[str, List[Any]] = {}
+    absent: Dict[str, List[int]] = {}
+    for key in keys:
+        values = []
+        for index, element in enumerate(elements):
+            if key in element:
+                values.append(element[key])
+            else:
+                # 없는 키는 null로 채우고 위치를 따로 기록 (값이 null인 경우와 구분)
+                values.append(None)
+                absent.setdefault(key, []).append(index)
+        columns[key] = values
+
+    group: Dict[str, Any] = {"columns": columns}
+    if absent:
+        group["absent"] = absent
+
+    dictionaries = {}
+    for key in DICTIONARY_COLUMNS:
+        values = columns.get(key)
+        if not values or not all(isinstance(v, str) for i, v in enumerate(values) if i not in absent.get(key, ())):
+            continue
+        lookup: Dict[str, int] = {}
+        encoded = []
+        for index, value in enumerate(values):
+            if index in absent.get(key, ()):
+                encoded.append(None)
+            else:
+                encoded.append(lookup.setdefault(value, len(lookup)))
+        columns[key] = encoded
+        dictionaries[key] = list(lookup)
+    if dictionaries:
+        group["dictionaries"] = dictionaries
+    return group
+
+
+def encode_elements(elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """요소 목록을 압축 표현으로 변환 (원본은 수정하지 않음)"""
+    grouped: Dict[Any, List[int]] = {}
+    for position, element in enumerate(elements):
+        # type 키가 없는 요소는 별도 그룹 (type이 null인 요소와 구분)
+        group_key = ("type", element["type"]) if "type" in element else ("none",)
+        grouped.setdefault(group_key, []).append(position)
+
+    groups = []
+    for group_key, positions in grouped.items():
+        group = {"positions": positions, **_encode_group([elements[p] for p in positions])}
+        if group_key[0] == "type":
+            group = {"type": group_key[1], **group}
+        groups.append(group)
+    return {"encoding": ENCODING, "count": len(elements), "groups": groups}
+
+
+def decode_elements(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """압축 표현을 요소 목록으로 복원"""
+    if payload.get("encoding") != ENCODING:
+        raise ValueError(f"지원하지 않는 요소 인코딩입니다: {payload.get('encoding')}")
+    elements: List[Optional[Dict[str, Any]]] = [None] * payload["count"]
+    for group in payload["groups"]:
+        columns = group["columns"]
+        absent = {key: set(indexes) for key, indexes in group.get("absent", {}).items()}
+        dictionaries = group.get("dictionaries", {})
+        for index, position in enumerate(group["positions"]):
+            element: Dict[str, Any] = {}
+            if "type" in group:
+                element["type"] = group["type"]
+            for key, values in columns.items():
+                if index in absent.get(key, ()):
+                    continue
+                value = values[index]
+                if key in dictionaries:
+                    value = dictionaries[key][value]
+                element[key] = value
+            elements[position] = element
+    return elements
+
+
+def encode_floor(floor: Dict[str, Any]) -> Dict[str, Any]:
+    """층 데이터의 elements를 압축 표현으로 바꾼 사본"""
+    if not isinstance(floor.get("elements"), list):
+        return floor
+    return {**floor, "elements": encode_elements(floor["elements"])}
+
+
+def decode_floor(floor: Dict[str, Any]) -> Dict[str, Any]:
+    """압축 표현 층 데이터를 원래 형식으로 복원한 사본"""
+    if not isinstance(floor.get("elements"), dict):
+        return floor
+    return {**floor, "elements": decode_elements(floor["elements"])}
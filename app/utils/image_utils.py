@@ -1,6 +1,12 @@
 """이미지 처리 헬퍼"""
+import base64
+import io
+import os
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict, Any
+
+# 플레이스홀더(LQIP) 최대 변 길이 (px)
+PLACEHOLDER_MAX_SIZE = 16
 
 def get_image_size(image_path: Path) -> Tuple[int, int]:
     """이미지 크기 반환 (width, height)"""
@@ -14,3 +20,117 @@ def get_image_size(image_path: Path) -> Tuple[int, int]:
     except Exception:
         return (800, 600)
 
+def generate_placeholder(image_path: Path, max_size: int = PLACEHOLDER_MAX_SIZE) -> Optional[str]:
+    """저해상도 미리보기(LQIP)를 base64 data URI로 반환
+
+    키오스크가 원본을 받기 전에 흐린 미리보기를 먼저 그릴 수 있도록
+    업로드 시 한 번만 계산합니다. PIL이 없거나 SVG처럼 래스터가 아닌
+    이미지는 None을 반환합니다.
+    """
+    try:
+        from PIL import Image
+        with Image.open(image_path) as img:
+            # JPEG은 디코딩 단계에서 축소하여 큰 원본도 빠르게 처리
+            img.draft("RGB", (max_size * 8, max_size * 8))
+            if img.mode in ("RGBA", "LA", "P"):
+                # 투명 영역은 흰 배경으로 합성
+                rgba = img.convert("RGBA")
+                preview = Image.new("RGB", rgba.size, (255, 255, 255))
+                preview.paste(rgba, mask=rgba.split()[-1])
+            else:
+                preview = img.convert("RGB")
+            preview.thumbnail((max_size, max_size))
+            buffer = io.BytesIO()
+            preview.save(buffer, format="JPEG", quality=60, optimize=True)
+        encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+        return f"data:image/jpeg;base64,{encoded}"
+    except ImportError:
+        return None
+    except Exception:
+        return None
+
+# 메타데이터 정리/재압축 대상 포맷
+NORMALIZABLE_FORMATS = {"JPEG", "PNG", "WEBP"}
+EXIF_ORIENTATION_TAG = 0x0112
+
+def normalize_image(
+    image_path: Path,
+    strip_metadata: bool = True,
+    max_pixels: int = 0,
+    max_bytes: int = 0,
+    quality: int = 90,
+) -> Dict[str, Any]:
+    """업로드 이미지 정규화 (EXIF 회전 적용, 메타데이터 제거, 예산 초과 시 재압축)
+
+    파일을 제자리에서 교체하고 처리 결과를 반환합니다.
+    PIL이 없거나 지원하지 않는 포맷(SVG, GIF 등)은 그대로 둡니다.
+    """
+    original_size = image_path.stat().st_size
+    result = {
+        "originalSize": original_size,
+        "size": original_size,
+        "bytesSaved": 0,
+        "normalized": False,
+    }
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return result
+
+    try:
+        with Image.open(image_path) as img:
+            image_format = img.format
+            if image_format not in NORMALIZABLE_FORMATS or getattr(img, "is_animated", False):
+                return result
+
+            exif = img.getexif()
+            orientation = exif.get(EXIF_ORIENTATION_TAG, 1)
+            has_metadata = bool(exif) or "exif" in img.info or "xmp" in img.info
+            over_pixels = bool(max_pixels) and img.width * img.height > max_pixels
+            over_bytes = bool(max_bytes) and original_size > max_bytes
+            needs_rewrite = orientation != 1 or (strip_metadata and has_metadata)
+
+            if not (needs_rewrite or over_pixels or over_bytes):
+                return result
+
+            processed = ImageOps.exif_transpose(img) if orientation != 1 else img.copy()
+            if over_pixels:
+                scale = (max_pixels / (processed.width * processed.height)) ** 0.5
+                new_size = (max(1, int(processed.width * scale)), max(1, int(processed.height * scale)))
+                processed = processed.resize(new_size, Image.LANCZOS)
+
+            save_kwargs: Dict[str, Any] = {}
+            if img.info.get("icc_profile"):
+                # 색 재현을 위해 ICC 프로파일은 유지
+                save_kwargs["icc_profile"] = img.info["icc_profile"]
+            if not strip_metadata and exif:
+                exif[EXIF_ORIENTATION_TAG] = 1
+                save_kwargs["exif"] = exif.tobytes()
+            if image_format == "JPEG":
+                if processed.mode not in ("RGB", "L", "CMYK"):
+                    processed = processed.convert("RGB")
+                save_kwargs.update(quality=quality, optimize=True, progressive=True)
+            elif image_format == "WEBP":
+                save_kwargs.update(quality=quality, method=4)
+            else:
+                save_kwargs.update(optimize=True)
+
+            buffer = io.BytesIO()
+            processed.save(buffer, format=image_format, **save_kwargs)
+    except Exception as e:
+        print(f"이미지 정규화 실패 ({image_path}): {e}")
+        return result
+
+    new_bytes = buffer.getvalue()
+    # 회전, 픽셀 수 축소가 필요 없는 경우(재압축, 메타데이터 제거만 필요)는 실제로 작아질 때만 교체
+    if orientation == 1 and not over_pixels and len(new_bytes) >= original_size:
+        return result
+
+    temp_path = image_path.with_name(f".{image_path.name}.tmp")
+    temp_path.write_bytes(new_bytes)
+    os.replace(temp_path, image_path)
+
+    result["size"] = len(new_bytes)
+    result["bytesSaved"] = max(0, original_size - len(new_bytes))
+    result["normalized"] = True
+    return result
@@ -0,0 +1,120 @@
+"""JSON Patch (RFC 6902) 헬퍼"""
+import copy
+from typing import Any, Dict, List
+
+JsonPatch = List[Dict[str, Any]]
+
+
+def _escape(token: Any) -> str:
+    """JSON Pointer 토큰 이스케이프"""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    """JSON Pointer 토큰 복원"""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(a: Any, b: Any) -> bool:
+    """JSON 값 비교 (타입까지 같아야 같은 값, True와 1, 1과 1.0은 다른 값)"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same(value, b[key]) for key, value in a.items())
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> JsonPatch:
+    """old를 new로 바꾸는 JSON Patch 생성 (add/remove/replace만 사용)"""
+    if _same(old, new):
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        return _diff_dict(old, new, path)
+    if isinstance(old, list) and isinstance(new, list):
+        return _diff_list(old, new, path)
+    return [{"op": "replace", "path": path, "value": copy.deepcopy(new)}]
+
+
+def _diff_dict(old: Dict[str, Any], new: Dict[str, Any], path: str) -> JsonPatch:
+    """객체 비교"""
+    ops: JsonPatch = []
+    for key in old:
+        if key not in new:
+            ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    for key, value in new.items():
+        child_path = f"{path}/{_escape(key)}"
+        if key not in old:
+            ops.append({"op": "add", "path": child_path, "value": copy.deepcopy(value)})
+        else:
+            ops.extend(make_patch(old[key], value, child_path))
+    return ops
+
+
+def _diff_list(old: List[Any], new: List[Any], path: str) -> JsonPatch:
+    """배열 비교
+
+    앞뒤로 같은 부분을 건너뛴 뒤, 남은 구간은 같은 위치끼리 비교하고
+    길이 차이만큼 추가/삭제합니다. 요소 하나를 이동·수정·삭제하는
+    일반적인 편집은 작은 패치로 표현됩니다.
+    """
+    prefix = 0
+    max_prefix = min(len(old), len(new))
+    while prefix < max_prefix and _same(old[prefix], new[prefix]):
+        prefix += 1
+
+    suffix = 0
+    max_suffix = min(len(old), len(new)) - prefix
+    while suffix < max_suffix and _same(old[len(old) - 1 - suffix], new[len(new) - 1 - suffix]):
+        suffix += 1
+
+    old_mid = old[prefix:len(old) - suffix]
+    new_mid = new[prefix:len(new) - suffix]
+
+    ops: JsonPatch = []
+    common = min(len(old_mid), len(new_mid))
+    for offset in range(common):
+        ops.extend(make_patch(old_mid[offset], new_mid[offset], f"{path}/{prefix + offset}"))
+    # 남는 요소 삭제 (뒤에서부터 삭제해야 인덱스가 밀리지 않음)
+    for offset in range(len(old_mid) - 1, common - 1, -1):
+        ops.append({"op": "remove", "path": f"{path}/{prefix + offset}"})
+    for offset in range(common, len(new_mid)):
+        ops.append({"op": "add", "path": f"{path}/{prefix + offset}", "value": copy.deepcopy(new_mid[offset])})
+    return ops
+
+
+def apply_patch(doc: Any, patch: JsonPatch) -> Any:
+    """JSON Patch 적용 (원본은 수정하지 않고 새 문서 반환)"""
+    result = copy.deepcopy(doc)
+    for op in patch:
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            if op["op"] in ("add", "replace"):
+                result = copy.deepcopy(op["value"])
+                continue
+            raise ValueError("루트 문서는 삭제할 수 없습니다.")
+
+        parent = result
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del parent[index]
+            elif op["op"] == "replace":
+                parent[index] = copy.deepcopy(op["value"])
+            else:
+                raise ValueError(f"지원하지 않는 op입니다: {op['op']}")
+        else:
+            if op["op"] in ("add", "replace"):
+                parent[last] = copy.deepcopy(op["value"])
+            elif op["op"] == "remove":
+                del parent[last]
+            else:
+                raise ValueError(f"지원하지 않는 op입니다: {op['op']}")
+    return result
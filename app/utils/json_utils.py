@@ -1,5 +1,6 @@
 """JSON 처리 헬퍼"""
 import json
+import os
 from pathlib import Path
 from typing import Optional, Dict, Any, Union, List
 
@@ -14,11 +15,16 @@ def load_json_file(file_path: Path) -> Optional[Union[Dict[str, Any], List[Any]]
         print(f"JSON 파일 로드 실패 ({file_path}): {e}")
         return None
 
-def save_json_file(file_path: Path, data: Union[Dict[str, Any], List[Any]]):
-    """JSON 파일 저장"""
+def save_json_file(file_path: Path, data: Union[Dict[str, Any], List[Any]], compact: bool = False):
+    """JSON 파일 저장 (임시 파일에 쓴 뒤 교체하여 원자적으로 저장, compact=True면 들여쓰기 없이 저장)"""
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    temp_path = file_path.with_name(f".{file_path.name}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        if compact:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, file_path)
 
 def load_json(filename: str, base_dir: Path) -> Dict[str, Any]:
     """JSON 파일 로드 (하위 호환성)"""
@@ -33,3 +39,39 @@ def save_json(filename: str, data: Dict[str, Any], base_dir: Path):
     file_path = base_dir / filename
     save_json_file(file_path, data)
 
+
+def parse_fields(fields: Optional[str]) -> Optional[Dict[str, Any]]:
+    """fields 파라미터를 트리로 변환 ("floor,floors.floorName" → {"floor": {}, "floors": {"floorName": {}}}, 없으면 None)"""
+    if not fields:
+        return None
+    # 하위 필드 없이 요청한 필드는 None으로 표시해 두고, 같은 필드의 하위 경로("floors.floorName")보다 우선
+    tree: Dict[str, Any] = {}
+    for path in fields.split(","):
+        names = []
+        for name in (part.strip() for part in path.split(".")):
+            if not name:
+                break
+            names.append(name)
+        node = tree
+        for depth, name in enumerate(names):
+            if depth == len(names) - 1:
+                node[name] = None
+            elif name in node and node[name] is None:
+                break
+            else:
+                node = node.setdefault(name, {})
+    return _close_fields(tree) or None
+
+def _close_fields(tree: Dict[str, Any]) -> Dict[str, Any]:
+    """parse_fields의 None 표시를 빈 트리(하위 전체)로 변환"""
+    return {name: _close_fields(child) if child else {} for name, child in tree.items()}
+
+def project_fields(data: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    """필드 트리에 포함된 키만 남긴 사본 (트리가 비어 있거나 None이면 원본 그대로, 목록은 항목마다 적용)"""
+    if not tree:
+        return data
+    if isinstance(data, list):
+        return [project_fields(item, tree) for item in data]
+    if isinstance(data, dict):
+        return {key: project_fields(data[key], tree[key]) for key in tree if key in data}
+    return data
@@ -0,0 +1,85 @@
+"""키 단위 비동기 잠금(read-modify-write 직렬화) 헬퍼"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Hashable, List
+
+# 생성된 인스턴스 목록 (지표 조회용)
+_instances: List["KeyedLockManager"] = []
+
+
+class KeyedLockManager:
+    """같은 키(파일)에 대한 읽기-수정-저장 구간을 한 번에 하나씩 실행
+
+    키마다 asyncio.Lock을 만들고, 기다리는 요청이 없으면 바로 정리합니다.
+    대기 시간은 키 종류(콜론 앞부분)별로 집계합니다.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._users: Dict[Hashable, int] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        _instances.append(self)
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable):
+        """키에 대한 잠금을 잡고 구간 실행"""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._users[key] = self._users.get(key, 0) + 1
+
+        contended = lock.locked()
+        started = time.perf_counter()
+        try:
+            await lock.acquire()
+        except BaseException:
+            self._release_user(key)
+            raise
+        self._record(key, time.perf_counter() - started, contended)
+        try:
+            yield
+        finally:
+            lock.release()
+            self._release_user(key)
+
+    def _release_user(self, key: Hashable):
+        """사용자 수 감소 (아무도 없으면 잠금 객체 정리)"""
+        self._users[key] -= 1
+        if self._users[key] == 0:
+            del self._users[key]
+            del self._locks[key]
+
+    def _record(self, key: Hashable, waited: float, contended: bool):
+        """대기 시간 집계"""
+        kind = str(key).split(":", 1)[0]
+        stats = self._stats.setdefault(kind, {
+            "acquired": 0, "contended": 0, "totalWaitMs": 0.0, "maxWaitMs": 0.0
+        })
+        waited_ms = waited * 1000
+        stats["acquired"] += 1
+        stats["contended"] += int(contended)
+        stats["totalWaitMs"] += waited_ms
+        stats["maxWaitMs"] = max(stats["maxWaitMs"], waited_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """키 종류별 잠금 대기 통계"""
+        kinds = {}
+        for kind, stats in self._stats.items():
+            kinds[kind] = {
+                "acquired": stats["acquired"],
+                "contended": stats["contended"],
+                "avgWaitMs": round(stats["totalWaitMs"] / stats["acquired"], 3) if stats["acquired"] else 0.0,
+                "maxWaitMs": round(stats["maxWaitMs"], 3),
+            }
+        return {
+            "name": self.name,
+            "held": sum(1 for lock in self._locks.values() if lock.locked()),
+            "waiting": sum(self._users.values()) - sum(1 for lock in self._locks.values() if lock.locked()),
+            "kinds": kinds,
+        }
+
+
+def get_lock_stats() -> List[Dict[str, Any]]:
+    """모든 잠금 관리자 통계"""
+    return [instance.get_stats() for instance in _instances]
@@ -0,0 +1,47 @@
+"""문서 revision(낙관적 동시성 제어) 헬퍼"""
+from typing import Optional
+from fastapi import HTTPException
+
+
+def format_etag(revision: Optional[int], *variants: str) -> str:
+    """revision을 ETag 헤더 값으로 변환 (표현이 다른 응답은 variants로 구분: "3-compact")"""
+    return '"' + "-".join([str(revision or 0), *variants]) + '"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """If-Match 헤더에서 기대 revision 추출 (없거나 "*"이면 None)"""
+    if not if_match:
+        return None
+    value = if_match.split(",")[0].strip()
+    if value == "*":
+        return None
+    if value.startswith("W/"):
+        value = value[2:]
+    # 표현 구분자("3-compact")는 무시하고 revision만 비교
+    value = value.strip('"').split("-", 1)[0]
+    try:
+        return int(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"If-Match 값이 올바르지 않습니다: {if_match}")
+
+
+def ensure_revision(if_match: Optional[str], base_revision: Optional[int], current_revision: Optional[int]):
+    """If-Match 헤더 또는 baseRevision이 현재 revision과 다르면 412 발생
+
+    둘 다 없으면 검사하지 않습니다 (기존 클라이언트 호환).
+    """
+    expected = parse_if_match(if_match)
+    if expected is None and base_revision is not None:
+        try:
+            expected = int(base_revision)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail=f"baseRevision 값이 올바르지 않습니다: {base_revision}")
+    if expected is None:
+        return
+    current = current_revision or 0
+    if expected != current:
+        raise HTTPException(
+            status_code=412,
+            detail=f"다른 사용자가 먼저 수정했습니다. (기준 revision: {expected}, 현재 revision: {current})",
+            headers={"ETag": format_etag(current)}
+        )
@@ -0,0 +1,55 @@
+"""동시 요청 합치기(single-flight) 헬퍼"""
+import asyncio
+from typing import Any, Callable, Dict, Hashable, List
+
+# 생성된 인스턴스 목록 (지표 조회용)
+_instances: List["SingleFlight"] = []
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 읽기 요청을 한 번의 실행으로 합침
+
+    첫 요청(miss)이 함수를 스레드에서 실행하고, 실행이 끝나기 전에 들어온
+    같은 키의 요청(hit)은 그 결과를 함께 받습니다. 결과 객체는 공유되므로
+    호출자는 반환값을 수정하면 안 됩니다.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        _instances.append(self)
+
+    async def do(self, key: Hashable, func: Callable[..., Any], *args) -> Any:
+        """키 단위로 합쳐서 func(*args) 실행"""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # 한 요청이 취소되어도 다른 대기자를 위해 실행은 계속되도록 shield
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        """완료된 실행을 진행 목록에서 제거"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/미스 통계"""
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / total, 4) if total else 0.0,
+            "inflight": len(self._inflight),
+        }
+
+
+def get_singleflight_stats() -> List[Dict[str, Any]]:
+    """모든 single-flight 인스턴스 통계"""
+    return [instance.get_stats() for instance in _instances]
@@ -0,0 +1,163 @@
+"""2차원 공간 인덱스 (균일 격자)"""
+import heapq
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+BBox = Tuple[float, float, float, float]
+
+
+def element_bounds(element: Dict[str, Any]) -> Optional[BBox]:
+    """요소의 영역 (min_x, min_y, max_x, max_y), 좌표가 없으면 None
+
+    x1/y1/x2/y2 순서가 뒤집힌 요소도 있으므로 항상 최소/최대로 정규화합니다.
+    """
+    try:
+        if "x1" in element:
+            x1, y1, x2, y2 = (float(element[key]) for key in ("x1", "y1", "x2", "y2"))
+        elif "x" in element:
+            x1, y1 = float(element["x"]), float(element["y"])
+            x2, y2 = x1 + float(element.get("width", 0)), y1 + float(element.get("height", 0))
+        else:
+            return None
+    except (KeyError, TypeError, ValueError):
+        return None
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+def bbox_center(bounds: BBox) -> Tuple[float, float]:
+    """영역의 중심점"""
+    return (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
+
+
+def _intersects(a: BBox, b: BBox) -> bool:
+    """두 영역이 겹치는지 (경계 포함)"""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _distance(x: float, y: float, bounds: BBox) -> float:
+    """점에서 영역까지의 거리 (영역 안이면 0)"""
+    dx = max(bounds[0] - x, 0, x - bounds[2])
+    dy = max(bounds[1] - y, 0, y - bounds[3])
+    return math.hypot(dx, dy)
+
+
+class GridIndex:
+    """균일 격자 공간 인덱스
+
+    각 항목은 겹치는 모든 셀에 등록되며, 영역 질의는 겹치는 셀만 확인합니다.
+    셀 크기를 지정하지 않으면 전체 범위와 항목 수로 자동 결정합니다.
+    """
+    def __init__(self, items: Iterable[Tuple[int, BBox]], cell_size: float = 0):
+        self.bounds: Dict[int, BBox] = dict(items)
+        if self.bounds:
+            min_x = min(b[0] for b in self.bounds.values())
+            min_y = min(b[1] for b in self.bounds.values())
+            max_x = max(b[2] for b in self.bounds.values())
+            max_y = max(b[3] for b in self.bounds.values())
+            self.extent: Optional[BBox] = (min_x, min_y, max_x, max_y)
+        else:
+            self.extent = None
+
+        if cell_size <= 0:
+            if self.extent:
+                span = max(self.extent[2] - self.extent[0], self.extent[3] - self.extent[1], 1.0)
+                cell_size = span / max(math.sqrt(len(self.bounds)), 1.0)
+            cell_size = max(cell_size, 1.0)
+        self.cell_size = cell_size
+
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for key, bounds in self.bounds.items():
+            for cell in self._cells_for(bounds):
+                self.cells.setdefault(cell, []).append(key)
+
+    def __len__(self) -> int:
+        return len(self.bounds)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """좌표가 속한 셀"""
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _cells_for(self, bounds: BBox) -> Iterable[Tuple[int, int]]:
+        """영역과 겹치는 셀 목록"""
+        min_cx, min_cy = self._cell(bounds[0], bounds[1])
+        max_cx, max_cy = self._cell(bounds[2], bounds[3])
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                yield cx, cy
+
+    def query(self, bbox: BBox) -> List[int]:
+        """영역과 겹치는 항목 키 목록 (키 오름차순)"""
+        if self.extent is None or not _intersects(bbox, self.extent):
+            return []
+        # 인덱스 범위 밖 셀은 건너뛰도록 질의 영역을 전체 범위로 자름
+        clipped = (
+            max(bbox[0], self.extent[0]), max(bbox[1], self.extent[1]),
+            min(bbox[2], self.extent[2]), min(bbox[3], self.extent[3]),
+        )
+        found = set()
+        for cell in self._cells_for(clipped):
+            for key in self.cells.get(cell, ()):
+                if key not in found and _intersects(bbox, self.bounds[key]):
+                    found.add(key)
+        return sorted(found)
+
+    def _ring_cells(self, cx: int, cy: int, ring: int) -> Iterable[Tuple[int, int]]:
+        """(cx, cy)에서 ring칸 떨어진 고리의 셀 (둘레만)"""
+        if ring == 0:
+            yield cx, cy
+            return
+        for dx in range(-ring, ring + 1):
+            yield cx + dx, cy - ring
+            yield cx + dx, cy + ring
+        for dy in range(-ring + 1, ring):
+            yield cx - ring, cy + dy
+            yield cx + ring, cy + dy
+
+    def _reach(self, x: float, y: float, cx: int, cy: int, ring: int) -> float:
+        """고리 ring까지 확인했을 때, 아직 확인하지 않은 셀까지의 최소 거리"""
+        min_x, max_x = (cx - ring) * self.cell_size, (cx + ring + 1) * self.cell_size
+        min_y, max_y = (cy - ring) * self.cell_size, (cy + ring + 1) * self.cell_size
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            # 점이 확인한 영역 밖이면 남은 셀이 바로 옆일 수 있음
+            return 0.0
+        return min(x - min_x, max_x - x, y - min_y, max_y - y)
+
+    def nearest(self, x: float, y: float, limit: int = 1, max_distance: Optional[float] = None) -> List[Tuple[float, int]]:
+        """점에서 가까운 항목 (거리, 키) 목록
+
+        점이 속한 셀(인덱스 범위 밖이면 범위 안으로 당긴 셀)에서 시작해 고리 둘레의 셀만
+        한 칸씩 넓혀 가며, 확인하지 않은 셀까지의 최소 거리가 찾은 후보보다 멀어지면 종료합니다.
+        고리 면적이 항목이 있는 셀 수보다 커지면 나머지는 전체 항목을 직접 비교합니다.
+        """
+        if self.extent is None or limit <= 0 or not (math.isfinite(x) and math.isfinite(y)):
+            return []
+        min_cx, min_cy = self._cell(self.extent[0], self.extent[1])
+        max_cx, max_cy = self._cell(self.extent[2], self.extent[3])
+        point_cx, point_cy = self._cell(x, y)
+        center_x = min(max(point_cx, min_cx), max_cx)
+        center_y = min(max(point_cy, min_cy), max_cy)
+        # 시작 셀에서 가장 먼 셀까지의 고리 수 (이보다 넓히면 새 항목이 없음)
+        max_ring = max(center_x - min_cx, max_cx - center_x, center_y - min_cy, max_cy - center_y)
+
+        candidates: Dict[int, float] = {}
+        for ring in range(max_ring + 1):
+            if (2 * ring + 1) ** 2 > len(self.cells):
+                for key, bounds in self.bounds.items():
+                    if key not in candidates:
+                        candidates[key] = _distance(x, y, bounds)
+                break
+            for cell in self._ring_cells(center_x, center_y, ring):
+                for key in self.cells.get(cell, ()):
+                    if key not in candidates:
+                        candidates[key] = _distance(x, y, self.bounds[key])
+            reach = self._reach(x, y, center_x, center_y, ring)
+            if max_distance is not None and reach > max_distance:
+                break
+            best = heapq.nsmallest(limit, candidates.values())
+            if len(best) == limit and best[-1] <= reach:
+                break
+
+        results = sorted((distance, key) for key, distance in candidates.items())
+        if max_distance is not None:
+            results = [item for item in results if item[0] <= max_distance]
+        return results[:limit]
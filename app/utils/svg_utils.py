@@ -0,0 +1,307 @@
+"""SVG 처리 헬퍼 (표준 라이브러리 XML 파서 사용)"""
+import os
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+# <symbol>로 옮기지 않는 루트 속성 (크기는 사용하는 쪽에서 지정)
+_ROOT_ONLY_ATTRS = {"width", "height", "x", "y", "version", "id"}
+_URL_REF = re.compile(r"url\(#([^)]+)\)")
+
+# 최적화 시 유지하는 네임스페이스 (나머지는 편집기 전용 요소/속성으로 보고 제거)
+_KEEP_NAMESPACES = {SVG_NS, XLINK_NS, XML_NS}
+# 좌표를 반올림하는 속성 (경로 d는 명령 단위로 따로 처리)
+# transform 계열은 배율/회전 값이 작아 소수 자릿수로 반올림하면 크기가 틀어지므로 제외
+_NUMERIC_ATTRS = {
+    "points", "viewBox",
+    "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry", "fx", "fy",
+    "width", "height", "stroke-width",
+}
+# 내용 공백이 의미 있는 요소
+_TEXT_TAGS = {"text", "tspan", "textPath", "style", "script", "title", "desc"}
+# 그룹을 자식에 합치면 의미가 바뀌는 속성
+_GROUP_KEEP_ATTRS = {"id", "class", "style", "transform", "clip-path", "mask", "filter", "opacity"}
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PATH_COMMANDS = set("MmLlHhVvCcSsQqTtAaZz")
+_PATH_SEPARATORS = set(" \t\r\n,")
+
+
+def _scope_ids(root: ET.Element, prefix: str):
+    """내부 id와 참조(url(#id), href="#id")에 접두사를 붙여 다른 아이콘과 충돌 방지"""
+    ids = {el.get("id") for el in root.iter() if el.get("id")}
+    if not ids:
+        return
+    for el in root.iter():
+        for key, value in list(el.attrib.items()):
+            if key == "id" and value in ids:
+                el.set(key, f"{prefix}{value}")
+            elif key in ("href", f"{{{XLINK_NS}}}href") and value.startswith("#") and value[1:] in ids:
+                el.set(key, f"#{prefix}{value[1:]}")
+            elif "url(#" in value:
+                el.set(key, _URL_REF.sub(
+                    lambda m: f"url(#{prefix}{m.group(1)})" if m.group(1) in ids else m.group(0), value
+                ))
+
+
+def svg_to_symbol(svg_path: Path, symbol_id: str, precision: int = 2) -> ET.Element:
+    """SVG 파일을 스프라이트용 <symbol> 요소로 변환 (최적화 포함)"""
+    root = optimize_tree(ET.parse(svg_path).getroot(), precision)
+    _scope_ids(root, f"{symbol_id}-")
+
+    symbol = ET.Element(f"{{{SVG_NS}}}symbol", {"id": symbol_id})
+    if "viewBox" not in root.attrib and root.get("width") and root.get("height"):
+        width = re.sub(r"[^\d.]", "", root.get("width"))
+        height = re.sub(r"[^\d.]", "", root.get("height"))
+        symbol.set("viewBox", f"0 0 {width} {height}")
+    for key, value in root.attrib.items():
+        if key not in _ROOT_ONLY_ATTRS:
+            symbol.set(key, value)
+    symbol.extend(list(root))
+    return symbol
+
+
+def build_sprite(symbols: Dict[str, Path]) -> bytes:
+    """{symbol id: SVG 파일 경로}로 스프라이트 시트 생성 (읽을 수 없는 파일은 건너뜀)"""
+    sprite = ET.Element(f"{{{SVG_NS}}}svg", {"style": "display:none"})
+    for symbol_id, svg_path in symbols.items():
+        try:
+            sprite.append(svg_to_symbol(svg_path, symbol_id))
+        except (OSError, ET.ParseError) as e:
+            print(f"SVG 스프라이트 생성 중 파일 건너뜀 ({svg_path}): {e}")
+    return ET.tostring(sprite, encoding="utf-8", xml_declaration=False)
+
+
+def _namespace(name: str) -> Optional[str]:
+    """{ns}local 형식 이름의 네임스페이스"""
+    return name[1:].split("}", 1)[0] if name.startswith("{") else None
+
+
+def _local_name(name: str) -> str:
+    """네임스페이스를 뺀 요소/속성 이름"""
+    return name.split("}", 1)[-1]
+
+
+def _format_number(value: float, precision: int) -> str:
+    """소수점 precision자리로 반올림 후 불필요한 0 제거 (0.5 → .5)"""
+    text = f"{round(value, precision):.{precision}f}".rstrip("0").rstrip(".")
+    if text in ("", "-0"):
+        return "0"
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def _round_token(token: str, precision: int) -> str:
+    """숫자 토큰 반올림 (정수는 원문 유지)"""
+    if "." in token or "e" in token or "E" in token:
+        return _format_number(float(token), precision)
+    return token
+
+
+def round_numbers(value: str, precision: int) -> str:
+    """속성 값 안의 소수를 반올림 (정수는 원문 유지, 경로 d에는 round_path_data 사용)"""
+    result = []
+    last = 0
+    for match in _NUMBER.finditer(value):
+        token = match.group()
+        result.append(value[last:match.start()])
+        last = match.end()
+        token = _round_token(token, precision)
+        # 앞 숫자와 붙어 있으면 구분자 추가 (1.0001.5 → 1 .5)
+        previous = result[-1][-1:] if result[-1] else (result[-2][-1:] if len(result) > 1 else "")
+        if previous and (previous.isdigit() or previous == ".") and (token[0].isdigit() or token[0] == "."):
+            token = " " + token
+        result.append(token)
+    result.append(value[last:])
+    return "".join(result)
+
+
+def round_path_data(d: str, precision: int) -> str:
+    """경로 d 속성의 좌표 반올림
+
+    명령 단위로 인자를 읽고, 호(a/A)의 4·5번째 인자(플래그)는 한 글자씩 읽습니다.
+    ("a1 1 0 0110 10" → 플래그 0, 1 / 끝점 10, 10)
+    해석할 수 없는 값은 원문 그대로 반환합니다.
+    """
+    tokens: List[str] = []
+    command = None
+    arg_index = 0
+    pos = 0
+    while pos < len(d):
+        char = d[pos]
+        if char in _PATH_SEPARATORS:
+            pos += 1
+            continue
+        if char in _PATH_COMMANDS:
+            command = char
+            arg_index = 0
+            tokens.append(char)
+            pos += 1
+            continue
+        if command is None or command in "Zz":
+            return d
+        if command in "Aa" and arg_index % 7 in (3, 4):
+            if char not in "01":
+                return d
+            token = char
+            pos += 1
+        else:
+            match = _NUMBER.match(d, pos)
+            if not match:
+                return d
+            token = _round_token(match.group(), precision)
+            pos = match.end()
+        tokens.append(token)
+        arg_index += 1
+
+    # 명령 문자 앞뒤와 음수 앞에는 구분자가 필요 없음
+    result = []
+    for index, token in enumerate(tokens):
+        previous = tokens[index - 1] if index else None
+        if previous is not None and previous not in _PATH_COMMANDS and token not in _PATH_COMMANDS \
+                and not token.startswith("-"):
+            result.append(" ")
+        result.append(token)
+    return "".join(result)
+
+
+def _clean_element(element: ET.Element, precision: int, in_text: bool = False):
+    """편집기 메타데이터/주석 제거, 좌표 반올림, 불필요한 공백 제거 (재귀)"""
+    for child in list(element):
+        if not isinstance(child.tag, str) or _namespace(child.tag) not in _KEEP_NAMESPACES | {None} \
+                or _local_name(child.tag) == "metadata":
+            # 주석, 처리 명령, 편집기 전용 요소 (sodipodi:namedview 등)
+            element.remove(child)
+            continue
+        _clean_element(child, precision, in_text or _local_name(child.tag) in _TEXT_TAGS)
+
+    for key in list(element.attrib):
+        namespace = _namespace(key)
+        if namespace is not None and namespace not in _KEEP_NAMESPACES:
+            del element.attrib[key]
+        elif namespace is None and key == "d":
+            element.set(key, round_path_data(element.get(key), precision))
+        elif namespace is None and key in _NUMERIC_ATTRS:
+            element.set(key, round_numbers(element.get(key), precision))
+
+    if not in_text and _local_name(element.tag) not in _TEXT_TAGS:
+        if element.text is not None and not element.text.strip():
+            element.text = None
+    for child in element:
+        if not in_text and child.tail is not None and not child.tail.strip():
+            child.tail = None
+
+
+def _collapse_groups(element: ET.Element):
+    """속성 없는 <g>는 풀고, 자식이 하나인 <g>는 속성을 자식으로 옮긴 뒤 제거 (재귀)"""
+    for child in element:
+        _collapse_groups(child)
+
+    children = []
+    for child in element:
+        if _local_name(child.tag) == "g" and not child.text:
+            if len(child) == 0 and not child.get("id"):
+                continue
+            if not child.attrib:
+                children.extend(child)
+                continue
+            if len(child) == 1 and not set(child.attrib) & _GROUP_KEEP_ATTRS \
+                    and not set(child.attrib) & set(child[0].attrib):
+                only = child[0]
+                for key, value in child.attrib.items():
+                    only.set(key, value)
+                children.append(only)
+                continue
+        if _local_name(child.tag) == "defs" and len(child) == 0:
+            continue
+        children.append(child)
+    element[:] = children
+
+
+def optimize_tree(root: ET.Element, precision: int = 2) -> ET.Element:
+    """파싱된 SVG 트리 최적화 (제자리 수정)"""
+    _clean_element(root, precision, _local_name(root.tag) in _TEXT_TAGS)
+    _collapse_groups(root)
+    return root
+
+
+def optimize_svg(data: bytes, precision: int = 2) -> bytes:
+    """SVG 문서 최적화 (메타데이터·주석 제거, 좌표 반올림, 그룹 정리)"""
+    root = ET.fromstring(data)
+    optimize_tree(root, precision)
+    return ET.tostring(root, encoding="utf-8", xml_declaration=False)
+
+
+def optimize_svg_file(svg_path: Path, precision: int = 2, dry_run: bool = False) -> Dict[str, Any]:
+    """SVG 파일을 최적화하여 제자리 교체 (더 작아진 경우에만) 후 크기 변화 반환"""
+    original = svg_path.read_bytes()
+    result = {
+        "originalSize": len(original),
+        "size": len(original),
+        "bytesSaved": 0,
+        "optimized": False,
+    }
+    try:
+        optimized = optimize_svg(original, precision)
+    except ET.ParseError as e:
+        # 파싱할 수 없는 파일은 그대로 둠
+        print(f"SVG 최적화 건너뜀 ({svg_path}): {e}")
+        return result
+    if len(optimized) >= len(original):
+        return result
+    if not dry_run:
+        temp_path = svg_path.with_name(f".{svg_path.name}.tmp")
+        temp_path.write_bytes(optimized)
+        os.replace(temp_path, svg_path)
+    result.update(size=len(optimized), bytesSaved=len(original) - len(optimized), optimized=True)
+    return result
+
+
+def optimize_svg_paths(paths: Iterable[Path], precision: int = 2, dry_run: bool = False) -> Dict[str, Any]:
+    """파일/디렉토리 목록의 모든 SVG를 일괄 최적화 (기존 자산 재최적화용)"""
+    files: List[Dict[str, Any]] = []
+    for path in paths:
+        targets = sorted(path.rglob("*.svg")) if path.is_dir() else [path]
+        for svg_path in targets:
+            try:
+                stats = optimize_svg_file(svg_path, precision, dry_run)
+            except OSError as e:
+                print(f"SVG 최적화 실패 ({svg_path}): {e}")
+                continue
+            files.append({"path": str(svg_path), **stats})
+    return {
+        "files": files,
+        "optimized": sum(1 for f in files if f["optimized"]),
+        "originalSize": sum(f["originalSize"] for f in files),
+        "size": sum(f["size"] for f in files),
+        "bytesSaved": sum(f["bytesSaved"] for f in files),
+    }
+
+
+if __name__ == "__main__":
+    # 기존 자산 일괄 재최적화: python -m app.utils.svg_utils [경로 ...] [--precision N] [--dry-run]
+    import argparse
+    from app.config.paths import ICONS_DATA_DIR, BUILDINGS_DATA_DIR
+    from app.config.settings import SVG_OPTIMIZE_CONFIG
+
+    parser = argparse.ArgumentParser(description="SVG 일괄 최적화")
+    parser.add_argument("paths", nargs="*", type=Path, help="파일 또는 디렉토리 (기본: 아이콘, 건물 디렉토리)")
+    parser.add_argument("--precision", type=int, default=SVG_OPTIMIZE_CONFIG["precision"], help="좌표 소수점 자릿수")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 바꾸지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    summary = optimize_svg_paths(args.paths or [ICONS_DATA_DIR, BUILDINGS_DATA_DIR], args.precision, args.dry_run)
+    for item in summary["files"]:
+        print(f"{item['path']}: {item['originalSize']} → {item['size']} bytes (-{item['bytesSaved']})")
+    print(f"총 {len(summary['files'])}개 중 {summary['optimized']}개 최적화, "
+          f"{summary['originalSize']} → {summary['size']} bytes (-{summary['bytesSaved']})")
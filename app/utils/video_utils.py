@@ -4,7 +4,7 @@ from typing import Optional, Tuple
 import mimetypes
 
 # 지원하는 비디오 확장자
-ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".webm", ".ogg", ".mov", ".avi"}
+ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".m4v", ".webm", ".ogg", ".mov", ".avi"}
 
 def is_video_file(file_path: Path) -> bool:
     """파일이 비디오 파일인지 확인"""
@@ -37,3 +37,55 @@ def get_video_info(file_path: Path) -> Optional[dict]:
         "extension": file_path.suffix.lower()
     }
 
+
+# 재생 시간을 읽을 수 있는 ISO BMFF 계열 확장자
+MP4_FAMILY_EXTENSIONS = {".mp4", ".mov", ".m4v"}
+# mvhd는 moov 바로 아래에 있으므로 moov만 들어가서 찾음
+MP4_CONTAINER_BOXES = {b"moov"}
+
+def _find_mvhd(f, end: int) -> Optional[float]:
+    """moov 박스를 따라가며 mvhd 박스에서 재생 시간(초) 추출"""
+    while f.tell() + 8 <= end:
+        box_start = f.tell()
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        box_size = int.from_bytes(header[:4], "big")
+        box_type = header[4:]
+        header_size = 8
+        if box_size == 1:
+            box_size = int.from_bytes(f.read(8), "big")
+            header_size = 16
+        elif box_size == 0:
+            box_size = end - box_start
+        if box_size < header_size:
+            return None
+
+        if box_type == b"mvhd":
+            version = f.read(1)[0]
+            f.read(3)  # flags
+            if version == 1:
+                f.read(16)  # creation/modification time
+                timescale = int.from_bytes(f.read(4), "big")
+                duration = int.from_bytes(f.read(8), "big")
+            else:
+                f.read(8)
+                timescale = int.from_bytes(f.read(4), "big")
+                duration = int.from_bytes(f.read(4), "big")
+            return round(duration / timescale, 3) if timescale else None
+        if box_type in MP4_CONTAINER_BOXES:
+            duration = _find_mvhd(f, box_start + box_size)
+            if duration is not None:
+                return duration
+        f.seek(box_start + box_size)
+    return None
+
+def get_video_duration(file_path: Path) -> Optional[float]:
+    """비디오 재생 시간(초) 반환 (MP4/MOV 헤더만 파싱, 그 외 형식은 None)"""
+    if file_path.suffix.lower() not in MP4_FAMILY_EXTENSIONS:
+        return None
+    try:
+        with open(file_path, "rb") as f:
+            return _find_mvhd(f, file_path.stat().st_size)
+    except Exception:
+        return None
@@ -11,6 +11,7 @@ from app.router.v01.router import api_router
 from app.router.v01.admin import router as admin_router
 from app.router.v01.sse import set_app_instance
 from app.services.client_registry import client_registry
+from app.services.building_service import get_all_buildings, migrate_floor_icon_types, rebuild_buildings_manifest
 from app.middleware.cors import setup_cors
 
 # 디렉토리 생성
@@ -33,6 +34,16 @@ async def lifespan(app: FastAPI):
     # SSE 라우터에 app 인스턴스 설정
     set_app_instance(app)
     
+    # 건물 목록 manifest를 디렉토리 기준으로 재생성 (서버 중지 중 직접 수정된 파일 반영)
+    manifest = rebuild_buildings_manifest()
+    print(f"[Buildings] manifest 생성: 건물 {len(manifest['buildings'])}개")
+    
+    # 층마다 저장된 아이콘 타입 복사본을 레지스트리 참조로 변환
+    for building in get_all_buildings():
+        stats = migrate_floor_icon_types(building["id"])
+        if stats["migrated"]:
+            print(f"[Icons] {building['id']}: 층 {stats['migrated']}개 변환 ({stats['bytesSaved']} bytes 절감)")
+    
     yield
     
     app.state.is_shutting_down = True
@@ -49,23 +60,23 @@ app.include_router(api_router)
 app.include_router(admin_router)
 
 # 나머지 라우터 등록
-from app.router.v01 import buildings, floors, media, icons, floor_plan
+from app.router.v01 import buildings, floors, media, icons, floor_plan, media_stream
 
 app.include_router(buildings.router)
 app.include_router(floors.router)
 app.include_router(media.router)
 app.include_router(icons.router)
 app.include_router(floor_plan.router)
+# /content/media 는 Range 요청을 처리하는 스트리밍 라우터로 서빙
+app.include_router(media_stream.router)
 
 # 정적 파일 서빙
 DEPARTMENTS_DIR = CONTENT_DIR / "departments"
 FACILITIES_DIR = CONTENT_DIR / "facilities"
-MEDIA_DIR = CONTENT_DIR / "media"
 STATIC_DIR = CONTENT_DIR.parent / "static"
 
 app.mount("/content/departments", StaticFiles(directory=str(DEPARTMENTS_DIR)), name="departments")
 app.mount("/content/facilities", StaticFiles(directory=str(FACILITIES_DIR)), name="facilities")
-app.mount("/content/media", StaticFiles(directory=str(MEDIA_DIR)), name="media")
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 # # Admin SPA Handling
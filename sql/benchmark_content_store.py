@@ -0,0 +1,109 @@
+"""
+Viewo 콘텐츠 저장소 벤치마크 (JSON 파일 vs SQLite)
+- 임시 디렉토리에 합성 데이터를 만들어 두 저장소의 주요 동작 시간을 비교
+- 실제 content/ 와 data/viewo.db 는 사용하지 않음
+
+사용법: python sql/benchmark_content_store.py [--buildings 50] [--floors 5] [--elements 500]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from app.services.content_store import FileContentStore, SqliteContentStore
+
+
+def make_floors(building_id: str, floor_count: int, element_count: int) -> list:
+    """합성 층 데이터 생성"""
+    return [
+        {
+            "floor": floor,
+            "floorName": f"{floor}층",
+            "buildingId": building_id,
+            "revision": 1,
+            "elements": [
+                {"id": f"e{floor}-{i}", "type": "icon" if i % 3 else "text", "iconType": "toilet",
+                 "x": i * 1.5, "y": i * 2.25, "width": 24, "height": 24, "text": f"요소 {i}"}
+                for i in range(element_count)
+            ],
+        }
+        for floor in range(1, floor_count + 1)
+    ]
+
+
+def timed(func) -> float:
+    """실행 시간 (ms)"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(store, building_ids: list, floors_by_building: dict) -> dict:
+    """저장소 하나에 대한 측정"""
+    target = building_ids[len(building_ids) // 2]
+
+    def save_all():
+        for building_id in building_ids:
+            store.save_building(building_id, {"id": building_id, "name": building_id, "revision": 1})
+            store.save_floors(building_id, floors_by_building[building_id])
+
+    def list_buildings():
+        for building_id in store.building_ids():
+            store.load_building(building_id)
+
+    def load_all_floors():
+        for building_id in building_ids:
+            store.load_floors(building_id)
+
+    def load_one_floor():
+        for _ in range(100):
+            store.load_floor(target, 1)
+
+    def check_versions():
+        for _ in range(1000):
+            store.floors_version(target)
+
+    def save_one_building_floors():
+        for _ in range(20):
+            store.save_floors(target, floors_by_building[target])
+
+    return {
+        "초기 저장 (전체)": timed(save_all),
+        "건물 목록 + 메타데이터": timed(list_buildings),
+        "전체 층 로드": timed(load_all_floors),
+        "단일 층 로드 x100": timed(load_one_floor),
+        "변경 토큰 확인 x1000": timed(check_versions),
+        "건물 1개 층 저장 x20": timed(save_one_building_floors),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="콘텐츠 저장소 벤치마크")
+    parser.add_argument("--buildings", type=int, default=50, help="건물 수")
+    parser.add_argument("--floors", type=int, default=5, help="건물당 층 수")
+    parser.add_argument("--elements", type=int, default=500, help="층당 요소 수")
+    args = parser.parse_args()
+
+    building_ids = [f"building-{i:04d}" for i in range(args.buildings)]
+    floors_by_building = {b: make_floors(b, args.floors, args.elements) for b in building_ids}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        media_files = {"dashboard": temp / "dashboard.json", "pr": temp / "pr.json"}
+        results = {
+            "file": run(FileContentStore(temp / "buildings", media_files), building_ids, floors_by_building),
+            "sqlite": run(SqliteContentStore(temp / "viewo.db"), building_ids, floors_by_building),
+        }
+
+    print("=" * 60)
+    print(f"📊 건물 {args.buildings}개 x 층 {args.floors}개 x 요소 {args.elements}개")
+    print("=" * 60)
+    print(f"{'항목':<24}{'file (ms)':>12}{'sqlite (ms)':>14}")
+    for name in results["file"]:
+        print(f"{name:<24}{results['file'][name]:>12.1f}{results['sqlite'][name]:>14.1f}")
+    print("=" * 60)
@@ -0,0 +1,75 @@
+"""
+Viewo 콘텐츠 저장소 마이그레이션 스크립트
+- content/ 아래 JSON 파일(건물, 층, 미디어 설정)을 SQLite로 복사
+- 다시 실행하면 같은 키의 데이터를 덮어씀 (JSON 파일은 수정하지 않음)
+
+사용법: python sql/migrate_content.py [--db data/viewo.db]
+완료 후 system/config/server.json에 "content_store": {"backend": "sqlite"}를 추가하고 서버를 재시작합니다.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from app.config.paths import DB_PATH
+from app.config.settings import CONTENT_STORE_CONFIG
+from app.services.content_store import FileContentStore, SqliteContentStore
+
+MEDIA_TYPES = ("dashboard", "pr")
+
+
+def migrate_content(db_path: Path) -> dict:
+    """JSON 파일 저장소의 문서를 SQLite 저장소로 복사 후 검증"""
+    source = FileContentStore()
+    target = SqliteContentStore(db_path)
+    stats = {"buildings": 0, "floors": 0, "elements": 0, "media": 0, "mismatched": []}
+
+    for building_id in source.building_ids():
+        building = source.load_building(building_id)
+        floors = source.load_floors(building_id)
+        if building is None and floors is None:
+            continue
+        if floors is not None:
+            target.save_floors(building_id, floors)
+            stats["floors"] += len(floors)
+            stats["elements"] += sum(len(f.get("elements") or []) for f in floors)
+        if building is not None:
+            target.save_building(building_id, building)
+            stats["buildings"] += 1
+        if target.load_building(building_id) != building or target.load_floors(building_id) != floors:
+            stats["mismatched"].append(building_id)
+
+    for media_type in MEDIA_TYPES:
+        config = source.load_media(media_type)
+        if config is None:
+            continue
+        target.save_media(media_type, config)
+        stats["media"] += 1
+        if target.load_media(media_type) != config:
+            stats["mismatched"].append(f"media:{media_type}")
+
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON 콘텐츠를 SQLite로 마이그레이션")
+    parser.add_argument("--db", type=Path, default=CONTENT_STORE_CONFIG["db_path"] or DB_PATH, help="SQLite 파일 경로")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("🚀 Viewo Content Migration (JSON → SQLite)")
+    print("=" * 50)
+    print(f"📂 DB 경로: {args.db}")
+
+    result = migrate_content(args.db)
+    print(f"✅ 건물 {result['buildings']}개, 층 {result['floors']}개 (요소 {result['elements']}개), "
+          f"미디어 설정 {result['media']}개 마이그레이션 완료")
+    if result["mismatched"]:
+        print(f"❌ 검증 실패: {', '.join(result['mismatched'])}")
+        sys.exit(1)
+    print("✅ 검증 완료 (원본과 동일)")
+    print('ℹ️ server.json에 "content_store": {"backend": "sqlite"}를 추가한 뒤 서버를 재시작하세요')
+    print("=" * 50)
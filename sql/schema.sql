@@ -71,3 +71,54 @@ CREATE TABLE IF NOT EXISTS token_blacklist (
 
 CREATE INDEX IF NOT EXISTS idx_token_blacklist_jti ON token_blacklist(token_jti);
 CREATE INDEX IF NOT EXISTS idx_token_blacklist_expires ON token_blacklist(expires_at);
+
+-- ============================================
+-- 콘텐츠 저장소 (content_store backend = "sqlite")
+-- 건물/층/미디어 설정 문서를 JSON1 컬럼으로 저장
+-- version: 저장 시각(ns) 기반 변경 토큰 (캐시 무효화용)
+-- ============================================
+
+-- 건물 테이블 (building.json)
+CREATE TABLE IF NOT EXISTS content_buildings (
+    id TEXT PRIMARY KEY,                   -- 건물 ID (UUID)
+    body TEXT CHECK (body IS NULL OR json_valid(body)),  -- 건물 메타데이터 (층만 먼저 저장된 경우 NULL)
+    name TEXT GENERATED ALWAYS AS (json_extract(body, '$.name')) VIRTUAL,
+    building_version INTEGER,              -- 건물 메타데이터 변경 토큰
+    floors_version INTEGER,                -- 층 목록 변경 토큰
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_content_buildings_name ON content_buildings(name);
+
+-- 층 테이블 (floors.json의 항목, 건물별 저장 순서 유지)
+CREATE TABLE IF NOT EXISTS content_floors (
+    building_id TEXT NOT NULL,             -- 건물 ID
+    position INTEGER NOT NULL,             -- floors.json 내 순서
+    floor INTEGER,                         -- 층 번호 (body의 floor)
+    body TEXT NOT NULL CHECK (json_valid(body)),  -- 층 데이터 (elements 포함)
+    PRIMARY KEY (building_id, position),
+    FOREIGN KEY (building_id) REFERENCES content_buildings(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_content_floors_floor ON content_floors(building_id, floor);
+
+-- 미디어 설정 테이블 (dashboard.json, pr.json)
+CREATE TABLE IF NOT EXISTS content_media (
+    media_type TEXT PRIMARY KEY,           -- dashboard, pr
+    body TEXT NOT NULL CHECK (json_valid(body)),  -- 미디어 설정 (images, nextId, revision)
+    version INTEGER NOT NULL,              -- 변경 토큰
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 건물 목록 manifest (건물마다 한 행, 내용 저장과 같은 트랜잭션에서 갱신)
+CREATE TABLE IF NOT EXISTS content_manifest (
+    building_id TEXT PRIMARY KEY,          -- 건물 ID
+    entry TEXT NOT NULL CHECK (json_valid(entry))  -- 건물 메타데이터 + 층 요약 (building, floors, floorsVersion)
+);
+
+-- manifest 헤더 (형식 버전, 저장소 이름) 1행
+CREATE TABLE IF NOT EXISTS content_manifest_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    body TEXT NOT NULL CHECK (json_valid(body)),  -- manifest 헤더 (version, backend)
+    version INTEGER NOT NULL               -- 변경 토큰 (manifest를 쓸 때마다 갱신)
+);
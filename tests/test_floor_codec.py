@@ -0,0 +1,129 @@
+"""층 요소 압축 표현(floor_codec) 왕복 테스트"""
+import json
+import random
+
+import pytest
+
+from app.utils.floor_codec import (
+    ENCODING, decode_elements, decode_floor, encode_elements, encode_floor, wants_compact
+)
+
+
+def _round_trip(floor):
+    """JSON 직렬화를 거친 인코딩/디코딩 결과"""
+    encoded = json.loads(json.dumps(encode_floor(floor), ensure_ascii=False))
+    return decode_floor(encoded)
+
+
+def _floor(elements):
+    return {"floor": 1, "floorName": "1층", "buildingId": "b1", "revision": 3, "elements": elements}
+
+
+def test_round_trip_current_format():
+    """현재 형식의 층 데이터는 그대로 복원"""
+    floor = _floor([
+        {"id": "t1", "type": "text", "text": "기획감사실", "x1": 10, "y1": 20, "x2": 110, "y2": 40,
+         "fontSize": 14, "color": "#000"},
+        {"id": "i1", "type": "icon", "iconType": "toilet", "x1": 5.5, "y1": 6.25, "x2": 29.5, "y2": 30.25},
+        {"id": "r1", "type": "rect", "x1": 0, "y1": 0, "x2": 50, "y2": 50, "style": {"fill": "none"}},
+        {"id": "i2", "type": "icon", "iconType": "exit", "x1": 1, "y1": 1, "x2": 2, "y2": 2},
+    ])
+    assert _round_trip(floor) == floor
+
+
+def test_missing_keys_and_null_values_are_distinct():
+    """키가 없는 경우와 값이 null인 경우를 구분"""
+    floor = _floor([
+        {"id": "a", "type": "text", "text": None},
+        {"id": "b", "type": "text"},
+        {"type": "text", "text": "c"},
+    ])
+    decoded = _round_trip(floor)
+    assert decoded == floor
+    assert "text" not in decoded["elements"][1]
+    assert "id" not in decoded["elements"][2]
+
+
+def test_mixed_types_and_missing_type_keep_order():
+    """타입이 섞인 목록, type 키가 없거나 null인 요소도 원래 순서로 복원"""
+    floor = _floor([
+        {"id": "1", "type": "icon", "iconType": "toilet"},
+        {"id": "2"},
+        {"id": "3", "type": None},
+        {"id": "4", "type": "text", "text": "x"},
+        {"id": "5", "type": "icon", "iconType": "toilet"},
+    ])
+    encoded = encode_floor(floor)["elements"]
+    assert encoded["encoding"] == ENCODING
+    assert len(encoded["groups"]) == 4
+    assert _round_trip(floor) == floor
+
+
+def test_icon_type_dictionary_indexes():
+    """iconType은 값 사전과 인덱스로 저장"""
+    elements = [{"id": str(i), "type": "icon", "iconType": ["toilet", "exit", "toilet"][i % 3]} for i in range(6)]
+    group = encode_elements(elements)["groups"][0]
+    assert group["dictionaries"]["iconType"] == ["toilet", "exit"]
+    assert group["columns"]["iconType"] == [0, 1, 0, 0, 1, 0]
+    assert decode_elements(encode_elements(elements)) == elements
+
+
+def test_icon_type_dictionary_with_missing_and_non_string_values():
+    """iconType이 없는 요소는 사전을 써도 복원되고, 문자열이 아닌 값이 있으면 사전을 쓰지 않음"""
+    with_missing = [{"type": "icon", "iconType": "toilet"}, {"type": "icon"}]
+    assert "dictionaries" in encode_elements(with_missing)["groups"][0]
+    assert decode_elements(encode_elements(with_missing)) == with_missing
+
+    non_string = [{"type": "icon", "iconType": "toilet"}, {"type": "icon", "iconType": 3}]
+    assert "dictionaries" not in encode_elements(non_string)["groups"][0]
+    assert decode_elements(encode_elements(non_string)) == non_string
+
+
+def test_non_icon_elements_and_nested_values():
+    """아이콘이 아닌 요소의 중첩 값(dict, list)도 그대로 복원"""
+    floor = _floor([
+        {"id": "p", "type": "polygon", "points": [[0, 0], [1.5, 2], [3, 0]], "style": {"stroke": "#f00"}},
+        {"id": "t", "type": "text", "text": "", "x": 0, "y": 0, "flag": False},
+    ])
+    assert _round_trip(floor) == floor
+
+
+def test_empty_and_non_list_elements():
+    """요소가 없거나 elements가 목록이 아니면 그대로"""
+    assert _round_trip(_floor([])) == _floor([])
+    no_elements = {"floor": 2}
+    assert encode_floor(no_elements) is no_elements
+    assert decode_floor(no_elements) is no_elements
+
+
+def test_randomized_round_trip():
+    """무작위 요소 목록 왕복"""
+    rng = random.Random(20261019)
+    keys = ["id", "x", "y", "width", "height", "iconType", "text", "style", "x1"]
+    values = [0, 1, 2.5, -3, "a", "toilet", "exit", None, True, False, {"c": 1}, [1, 2]]
+    for _ in range(300):
+        elements = []
+        for _ in range(rng.randint(0, 30)):
+            element = {}
+            if rng.random() < 0.9:
+                element["type"] = rng.choice(["text", "icon", "rect", None])
+            for key in rng.sample(keys, rng.randint(0, len(keys))):
+                element[key] = rng.choice(values)
+            elements.append(element)
+        assert _round_trip(_floor(elements)) == _floor(elements)
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        decode_elements({"encoding": "rows-v0", "count": 0, "groups": []})
+
+
+@pytest.mark.parametrize("format, accept, expected", [
+    ("compact", None, True),
+    (None, "application/vnd.viewo.compact+json", True),
+    (None, "application/json", False),
+    ("json", "application/vnd.viewo.compact+json", False),
+    (None, None, False),
+])
+def test_wants_compact(format, accept, expected):
+    assert wants_compact(format, accept) is expected
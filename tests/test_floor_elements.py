@@ -0,0 +1,82 @@
+"""요소 단위 층 편집(modify_floor_elements)과 저장소 층 저장 테스트"""
+import pytest
+
+from app.services import building_service
+from app.services.content_store import FileContentStore, SqliteContentStore
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path, monkeypatch):
+    """임시 저장소와 manifest로 교체한 building_service"""
+    if request.param == "file":
+        content = FileContentStore(
+            tmp_path / "buildings", {"dashboard": tmp_path / "d.json", "pr": tmp_path / "p.json"},
+            tmp_path / "buildings" / "manifest.json"
+        )
+    else:
+        content = SqliteContentStore(tmp_path / "viewo.db")
+    monkeypatch.setattr(building_service, "content_store", content)
+    monkeypatch.setattr(building_service, "BUILDINGS_DATA_DIR", tmp_path / "buildings")
+    monkeypatch.setattr(building_service, "_manifest_cache", {"version": None, "data": None})
+    monkeypatch.setattr(building_service, "_revision_cache", {})
+    building_service.save_building_json("b1", {"id": "b1", "name": "본관"})
+    building_service.save_building_floors_json("b1", [
+        {"floor": 1, "floorName": "1층", "revision": 1, "elements": [{"id": "a", "x1": 0, "y1": 0, "x2": 10, "y2": 10}]},
+        {"floor": 2, "floorName": "2층", "revision": 4, "elements": [{"id": "b", "x1": "5", "y1": 0}]},
+    ])
+    return content
+
+
+def test_save_floor_replaces_only_that_floor(store):
+    store.save_floor("b1", {"floor": 2, "floorName": "2층", "revision": 5, "elements": []})
+    floors = store.load_floors("b1")
+    assert [f["floor"] for f in floors] == [1, 2]
+    assert floors[0]["elements"][0]["id"] == "a"
+    assert store.load_floor("b1", 2)["revision"] == 5
+
+    store.save_floor("b1", {"floor": 3, "floorName": "3층", "revision": 1})
+    assert [f["floor"] for f in store.load_floors("b1")] == [1, 2, 3]
+
+
+def test_element_edit_saves_single_floor_and_skips_manifest_file(store, monkeypatch):
+    """요소 편집은 층 1개만 저장하고, JSON 파일 저장소는 층 요약의 revision만 바뀌면 manifest 파일을 다시 쓰지 않음"""
+    if isinstance(store, SqliteContentStore):
+        # SQLite는 해당 층 행만 갱신 (JSON 파일 저장소는 파일 하나에 모든 층이 있어 파일 전체를 씀)
+        monkeypatch.setattr(store, "save_floors", lambda *args: pytest.fail("층 목록 전체를 다시 저장함"))
+    else:
+        before = store.manifest_file.read_bytes()
+
+    floor, base_revision, patch = building_service.move_floor_elements("b1", 1, ["a"], 5, 0)
+    assert (base_revision, floor["revision"]) == (1, 2)
+    assert store.load_floor("b1", 1)["elements"][0]["x1"] == 5
+    assert store.load_floor("b1", 2)["revision"] == 4
+    assert building_service.get_floor_revisions("b1") == {1: 2, 2: 4}
+    if isinstance(store, SqliteContentStore):
+        # SQLite는 manifest 행도 같은 트랜잭션에서 갱신
+        assert store.load_manifest()["buildings"]["b1"]["floors"][0]["revision"] == 2
+    else:
+        assert store.manifest_file.read_bytes() == before
+    summary = building_service.get_buildings_manifest()[0]["floors"][0]
+    assert (summary["revision"], summary["elementCount"]) == (2, 1)
+
+
+def test_move_rejects_non_numeric_coordinates(store):
+    with pytest.raises(ValueError):
+        building_service.move_floor_elements("b1", 2, ["b"], 1, 0)
+    assert store.load_floor("b1", 2)["revision"] == 4
+
+
+def test_sqlite_manifest_write_failure_rolls_back_content(store, monkeypatch):
+    """SQLite는 manifest 저장이 실패하면 내용 저장도 취소"""
+    if not isinstance(store, SqliteContentStore):
+        pytest.skip("JSON 파일 저장소는 트랜잭션이 없음")
+
+    def fail(*args):
+        raise RuntimeError("manifest 저장 실패")
+
+    monkeypatch.setattr(store, "save_manifest", fail)
+    with pytest.raises(RuntimeError):
+        building_service.save_building_json("b1", {"id": "b1", "name": "신관", "revision": 1})
+    assert store.load_building("b1")["name"] == "본관"
+    assert store.load_manifest()["buildings"]["b1"]["building"]["name"] == "본관"
+    assert building_service.get_buildings_manifest()[0]["name"] == "본관"
@@ -0,0 +1,30 @@
+"""전체 층 정보 집계(floor_info_service) 테스트"""
+import json
+
+from app.services import building_service, floor_info_service
+
+
+def test_floor_revision_change_rebuilds_view_with_same_version_token(monkeypatch):
+    """저장소 변경 토큰이 같아도 층 revision이 바뀌면 다시 읽음"""
+    manifest = {"buildings": {"b1": {"building": {"id": "b1"}, "floorsVersion": 100, "floors": []}}}
+    floors = [{"floor": 1, "revision": 1}]
+    monkeypatch.setattr(building_service, "_load_manifest", lambda: manifest)
+    monkeypatch.setattr(floor_info_service, "get_building_floors", lambda building_id, **kwargs: [dict(f) for f in floors])
+    monkeypatch.setattr(floor_info_service, "_buildings", {})
+    monkeypatch.setattr(floor_info_service, "_views", {
+        False: {"key": None, "body": None, "etag": None},
+        True: {"key": None, "body": None, "etag": None},
+    })
+
+    def update(revision):
+        floors[0]["revision"] = revision
+        manifest["buildings"]["b1"]["floors"] = [building_service._floor_summary(f) for f in floors]
+
+    update(1)
+    body, etag = floor_info_service.get_floor_info_view()
+    assert json.loads(body)["data"][0]["revision"] == 1
+
+    update(2)
+    body, new_etag = floor_info_service.get_floor_info_view()
+    assert json.loads(body)["data"][0]["revision"] == 2
+    assert new_etag != etag
@@ -0,0 +1,50 @@
+"""아이콘 레지스트리 참조(icon_service) 테스트"""
+from app.services.icon_service import (
+    compute_icon_overrides, dedupe_floor_icons, resolve_icon_types, with_icon_types
+)
+
+REGISTRY = {
+    "version": "v1",
+    "iconTypes": {
+        "toiletMan": {"icon": "/content/facilities/icons/toilet_man.svg", "label": "남자화장실"},
+        "printer": {"icon": "/content/facilities/icons/printer.svg", "label": "복사기"},
+        "exit": {"icon": "/content/facilities/icons/exit.svg", "label": "비상구"},
+    },
+    "currentLocation": "/content/facilities/icons/current_location.svg",
+}
+
+
+def test_new_floor_with_partial_icon_types_keeps_registry_icons():
+    """새 층이 일부 아이콘만 보내도 나머지 레지스트리 아이콘을 숨기지 않음"""
+    floor = {"floor": 1, "iconTypes": {"printer": REGISTRY["iconTypes"]["printer"]}}
+    assert dedupe_floor_icons(floor, REGISTRY) is True
+    assert floor["iconOverrides"] == {}
+    assert resolve_icon_types(floor, REGISTRY) == REGISTRY["iconTypes"]
+
+
+def test_removed_icon_type_becomes_null_override():
+    """이전에 보이던 아이콘을 목록에서 빼면 삭제로 저장"""
+    previous = {"floor": 1, "iconOverrides": {}, "iconRegistryVersion": "v1"}
+    sent = with_icon_types(previous, REGISTRY)
+    del sent["iconTypes"]["exit"]
+    sent["iconTypes"]["custom"] = {"icon": "/content/facilities/icons/custom.svg", "label": "안내"}
+    dedupe_floor_icons(sent, REGISTRY, previous)
+    assert sent["iconOverrides"] == {
+        "exit": None,
+        "custom": {"icon": "/content/facilities/icons/custom.svg", "label": "안내"},
+    }
+    assert "exit" not in resolve_icon_types(sent, REGISTRY)
+    assert "custom" in resolve_icon_types(sent, REGISTRY)
+
+
+def test_registry_version_change_is_not_a_migration():
+    """레지스트리 버전만 바뀐 층은 변경으로 보지 않음"""
+    floor = {"floor": 1, "iconOverrides": {}, "iconRegistryVersion": "old"}
+    assert dedupe_floor_icons(floor, REGISTRY) is False
+    assert floor["iconRegistryVersion"] == "old"
+    assert with_icon_types(floor, REGISTRY)["iconRegistryVersion"] == "v1"
+
+
+def test_compute_icon_overrides_changed_label():
+    changed = {"toiletMan": {"icon": "/content/facilities/icons/toilet_man.svg", "label": "화장실(남)"}}
+    assert compute_icon_overrides(changed, REGISTRY["iconTypes"]) == changed
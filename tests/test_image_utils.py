@@ -0,0 +1,33 @@
+"""업로드 이미지 정규화(normalize_image) 테스트"""
+import pytest
+
+from app.utils.image_utils import normalize_image
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _jpeg_with_exif(path, quality, orientation=1):
+    img = Image.effect_noise((64, 48), 60).convert("RGB")
+    exif = Image.Exif()
+    exif[0x010F] = "camera"
+    exif[0x0112] = orientation
+    img.save(path, "JPEG", quality=quality, exif=exif.tobytes())
+
+
+def test_metadata_only_keeps_original_when_reencode_is_larger(tmp_path):
+    """메타데이터 제거만 필요한데 재인코딩 결과가 더 크면 원본 유지"""
+    path = tmp_path / "small.jpg"
+    _jpeg_with_exif(path, quality=10)
+    before = path.read_bytes()
+    result = normalize_image(path, quality=95)
+    assert path.read_bytes() == before
+    assert (result["bytesSaved"], result["normalized"]) == (0, False)
+
+
+def test_rotation_is_always_applied(tmp_path):
+    path = tmp_path / "rotated.jpg"
+    _jpeg_with_exif(path, quality=10, orientation=6)
+    result = normalize_image(path, quality=95)
+    assert result["normalized"] and result["bytesSaved"] >= 0
+    with Image.open(path) as img:
+        assert img.size == (48, 64)
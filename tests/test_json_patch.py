@@ -0,0 +1,34 @@
+"""JSON Patch(json_patch) 테스트"""
+import json
+
+import pytest
+
+from app.utils.json_patch import apply_patch, make_patch
+
+
+@pytest.mark.parametrize("old, new", [
+    (True, 1),
+    (1, 1.0),
+    (0, False),
+    ({"visible": True}, {"visible": 1}),
+    ({"x": 1}, {"x": 1.0}),
+    ([0, 1, 2], [False, 1, 2]),
+    ([1, 2, 0], [1, 2, False]),
+    ([{"a": [1]}], [{"a": [1.0]}]),
+])
+def test_type_changes_produce_patch(old, new):
+    """값은 같아도 JSON 타입이 바뀌면 패치 생성"""
+    patch = make_patch(old, new)
+    assert patch
+    assert json.dumps(apply_patch(old, patch)) == json.dumps(new)
+
+
+def test_equal_documents_produce_empty_patch():
+    doc = {"elements": [{"id": "a", "x": 1.5, "visible": True}], "revision": 3}
+    assert make_patch(doc, json.loads(json.dumps(doc))) == []
+
+
+def test_round_trip_element_edit():
+    old = {"elements": [{"id": "a", "x": 1}, {"id": "b", "x": 2}, {"id": "c", "x": 3}]}
+    new = {"elements": [{"id": "a", "x": 1}, {"id": "c", "x": 3.5}], "revision": 2}
+    assert apply_patch(old, make_patch(old, new)) == new
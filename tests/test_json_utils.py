@@ -0,0 +1,25 @@
+"""fields 파라미터(parse_fields, project_fields) 테스트"""
+import pytest
+
+from app.utils.json_utils import parse_fields, project_fields
+
+
+@pytest.mark.parametrize("fields, expected", [
+    (None, None),
+    ("", None),
+    ("floor,floorName", {"floor": {}, "floorName": {}}),
+    ("floor,floors.floorName", {"floor": {}, "floors": {"floorName": {}}}),
+    # 하위 필드 없이 요청한 필드가 같은 필드의 하위 경로보다 우선 (순서 무관)
+    ("floors,floors.floorName", {"floors": {}}),
+    ("floors.floorName,floors", {"floors": {}}),
+    ("a.b.c,a.b,a.d", {"a": {"b": {}, "d": {}}}),
+    ("a..b, c ,", {"a": {}, "c": {}}),
+])
+def test_parse_fields(fields, expected):
+    assert parse_fields(fields) == expected
+
+
+def test_plain_field_keeps_whole_subtree():
+    building = {"id": "b1", "floors": [{"floor": 1, "floorName": "1층", "elements": [{"id": "e"}]}]}
+    assert project_fields(building, parse_fields("floors,floors.floorName")) == {"floors": building["floors"]}
+    assert project_fields(building, parse_fields("floors.floorName")) == {"floors": [{"floorName": "1층"}]}
@@ -0,0 +1,52 @@
+"""미디어 설정 캐시(media_service) 테스트"""
+import pytest
+
+from app.services import media_service
+from app.services.content_store import FileContentStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """임시 저장소로 교체하고 이미지 3개를 저장한 media_service"""
+    content = FileContentStore(tmp_path / "buildings", {"dashboard": tmp_path / "d.json", "pr": tmp_path / "p.json"})
+    monkeypatch.setattr(media_service, "content_store", content)
+    monkeypatch.setattr(media_service, "_media_cache", {})
+    media_service.save_media_config("dashboard", {
+        "images": [{"id": image_id, "filename": f"{image_id}.png", "order": image_id} for image_id in (1, 2, 3)],
+        "nextId": 4,
+    })
+    return content
+
+
+def test_failed_save_keeps_cached_config(store, monkeypatch):
+    """저장에 실패하면 수정한 사본이 캐시에 반영되지 않음"""
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "save_media", fail)
+    config = media_service.edit_media_config("dashboard")
+    config["images"].append({"id": media_service.allocate_media_id(config), "filename": "4.png", "order": 4})
+    config["images"][0]["order"] = 9
+    with pytest.raises(OSError):
+        media_service.save_media_config("dashboard", config)
+
+    cached = media_service.load_media_config("dashboard")
+    assert [img["id"] for img in cached["images"]] == [1, 2, 3]
+    assert (cached["nextId"], cached["revision"]) == (4, 1)
+    assert media_service.get_media_item("dashboard", 1)["order"] == 1
+    assert media_service.get_media_item("dashboard", 4) is None
+
+
+def test_remove_by_position(store):
+    assert media_service.remove_media_item("dashboard", 2)
+    assert not media_service.remove_media_item("dashboard", 2)
+    assert [img["id"] for img in media_service.load_media_config("dashboard")["images"]] == [1, 3]
+    assert media_service.get_media_item("dashboard", 3)["filename"] == "3.png"
+
+
+def test_find_position_after_list_changed(store):
+    """사본의 목록이 바뀌어 캐시 인덱스와 위치가 다르면 목록에서 탐색"""
+    config = media_service.edit_media_config("dashboard")
+    del config["images"][0]
+    assert media_service.find_media_position("dashboard", config, 3) == 1
+    assert media_service.find_media_position("dashboard", config, 1) is None
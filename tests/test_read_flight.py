@@ -0,0 +1,36 @@
+"""동시 조회 합치기(read_flight)와 저장 세대 테스트"""
+import asyncio
+import threading
+
+from app.services import building_service
+
+
+def test_read_after_save_does_not_join_older_flight(monkeypatch):
+    """저장 전에 시작된 조회가 진행 중이어도 저장 후 조회는 새로 읽음"""
+    store = {"revision": 1}
+    started = threading.Event()
+    release = threading.Event()
+
+    def load_building_floor(building_id, floor_number, fields=None, resolve_icons=False):
+        snapshot = dict(store)
+        if snapshot["revision"] == 1:
+            started.set()
+            release.wait(5)
+        return snapshot
+
+    monkeypatch.setattr(building_service, "load_building_floor", load_building_floor)
+
+    async def scenario():
+        before = asyncio.ensure_future(building_service.fetch_building_floor("gen-test", 1))
+        await asyncio.to_thread(started.wait, 5)
+        # 저장 완료 (저장 경로가 세대를 올림)
+        store["revision"] = 2
+        building_service._bump_generation("gen-test")
+        after = asyncio.ensure_future(building_service.fetch_building_floor("gen-test", 1))
+        await asyncio.sleep(0)
+        release.set()
+        return await before, await after
+
+    old, new = asyncio.run(scenario())
+    assert old["revision"] == 1
+    assert new["revision"] == 2
@@ -0,0 +1,50 @@
+"""격자 공간 인덱스(spatial_index) 테스트"""
+import random
+import time
+
+import pytest
+
+from app.utils.spatial_index import GridIndex, _distance
+
+
+def _items(rng, count, spread=1000.0, size=30.0):
+    items = []
+    for key in range(count):
+        x, y = rng.uniform(0, spread), rng.uniform(0, spread)
+        items.append((key, (x, y, x + rng.uniform(0, size), y + rng.uniform(0, size))))
+    return items
+
+
+def _brute_force(items, x, y, limit, max_distance=None):
+    results = sorted((_distance(x, y, bounds), key) for key, bounds in items)
+    if max_distance is not None:
+        results = [item for item in results if item[0] <= max_distance]
+    return results[:limit]
+
+
+@pytest.mark.parametrize("x, y", [(5e4, 5e4), (-1e12, 1e12), (1e300, -1e300), (500.0, -1e9)])
+def test_nearest_far_away_point(x, y):
+    """인덱스 범위에서 아주 먼 점도 빠르게 정확한 결과 반환"""
+    items = _items(random.Random(44), 400)
+    index = GridIndex(items)
+    start = time.perf_counter()
+    result = index.nearest(x, y, limit=3)
+    assert time.perf_counter() - start < 0.5
+    assert [d for d, _ in result] == [d for d, _ in _brute_force(items, x, y, 3)]
+
+
+def test_nearest_matches_brute_force():
+    """무작위 점, limit, max_distance에 대해 전체 비교 결과와 같은 거리"""
+    rng = random.Random(20261019)
+    for _ in range(500):
+        items = _items(rng, rng.randint(0, 60), spread=200.0, size=20.0)
+        index = GridIndex(items, rng.choice([0, 5, 50]))
+        x, y = rng.uniform(-600, 600), rng.uniform(-600, 600)
+        limit = rng.randint(1, 5)
+        max_distance = rng.choice([None, 10.0, 150.0])
+        expected = _brute_force(items, x, y, limit, max_distance)
+        assert [d for d, _ in index.nearest(x, y, limit, max_distance)] == [d for d, _ in expected]
+
+
+def test_nearest_empty_index():
+    assert GridIndex([]).nearest(0, 0) == []
@@ -0,0 +1,38 @@
+"""SVG 최적화(svg_utils) 테스트"""
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from app.utils.svg_utils import optimize_svg, round_path_data, SVG_NS
+
+
+@pytest.mark.parametrize("d, expected", [
+    # 붙여 쓴 호 플래그 뒤 소수 좌표: 플래그 0, 1과 끝점 10.5 유지
+    ("M0 0a1.25 1.25 0 0110.5 10", "M0 0a1.25 1.25 0 0 1 10.5 10"),
+    ("M0 0A1 1 0 1 0 1.2345 2", "M0 0A1 1 0 1 0 1.23 2"),
+    # 여러 개의 호 인자가 이어지는 경우
+    ("M0 0a1 1 0 00.5.5 1 1 0 111 1", "M0 0a1 1 0 0 0 .5 .5 1 1 0 1 1 1 1"),
+    ("M10.123,20.456L-3.333-4.5h.5", "M10.12 20.46L-3.33-4.5h.5"),
+    ("M1.0001.5 2 3z", "M1 .5 2 3z"),
+])
+def test_round_path_data(d, expected):
+    assert round_path_data(d, 2) == expected
+
+
+@pytest.mark.parametrize("d", ["M0 0a1 1 0 2 0 5 5", "M0 0z 5", "bogus"])
+def test_round_path_data_leaves_unparsable_values(d):
+    """해석할 수 없는 경로는 원문 유지"""
+    assert round_path_data(d, 2) == d
+
+
+def test_optimize_svg_keeps_transform_precision():
+    """transform의 작은 배율 값은 반올림하지 않음"""
+    data = (
+        b'<svg xmlns="http://www.w3.org/2000/svg">'
+        b'<g transform="matrix(0.0254,0,0,0.0254,0,0)" id="g"><path d="M0.001 0a1 1 0 0110.5 10"/></g>'
+        b'</svg>'
+    )
+    root = ET.fromstring(optimize_svg(data))
+    group = root.find(f"{{{SVG_NS}}}g")
+    assert group.get("transform") == "matrix(0.0254,0,0,0.0254,0,0)"
+    assert group.find(f"{{{SVG_NS}}}path").get("d") == "M0 0a1 1 0 0 1 10.5 10"
@@ -0,0 +1,28 @@
+"""영상 처리 헬퍼(video_utils) 테스트"""
+import pytest
+
+from app.utils.video_utils import get_video_duration, is_video_file
+
+
+def _box(box_type, payload=b""):
+    return (8 + len(payload)).to_bytes(4, "big") + box_type + payload
+
+
+def _mvhd(timescale, duration):
+    return _box(b"mvhd", b"\x00\x00\x00\x00" + b"\x00" * 8 + timescale.to_bytes(4, "big") + duration.to_bytes(4, "big"))
+
+
+@pytest.mark.parametrize("suffix", [".mp4", ".m4v", ".mov"])
+def test_duration_after_track_boxes(tmp_path, suffix):
+    """moov 안에서 trak 뒤에 있는 mvhd도 찾음"""
+    trak = _box(b"trak", _box(b"tkhd", b"\x00" * 84) + _box(b"mdia", _box(b"mdhd", b"\x00" * 24)))
+    path = tmp_path / f"clip{suffix}"
+    path.write_bytes(_box(b"ftyp", b"isom\x00\x00\x02\x00") + _box(b"moov", trak + _mvhd(1000, 12345)))
+    assert is_video_file(path)
+    assert get_video_duration(path) == 12.345
+
+
+def test_duration_missing(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(_box(b"ftyp", b"isom") + _box(b"moov", _box(b"trak")) + _box(b"mdat", b"\x00" * 16))
+    assert get_video_duration(path) is None
@@ -0,0 +1,55 @@
+"""길찾기 이동 그래프(NavGraph) 테스트"""
+import pytest
+
+from app.services.wayfinding_service import NavGraph, _start_point
+
+
+def _graph(edges):
+    nodes = [
+        {"id": "a", "x": 0, "y": 0},
+        {"id": "b", "x": 100, "y": 0},
+        {"id": "c", "x": 50, "y": 50},
+        {"id": "d", "x": 200, "y": 0},
+    ]
+    return NavGraph([{"floor": 1, "navigation": {"nodes": nodes, "edges": edges}}])
+
+
+def test_zero_weight_edge_is_used():
+    """weight 0은 거리로 바뀌지 않고, 0 비용 간선으로 도는 경로를 찾음"""
+    graph = _graph([
+        {"from": "a", "to": "b"},
+        {"from": "b", "to": "d"},
+        {"from": "a", "to": "c", "weight": 0},
+        {"from": "c", "to": "d", "weight": 0},
+    ])
+    assert ((1, "c"), 0.0, "walk") in graph.adjacency[(1, "a")]
+    total, path, _ = graph.shortest_path([((1, "a"), 0.0)], {(1, "d"): 0.0}, 1, (200, 0))
+    assert total == 0.0
+    assert path == [(1, "a"), (1, "c"), (1, "d")]
+
+
+def test_missing_weight_uses_distance():
+    graph = _graph([{"from": "a", "to": "b", "weight": None}])
+    assert graph.adjacency[(1, "a")] == [((1, "b"), 100.0, "walk")]
+
+
+@pytest.mark.parametrize("weight, expected", [(-30, 0.0), ("12.5", 12.5), ("abc", None), (True, None), (float("nan"), None)])
+def test_invalid_weight_is_clamped_or_skipped(weight, expected):
+    """음수 weight는 0, 숫자가 아닌 weight의 간선은 건너뜀"""
+    graph = _graph([{"from": "a", "to": "b", "weight": weight}, {"from": "b", "to": "d"}])
+    walk = [cost for key, cost, _ in graph.adjacency[(1, "a")] if key == (1, "b")]
+    assert walk == ([] if expected is None else [expected])
+    assert graph.adjacency[(1, "b")][-1] == ((1, "d"), 100.0, "walk")
+
+
+def test_far_away_start_point():
+    """범위 밖의 아주 먼 출발 좌표도 가까운 노드를 찾음"""
+    graph = _graph([])
+    nearest = graph.nearest_nodes(1, (1e15, 0), 2)
+    assert [key for key, _ in nearest] == [(1, "d"), (1, "b")]
+
+
+@pytest.mark.parametrize("x, y", [(float("inf"), 0.0), (0.0, float("nan"))])
+def test_non_finite_start_point_is_rejected(x, y):
+    with pytest.raises(ValueError):
+        _start_point(_graph([]), 1, x, y)